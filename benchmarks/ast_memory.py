@@ -0,0 +1,127 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Speicher-Benchmark für den GerLang-AST
+
+Parst ein großes synthetisches Programm und misst die Bytes pro AST-Knoten:
+einmal mit den __slots__-Knoten aus parser.py (internierte Namen, geteilte
+Literale) und einmal als Kopie in der bisherigen Darstellung (Knoten mit
+__dict__, eigene Literal-Knoten, eigene Namens-Strings).
+
+    python benchmarks/ast_memory.py [--funktionen 2000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lexer import Lexer
+from parser import Parser, ASTNode, TemplatePlan
+
+
+def synthetic_program(functions: int) -> str:
+    """Erzeugt ein Programm mit vielen Funktionen, Schleifen und Ausdrücken"""
+    lines = []
+    for i in range(functions):
+        lines.append(f"GANZ funktion_{i}(wert: GANZ, faktor: GANZ) {{")
+        lines.append(f"    GANZ summe = {i % 7};")
+        lines.append(f"    KISTE tabelle = [1, 2, 3, {i}, JA, NEIN, \"eintrag_{i}\"];")
+        lines.append("    FÜR (GANZ i = 0; i < wert; i = i + 1) {")
+        lines.append("        WENN (i % 2 == 0 UND faktor > 1) {")
+        lines.append(f"            summe = summe + i * faktor - tabelle[i % 4] / 2;")
+        lines.append("        } SONST {")
+        lines.append(f"            DRUCKE(\"Schritt ${{i}} von ${{wert}} in funktion_{i}\");")
+        lines.append("        }")
+        lines.append("    }")
+        lines.append(f"    ZURÜCK summe + funktion_{max(i - 1, 0)}(wert - 1, faktor);")
+        lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def count_nodes(node) -> int:
+    """Zählt alle Knotenvorkommen im Baum (geteilte Knoten mehrfach)"""
+    count = 0
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, ASTNode):
+            count += 1
+            stack.extend(getattr(item, field, None) for field in _fields(type(item)))
+    return count
+
+
+def _fields(cls) -> tuple:
+    """Alle Slot-Namen einer Knotenklasse inklusive der Basisklassen"""
+    return tuple(name for base in reversed(cls.__mro__) for name in getattr(base, "__slots__", ()))
+
+
+_LEGACY_CLASSES = {}
+
+
+def legacy_copy(node):
+    """Kopiert einen Baum in Knoten mit __dict__, ohne geteilte Literale und
+    ohne internierte Namen, so wie der Parser ihn bisher erzeugt hat"""
+    if isinstance(node, list):
+        return [legacy_copy(item) for item in node]
+    if isinstance(node, tuple):
+        return tuple(legacy_copy(item) for item in node)
+    if isinstance(node, str):
+        # Jeder Token-Wert war bisher ein eigener String
+        return node[:1] + node[1:]
+    if not isinstance(node, ASTNode):
+        return node
+    cls = type(node)
+    legacy_cls = _LEGACY_CLASSES.get(cls)
+    if legacy_cls is None:
+        legacy_cls = _LEGACY_CLASSES[cls] = type(cls.__name__, (), {})
+    copy = legacy_cls()
+    for field in _fields(cls):
+        value = getattr(node, field, _MISSING)
+        if value is not _MISSING and not isinstance(value, TemplatePlan):
+            setattr(copy, field, legacy_copy(value))
+    return copy
+
+
+_MISSING = object()
+
+
+def measure(build):
+    """Speicher, den das Ergebnis von build() nach einer Garbage Collection belegt"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Speicherbedarf des GerLang-AST")
+    arg_parser.add_argument("--funktionen", type=int, default=2000, help="Anzahl generierter Funktionen")
+    args = arg_parser.parse_args()
+
+    source = synthetic_program(args.funktionen)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+
+    program, slots_size = measure(lambda: Parser(Lexer(source).tokenize()).parse())
+    legacy, legacy_size = measure(lambda: legacy_copy(program))
+    nodes = count_nodes(program)
+
+    print(f"Quelltext: {len(source) / 1024:.0f} KiB, {nodes:,} AST-Knoten")
+    print(f"  bisher  (__dict__):  {legacy_size / 2**20:7.1f} MiB  {legacy_size / nodes:6.1f} Bytes/Knoten")
+    print(f"  jetzt   (__slots__): {slots_size / 2**20:7.1f} MiB  {slots_size / nodes:6.1f} Bytes/Knoten")
+    print(f"  Ersparnis: {1 - slots_size / legacy_size:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Startzeit-Benchmark für den AST-Cache (.gerlc)
+
+Startet `gerlang.py run` mehrfach als eigenen Prozess für ein großes
+synthetisches Programm: ohne Cache (Lexer + Parser bei jedem Start), beim
+ersten Start mit leerem Cache (Parsen + Schreiben) und mit warmem Cache.
+
+    python benchmarks/cache_startup.py [--funktionen 2000] [--wiederholungen 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from ast_memory import synthetic_program
+
+GERLANG = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'gerlang.py')
+
+
+def run(file_path: str, *options: str) -> float:
+    """Laufzeit eines gerlang-Prozesses in Sekunden"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, GERLANG, 'run', *options, file_path],
+                   check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Kalter vs. warmer Start mit .gerlc-Cache")
+    arg_parser.add_argument("--funktionen", type=int, default=2000, help="Anzahl generierter Funktionen")
+    arg_parser.add_argument("--wiederholungen", type=int, default=5, help="Messungen pro Variante")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "gross.gerl")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(synthetic_program(args.funktionen))
+            f.write("GANZ haupt() {\n    ZURÜCK 0;\n}\n")
+        cache_dir = os.path.join(directory, "cache")
+
+        cold = [run(file_path, "--no-cache") for _ in range(args.wiederholungen)]
+        first = []
+        for i in range(args.wiederholungen):
+            first.append(run(file_path, "--cache-dir", os.path.join(cache_dir, str(i))))
+        warm = [run(file_path, "--cache-dir", os.path.join(cache_dir, "0")) for _ in range(args.wiederholungen)]
+
+        size = os.path.getsize(file_path)
+        print(f"Quelltext: {size / 1024:.0f} KiB, Median aus {args.wiederholungen} Starts")
+        print(f"  ohne Cache (--no-cache): {statistics.median(cold):6.3f} s")
+        print(f"  erster Start (schreibt): {statistics.median(first):6.3f} s")
+        print(f"  warmer Cache:            {statistics.median(warm):6.3f} s")
+
+
+if __name__ == "__main__":
+    main()
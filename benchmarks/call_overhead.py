@@ -0,0 +1,85 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Micro-Benchmark für die Kosten eines Funktionsaufrufs
+
+Misst dieselbe Schleife einmal ohne Aufruf, einmal mit einer leeren
+benutzerdefinierten Funktion und einmal mit einem Built-in und zieht die
+Schleife ab. Ausgegeben wird die Zeit pro Aufruf in Mikrosekunden.
+
+    python benchmarks/call_overhead.py [--engines tree closure vm] [--aufrufe 50000] [--wiederholungen 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS, '..', 'src'))
+
+from lexer import Lexer
+from parser import Parser
+from interpreter import Interpreter
+
+PROGRAM = """
+GANZ eins(x: GANZ) {{
+    ZURÜCK x;
+}}
+GANZ haupt() {{
+    GANZ summe = 0;
+    FÜR (GANZ i = 0; i < {aufrufe}; i = i + 1) {{
+        summe = summe + {ausdruck};
+    }}
+    ZURÜCK 0;
+}}
+"""
+
+# Aufrufart -> Ausdruck im Schleifenrumpf
+VARIANTS = (
+    ("Funktion", "eins(i)"),
+    ("Built-in", "ABS(i)"),
+)
+
+
+def run_once(program, engine: str) -> float:
+    """Laufzeit eines interpret() in Sekunden"""
+    interpreter = Interpreter(engine=engine)
+    start = time.perf_counter()
+    interpreter.interpret(program)
+    return time.perf_counter() - start
+
+
+def call_cost(engine: str, expression: str, calls: int, repetitions: int) -> float:
+    """Mikrosekunden pro Aufruf: Schleife mit Aufruf minus Schleife ohne.
+
+    Beide Varianten laufen abwechselnd, damit Schwankungen der Maschine
+    beide gleich treffen; gewertet wird jeweils der schnellste Lauf.
+    """
+    programs = [Parser(Lexer(PROGRAM.format(aufrufe=calls, ausdruck=body)).tokenize()).parse()
+                for body in ("i", expression)]
+    best = [float("inf"), float("inf")]
+    for _ in range(repetitions):
+        for index, program in enumerate(programs):
+            best[index] = min(best[index], run_once(program, engine))
+    return (best[1] - best[0]) / calls * 1e6
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Kosten eines Funktionsaufrufs pro Engine")
+    arg_parser.add_argument("--engines", nargs="+", default=["tree", "closure", "vm"], help="Zu messende Engines")
+    arg_parser.add_argument("--aufrufe", type=int, default=50000, help="Aufrufe pro Messung")
+    arg_parser.add_argument("--wiederholungen", type=int, default=5, help="Läufe pro Messung, gewertet wird der schnellste")
+    args = arg_parser.parse_args()
+
+    print(f"{'µs pro Aufruf':<16}" + "".join(f"{engine:>12}" for engine in args.engines))
+    for label, expression in VARIANTS:
+        cells = [f"{call_cost(engine, expression, args.aufrufe, args.wiederholungen):>12.2f}" for engine in args.engines]
+        print(f"{label:<16}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Benchmark für tiefe (nicht endrekursive) Rekursion
+
+Ruft tiefe(n) = 1 + tiefe(n - 1) für wachsende Tiefen so oft auf, dass pro
+Tiefe gleich viele GerLang-Aufrufe anfallen, und meldet den Durchsatz in
+Aufrufen pro Sekunde. Baum-Interpreter und Closure-Engine schachteln für
+jeden GerLang-Aufruf mehrere Python-Aufrufe und scheitern früh an Pythons
+Rekursionslimit, die VM hält ihre Frames selbst.
+
+    python benchmarks/deep_recursion.py [--engines tree closure vm] [--tiefen 50 500 5000 50000] [--aufrufe 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS, '..', 'src'))
+
+from lexer import Lexer
+from parser import Parser
+from interpreter import Interpreter
+
+PROGRAM = """
+GANZ tiefe(n: GANZ) {{
+    WENN (n == 0) {{
+        ZURÜCK 0;
+    }}
+    ZURÜCK 1 + tiefe(n - 1);
+}}
+GANZ haupt() {{
+    GANZ summe = 0;
+    FÜR (GANZ i = 0; i < {runden}; i = i + 1) {{
+        summe = summe + tiefe({tiefe});
+    }}
+    ZURÜCK summe - {runden} * {tiefe};
+}}
+"""
+
+
+def measure(engine: str, depth: int, calls: int) -> str:
+    """Aufrufe pro Sekunde als Text, oder woran der Lauf gescheitert ist"""
+    rounds = max(1, calls // depth)
+    program = Parser(Lexer(PROGRAM.format(runden=rounds, tiefe=depth)).tokenize()).parse()
+    interpreter = Interpreter(engine=engine)
+    start = time.perf_counter()
+    try:
+        result = interpreter.interpret(program)
+    except RecursionError:
+        return "Rekursionslimit"
+    seconds = time.perf_counter() - start
+    if result != 0:
+        return "falsches Ergebnis"
+    return f"{rounds * (depth + 1) / seconds:,.0f}/s".replace(",", ".")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Durchsatz tiefer Rekursion pro Engine")
+    arg_parser.add_argument("--engines", nargs="+", default=["tree", "closure", "vm"], help="Zu messende Engines")
+    arg_parser.add_argument("--tiefen", nargs="+", type=int, default=[50, 500, 5000, 50000], help="Rekursionstiefen")
+    arg_parser.add_argument("--aufrufe", type=int, default=100000, help="GerLang-Aufrufe pro Messung")
+    args = arg_parser.parse_args()
+
+    print(f"Python-Rekursionslimit: {sys.getrecursionlimit()}")
+    print(f"{'Tiefe':>8}" + "".join(f"{engine:>18}" for engine in args.engines))
+    for depth in args.tiefen:
+        cells = [f"{measure(engine, depth, args.aufrufe):>18}" for engine in args.engines]
+        print(f"{depth:>8}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Konformitäts-Suite für die Ausführungs-Engines
+
+Führt alle Beispiele (examples/, usercode/) und die gemeinsamen Programme
+aus benchmarks/programs/ mit jeder Engine als eigenen Prozess aus und
+vergleicht stdout und Exit-Code mit der Referenz-Engine (tree). Der
+Zufallsgenerator wird fest initialisiert und stdin immer gleich befüllt,
+damit interaktive Beispiele wie zahlenraten reproduzierbar laufen.
+
+    python benchmarks/engine_conformance.py [--engines tree closure vm compiled] [-O] [--zeit] [dateien...]
+
+Mit -O laufen die Vergleichs-Engines mit dem AST-Optimierer, die Referenz
+ohne. So lässt sich auch `--engines tree tree -O` prüfen.
+
+Die Engine "compiled" übersetzt jedes Programm mit `gerlang compile` in
+ein temporäres Verzeichnis und startet das erzeugte Modul mit python;
+gemessen wird nur dessen Laufzeit. Verglichen wird die Programmausgabe
+ohne Banner und Abschlusszeile von gerlang.py.
+
+Sehr tiefe Rekursion ist bewusst nicht Teil der Programme: wo Python das
+Rekursionslimit erreicht, hängt von der Engine ab.
+"""
+
+import argparse
+import difflib
+import glob
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+GERLANG = os.path.join(ROOT, 'gerlang.py')
+ENGINES = ('tree', 'closure', 'vm', 'compiled')
+
+# Startet gerlang.py mit festem Zufalls-Seed (ZUFALL, ZUFALLSBEREICH, ...)
+BOOTSTRAP = (
+    "import random, runpy, sys; random.seed(0); "
+    "sys.argv = sys.argv[1:]; runpy.run_path(sys.argv[0], run_name='__main__')"
+)
+STDIN = "Max\n42\n" + "\n".join(str(i) for i in range(1, 101)) + "\nende\n"
+
+# Rahmen, den gerlang.py um die Programmausgabe druckt
+BANNER = ("GerLang - Die deutsche Programmiersprache\n", "=" * 50 + "\n")
+FINISHED = "\n✅ Ausführung beendet!\n"
+
+
+def collect_programs():
+    """Alle .gerl-Dateien der Suite, relativ zum Repository"""
+    patterns = ('examples/**/*.gerl', 'usercode/*.gerl', 'benchmarks/programs/*.gerl')
+    files = []
+    for pattern in patterns:
+        files.extend(sorted(glob.glob(os.path.join(ROOT, pattern), recursive=True)))
+    return [os.path.relpath(f, ROOT) for f in files]
+
+
+def program_output(stdout: str) -> str:
+    """stdout ohne Banner, "🚀 Führe ... aus" und Abschlusszeile"""
+    lines = stdout.splitlines(True)
+    if tuple(lines[:2]) == BANNER:
+        lines = lines[2:]
+        if lines and lines[0].startswith("🚀 Führe "):
+            lines = lines[1:]
+    output = "".join(lines)
+    return output[:-len(FINISHED)] if output.endswith(FINISHED) else output
+
+
+def run(file_path: str, engine: str, timeout: float, optimize: bool = False):
+    """(Exit-Code, Programmausgabe, Sekunden) eines Laufs; ohne .gerlc-Cache"""
+    env = dict(os.environ, PYTHONIOENCODING='utf-8')
+    options = ['-O'] if optimize else []
+    if engine == 'compiled':
+        return run_compiled(file_path, timeout, options, env)
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(
+            [sys.executable, '-c', BOOTSTRAP, GERLANG, 'run', '--no-cache', f'--engine={engine}', *options, file_path],
+            cwd=ROOT, input=STDIN, capture_output=True, text=True, encoding='utf-8', env=env, timeout=timeout
+        )
+        return result.returncode, program_output(result.stdout), time.perf_counter() - start
+    except subprocess.TimeoutExpired:
+        return 'TIMEOUT', '', time.perf_counter() - start
+
+
+def run_compiled(file_path: str, timeout: float, options: list, env: dict):
+    """Wie run, aber über gerlang compile und das erzeugte Python-Modul"""
+    with tempfile.TemporaryDirectory() as directory:
+        module = os.path.join(directory, 'programm_gerl.py')
+        compiled = subprocess.run(
+            [sys.executable, GERLANG, 'compile', *options, '-o', module, file_path],
+            cwd=ROOT, capture_output=True, text=True, encoding='utf-8', env=env, timeout=timeout
+        )
+        if compiled.returncode:
+            return compiled.returncode, program_output(compiled.stdout), 0.0
+        start = time.perf_counter()
+        try:
+            result = subprocess.run(
+                [sys.executable, '-c', BOOTSTRAP, module],
+                cwd=ROOT, input=STDIN, capture_output=True, text=True, encoding='utf-8', env=env, timeout=timeout
+            )
+            return result.returncode, program_output(result.stdout), time.perf_counter() - start
+        except subprocess.TimeoutExpired:
+            return 'TIMEOUT', '', time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Vergleicht die Ausgabe aller Engines")
+    arg_parser.add_argument("dateien", nargs="*", help="Nur diese .gerl-Dateien prüfen")
+    arg_parser.add_argument("--engines", nargs="+", default=list(ENGINES), help="Zu vergleichende Engines (erste = Referenz)")
+    arg_parser.add_argument("--timeout", type=float, default=60.0, help="Sekunden pro Lauf")
+    arg_parser.add_argument("-O", dest="optimize", action="store_true", help="Vergleichs-Engines mit optimiertem AST (run -O)")
+    arg_parser.add_argument("--zeit", action="store_true", help="Laufzeiten pro Engine ausgeben")
+    args = arg_parser.parse_args()
+
+    reference, *others = args.engines
+    programs = args.dateien or collect_programs()
+    totals = dict.fromkeys(args.engines, 0.0)
+    failures = 0
+
+    for file_path in programs:
+        expected_code, expected_out, seconds = run(file_path, reference, args.timeout)
+        totals[reference] += seconds
+        timings = [f"{reference} {seconds:.2f}s"]
+        problems = []
+        for engine in others:
+            code, out, seconds = run(file_path, engine, args.timeout, args.optimize)
+            totals[engine] += seconds
+            timings.append(f"{engine} {seconds:.2f}s")
+            if (code, out) != (expected_code, expected_out):
+                diff = difflib.unified_diff(expected_out.splitlines(True), out.splitlines(True),
+                                            fromfile=reference, tofile=engine)
+                problems.append(f"  Exit-Code {expected_code} / {code}\n" + "".join(list(diff)[:40]))
+        failures += bool(problems)
+        status = "FEHLER" if problems else "OK    "
+        suffix = f"  ({', '.join(timings)})" if args.zeit else ""
+        print(f"{status} {file_path}{suffix}")
+        for problem in problems:
+            print(problem)
+
+    if args.zeit:
+        print("Gesamt: " + ", ".join(f"{engine} {seconds:.2f}s" for engine, seconds in totals.items()))
+    print(f"{len(programs)} Programme, {failures} Abweichungen")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
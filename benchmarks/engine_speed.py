@@ -0,0 +1,76 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Laufzeit-Benchmark der Ausführungs-Engines
+
+Parst jedes Programm einmal und misst nur Interpreter.interpret() (ohne
+Prozessstart, Lexer und Parser), bestes Ergebnis aus mehreren Läufen.
+Ausgaben der Programme werden verworfen.
+
+    python benchmarks/engine_speed.py [--engines tree closure vm] [--wiederholungen 3] [-O] [dateien...]
+
+Standard sind die gemeinsamen Benchmark-Programme fib_rekursiv.gerl und
+schleifen.gerl aus benchmarks/programs/.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS, '..', 'src'))
+
+from lexer import Lexer
+from parser import Parser
+from interpreter import Interpreter
+from optimizer import Optimizer
+
+DEFAULT_PROGRAMS = ('fib_rekursiv.gerl', 'schleifen.gerl')
+
+
+def measure(program, engine: str, repetitions: int) -> float:
+    """Beste Laufzeit von interpret() in Sekunden"""
+    best = float("inf")
+    for _ in range(repetitions):
+        interpreter = Interpreter(engine=engine)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            interpreter.interpret(program)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Vergleicht die Laufzeit der Engines")
+    arg_parser.add_argument("dateien", nargs="*", help="Zu messende .gerl-Dateien")
+    arg_parser.add_argument("--engines", nargs="+", default=["tree", "closure", "vm"], help="Engines (erste = Referenz)")
+    arg_parser.add_argument("--wiederholungen", type=int, default=3, help="Läufe pro Engine, gewertet wird der schnellste")
+    arg_parser.add_argument("-O", dest="optimize", action="store_true", help="Programme vorher optimieren (wie run -O)")
+    args = arg_parser.parse_args()
+
+    files = args.dateien or [os.path.join(BENCHMARKS, 'programs', name) for name in DEFAULT_PROGRAMS]
+    reference = args.engines[0]
+    print(f"{'Programm':<24}" + "".join(f"{engine:>16}" for engine in args.engines))
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            program = Parser(Lexer.stream(f), file_path=file_path).parse()
+        if args.optimize:
+            program = Optimizer().optimize(program)
+        timings = {engine: measure(program, engine, args.wiederholungen) for engine in args.engines}
+        cells = []
+        for engine in args.engines:
+            cell = f"{timings[engine]:.3f}s"
+            if engine != reference:
+                cell += f" ({timings[reference] / timings[engine]:.1f}x)"
+            cells.append(f"{cell:>16}")
+        print(f"{os.path.basename(file_path):<24}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
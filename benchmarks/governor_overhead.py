@@ -0,0 +1,83 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Benchmark für Ressourcen-Limits (governor.Limits)
+
+Misst dasselbe Programm ohne Limits, mit Schritt- und Zeitlimit und mit
+zusätzlichem Elementlimit (prüft dann auch + und *). Die Limits sind so
+hoch, dass sie nie greifen; gemessen werden nur die Kosten der Prüfung.
+
+    python benchmarks/governor_overhead.py [--engines tree closure vm] [--runden 20000] [--wiederholungen 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS, '..', 'src'))
+
+from lexer import Lexer
+from parser import Parser
+from interpreter import Interpreter
+from governor import Limits
+
+PROGRAM = """
+GANZ quadrat(x: GANZ) {{
+    ZURÜCK x * x;
+}}
+GANZ haupt() {{
+    GANZ summe = 0;
+    GANZ i = 0;
+    SOLANGE (i < {runden}) {{
+        summe = summe + quadrat(i);
+        i = i + 1;
+    }}
+    FÜR (GANZ j = 0; j < {runden}; j = j + 1) {{
+        summe = summe + j * 2;
+    }}
+    ZURÜCK 0;
+}}
+"""
+
+VARIANTS = {
+    "ohne Limits": None,
+    "Schritte + Zeit": Limits(max_steps=10 ** 12, max_time=3600.0),
+    "+ Elemente": Limits(max_steps=10 ** 12, max_time=3600.0, max_elements=10 ** 9),
+}
+
+
+def run_once(program, engine: str, limits) -> float:
+    """Laufzeit eines interpret() in Sekunden"""
+    interpreter = Interpreter(engine=engine, limits=limits)
+    start = time.perf_counter()
+    interpreter.interpret(program)
+    return time.perf_counter() - start
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Kosten der Ressourcen-Limits pro Engine")
+    arg_parser.add_argument("--engines", nargs="+", default=["tree", "closure", "vm"], help="Zu messende Engines")
+    arg_parser.add_argument("--runden", type=int, default=20000, help="Schleifenrunden pro Messung")
+    arg_parser.add_argument("--wiederholungen", type=int, default=5, help="Läufe pro Messung, gewertet wird der schnellste")
+    args = arg_parser.parse_args()
+
+    program = Parser(Lexer(PROGRAM.format(runden=args.runden)).tokenize()).parse()
+    for engine in args.engines:
+        # Varianten abwechselnd messen, damit Schwankungen der Maschine alle gleich treffen
+        best = dict.fromkeys(VARIANTS, float("inf"))
+        for _ in range(args.wiederholungen):
+            for name, limits in VARIANTS.items():
+                best[name] = min(best[name], run_once(program, engine, limits))
+        baseline = best["ohne Limits"]
+        print(f"{engine}:")
+        for name in VARIANTS:
+            print(f"  {name:<24}{best[name] * 1000:>10.1f} ms{best[name] / baseline * 100:>8.0f} %")
+
+
+if __name__ == "__main__":
+    main()
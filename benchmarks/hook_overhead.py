@@ -0,0 +1,106 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Benchmark für die Hook-Registry (Interpreter.hooks)
+
+Misst dasselbe Programm ohne Hooks, nach Registrieren und wieder Entfernen
+aller Listener und mit je einem leeren Listener pro Ereignis. Die ersten
+beiden Zeilen müssen gleich schnell sein: ohne Listener liegt kein Wrapper
+im Ausführungspfad.
+
+    python benchmarks/hook_overhead.py [--engines tree closure vm] [--runden 20000] [--wiederholungen 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS, '..', 'src'))
+
+from lexer import Lexer
+from parser import Parser
+from interpreter import Interpreter
+from hooks import EVENTS
+
+PROGRAM = """
+GANZ quadrat(x: GANZ) {{
+    ZURÜCK x * x;
+}}
+GANZ haupt() {{
+    GANZ summe = 0;
+    FÜR (GANZ i = 0; i < {runden}; i = i + 1) {{
+        summe = summe + quadrat(i) + ABS(i);
+    }}
+    ZURÜCK 0;
+}}
+"""
+
+
+def ignore(*args):
+    pass
+
+
+def prepare(interpreter, variant: str):
+    """Listener für eine Messvariante registrieren"""
+    if variant == "entfernt":
+        supported = []
+        for event in EVENTS:
+            try:
+                interpreter.hooks.add(event, ignore)
+                supported.append(event)
+            except ValueError:
+                pass
+        for event in supported:
+            interpreter.hooks.remove(event, ignore)
+    elif variant != "ohne":
+        interpreter.hooks.add(variant, ignore)
+
+
+def run_once(program, engine: str, variant: str) -> float:
+    """Laufzeit eines interpret() in Sekunden"""
+    interpreter = Interpreter(engine=engine)
+    prepare(interpreter, variant)
+    start = time.perf_counter()
+    interpreter.interpret(program)
+    return time.perf_counter() - start
+
+
+def supported_variants(engine: str) -> list:
+    variants = ["ohne", "entfernt"]
+    for event in EVENTS:
+        try:
+            Interpreter(engine=engine).hooks.add(event, ignore)
+            variants.append(event)
+        except ValueError:
+            pass
+    return variants
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Kosten der Hook-Registry pro Engine")
+    arg_parser.add_argument("--engines", nargs="+", default=["tree", "closure", "vm"], help="Zu messende Engines")
+    arg_parser.add_argument("--runden", type=int, default=20000, help="Schleifenrunden pro Messung")
+    arg_parser.add_argument("--wiederholungen", type=int, default=5, help="Läufe pro Messung, gewertet wird der schnellste")
+    args = arg_parser.parse_args()
+
+    program = Parser(Lexer(PROGRAM.format(runden=args.runden)).tokenize()).parse()
+    for engine in args.engines:
+        variants = supported_variants(engine)
+        # Varianten abwechselnd messen, damit Schwankungen der Maschine alle gleich treffen
+        best = dict.fromkeys(variants, float("inf"))
+        for _ in range(args.wiederholungen):
+            for variant in variants:
+                best[variant] = min(best[variant], run_once(program, engine, variant))
+        print(f"{engine}:")
+        for variant in variants:
+            label = {"ohne": "ohne Hooks", "entfernt": "Hooks entfernt"}.get(variant, f"Listener '{variant}'")
+            print(f"  {label:<24}{best[variant] * 1000:>10.1f} ms{best[variant] / best['ohne'] * 100:>8.0f} %")
+
+
+if __name__ == "__main__":
+    main()
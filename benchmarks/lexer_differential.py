@@ -0,0 +1,294 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Differenztest und Durchsatz des Lexers
+
+Vergleicht Lexer.tokenize() mit dem früheren zeichenweisen Lexer
+(ReferenceLexer, Algorithmus unverändert übernommen): Typ, Wert, Zeile und
+Spalte jedes Tokens für alle Dateien aus examples/ und usercode/ sowie für
+zufällige Fragmente aus Strings, Escapes, ${...}, // und HINWEIS:
+Kommentaren und Umlaut-Namen. Danach Tokens pro Sekunde beider Lexer über
+alle Dateien zusammen.
+
+    python benchmarks/lexer_differential.py [--zufall 5000] [--seed 0] [--wiederholungen 5]
+
+Einzige gewollte Abweichung: ein Backslash am Ende der Eingabe ließ den
+Referenz-Lexer mit TypeError abstürzen, der neue meldet 'Unterminated
+string'. Wirft der Referenz-Lexer, genügt es, dass auch der neue wirft.
+Exit-Code 1 bei Abweichungen.
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from lexer import Lexer
+from tokens import KEYWORDS, LITERALS, OPERATORS
+
+_SINGLE_CHAR_TOKENS = {
+    '(': 'LPAREN', ')': 'RPAREN', '{': 'LBRACE', '}': 'RBRACE', '[': 'LBRACKET', ']': 'RBRACKET',
+    ';': 'SEMICOLON', ',': 'COMMA', '.': 'DOT', '+': 'PLUS', '-': 'MINUS', '*': 'MULTIPLY',
+    '/': 'DIVIDE', '%': 'MODULO', '=': 'ASSIGN', '<': 'LT', '>': 'GT', '!': 'NOT', ':': 'COLON',
+}
+
+
+class ReferenceLexer:
+    """Der zeichenweise Lexer vor dem Master-Regex (nur als Referenz)"""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.position = 0
+        self.line = 1
+        self.column = 1
+        self.tokens = []
+
+    def current_char(self):
+        if self.position >= len(self.source):
+            return None
+        return self.source[self.position]
+
+    def peek_char(self, offset: int = 1):
+        peek_pos = self.position + offset
+        if peek_pos >= len(self.source):
+            return None
+        return self.source[peek_pos]
+
+    def advance(self):
+        if self.position < len(self.source) and self.source[self.position] == '\n':
+            self.line += 1
+            self.column = 1
+        else:
+            self.column += 1
+        self.position += 1
+
+    def skip_whitespace(self):
+        while self.current_char() is not None and self.current_char().isspace():
+            self.advance()
+
+    def skip_comment(self):
+        if self.current_char() == '/' and self.peek_char() == '/':
+            while self.current_char() and self.current_char() != '\n':
+                self.advance()
+        elif self.match_word("HINWEIS:"):
+            for _ in range(8):
+                self.advance()
+            while self.current_char() and self.current_char() != '\n':
+                self.advance()
+
+    def match_word(self, word: str) -> bool:
+        if self.position + len(word) > len(self.source):
+            return False
+        return self.source[self.position:self.position + len(word)] == word
+
+    def read_string(self):
+        quote_char = self.current_char()
+        self.advance()
+        value = ""
+        has_interpolation = False
+        while self.current_char() and self.current_char() != quote_char:
+            if self.current_char() == '\\':
+                self.advance()
+                if self.current_char() == 'n':
+                    value += '\n'
+                elif self.current_char() == 't':
+                    value += '\t'
+                elif self.current_char() == '\\':
+                    value += '\\'
+                elif self.current_char() == quote_char:
+                    value += quote_char
+                else:
+                    value += self.current_char()
+            elif self.current_char() == '$' and self.peek_char() == '{':
+                has_interpolation = True
+                value += self.current_char()
+                self.advance()
+                value += self.current_char()
+            else:
+                value += self.current_char()
+            self.advance()
+        if self.current_char() == quote_char:
+            self.advance()
+        else:
+            raise SyntaxError(f"Unterminated string at line {self.line}, column {self.column}")
+        if has_interpolation:
+            return ("TEMPLATE_STRING", value)
+        return value
+
+    def read_number(self) -> str:
+        value = ""
+        has_dot = False
+        while self.current_char() and (self.current_char().isdigit() or self.current_char() == '.'):
+            if self.current_char() == '.':
+                if has_dot:
+                    break
+                has_dot = True
+            value += self.current_char()
+            self.advance()
+        return value
+
+    def read_identifier(self) -> str:
+        value = ""
+        while self.current_char() and (self.current_char().isalnum() or self.current_char() in '_ÄÖÜäöüß'):
+            value += self.current_char()
+            self.advance()
+        return value
+
+    def tokenize(self) -> list:
+        """(Typ, Wert, Zeile, Spalte) aller Tokens inklusive EOF"""
+        while self.current_char():
+            self.skip_whitespace()
+            if not self.current_char():
+                break
+            if (self.current_char() == '/' and self.peek_char() == '/') or self.match_word("HINWEIS:"):
+                self.skip_comment()
+                continue
+            if self.current_char() in '"\'':
+                line, col = self.line, self.column
+                result = self.read_string()
+                if isinstance(result, tuple) and result[0] == "TEMPLATE_STRING":
+                    self.tokens.append(("TEMPLATE_STRING_LITERAL", result[1], line, col))
+                else:
+                    self.tokens.append(("STRING_LITERAL", result, line, col))
+                continue
+            if self.current_char().isdigit():
+                line, col = self.line, self.column
+                number = self.read_number()
+                self.tokens.append(("FLOAT_LITERAL" if '.' in number else "INT_LITERAL", number, line, col))
+                continue
+            two_char = self.source[self.position:self.position + 2] if self.position + 1 < len(self.source) else ""
+            if two_char in ["==", "!=", "<=", ">=", "&&", "||", "++"]:
+                line, col = self.line, self.column
+                self.advance()
+                self.advance()
+                self.tokens.append((two_char, two_char, line, col))
+                continue
+            if self.current_char() in _SINGLE_CHAR_TOKENS:
+                line, col = self.line, self.column
+                char = self.current_char()
+                self.advance()
+                self.tokens.append((_SINGLE_CHAR_TOKENS[char], char, line, col))
+                continue
+            if self.current_char().isalpha() or self.current_char() in '_ÄÖÜäöüß':
+                line, col = self.line, self.column
+                identifier = self.read_identifier()
+                if identifier in KEYWORDS:
+                    self.tokens.append((KEYWORDS[identifier], identifier, line, col))
+                elif identifier in LITERALS:
+                    self.tokens.append(("BOOL_LITERAL", identifier, line, col))
+                elif identifier in OPERATORS:
+                    self.tokens.append((OPERATORS[identifier], identifier, line, col))
+                else:
+                    self.tokens.append(("IDENTIFIER", identifier, line, col))
+                continue
+            raise SyntaxError(f"Unexpected character '{self.current_char()}' at line {self.line}, column {self.column}")
+        self.tokens.append(("EOF", "", self.line, self.column))
+        return self.tokens
+
+
+# Bausteine der Zufallsfragmente
+FRAGMENTS = (
+    'GANZ', 'KOMMA', 'WORT', 'WENN', 'SONST', 'SOLANGE', 'FÜR', 'ZURÜCK', 'DRUCKE', 'UND', 'ODER',
+    'NICHT', 'IST', 'JA', 'NEIN', 'REIN', 'größe', 'Äpfel', 'straße_2', 'x', '_tmp', 'ÖL',
+    '0', '42', '3.14', '1.2.3', '07', '.5',
+    '"', "'", '"text"', "'text'", '"a\\"b"', '"\\n\\t\\\\"', '"${x}"', "'${a + b}'", '"$"', '"${"',
+    '${', '}', '{', '\\', '$',
+    '//', '// Kommentar', 'HINWEIS:', 'HINWEIS: Text', 'HINWEIS', 'HINWEIS :',
+    '==', '!=', '<=', '>=', '&&', '||', '++', '=', '<', '>', '!', '+', '-', '*', '/', '%',
+    '(', ')', '[', ']', ';', ',', '.', ':',
+    ' ', ' ', '  ', '\t', '\n', '\n', '\r\n',
+)
+
+
+def random_fragment(rng: random.Random) -> str:
+    return "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 40)))
+
+
+def collect_sources():
+    """(Name, Quelltext) aller Dateien aus examples/ und usercode/"""
+    sources = []
+    for pattern in ('examples/**/*.gerl', 'usercode/*.gerl'):
+        for path in sorted(glob.glob(os.path.join(ROOT, pattern), recursive=True)):
+            with open(path, encoding='utf-8') as f:
+                sources.append((os.path.relpath(path, ROOT), f.read()))
+    return sources
+
+
+def lex(lexer_class, source: str):
+    """Token-Tupel oder der Typ der ausgelösten Exception"""
+    try:
+        return [tuple(token) for token in lexer_class(source).tokenize()]
+    except Exception as e:
+        return type(e)
+
+
+def compare(source: str):
+    """None bei Übereinstimmung, sonst eine Beschreibung der ersten Abweichung"""
+    expected = lex(ReferenceLexer, source)
+    actual = lex(Lexer, source)
+    if isinstance(expected, type):
+        return None if isinstance(actual, type) else f"Referenz wirft {expected.__name__}, neuer Lexer nicht"
+    if isinstance(actual, type):
+        return f"neuer Lexer wirft {actual.__name__}"
+    for index, (old, new) in enumerate(zip(expected, actual)):
+        if old != new:
+            return f"Token {index}: erwartet {old}, erhalten {new}"
+    if len(expected) != len(actual):
+        return f"{len(expected)} statt {len(actual)} Tokens"
+    return None
+
+
+def throughput(lexer_class, source: str, repetitions: int) -> tuple:
+    """(Tokens, beste Zeit in Sekunden)"""
+    best = float("inf")
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        count = len(lexer_class(source).tokenize())
+        best = min(best, time.perf_counter() - start)
+    return count, best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Lexer gegen den zeichenweisen Referenz-Lexer prüfen und messen")
+    arg_parser.add_argument("--zufall", type=int, default=5000, help="Anzahl zufälliger Fragmente")
+    arg_parser.add_argument("--seed", type=int, default=0, help="Seed für die Fragmente")
+    arg_parser.add_argument("--wiederholungen", type=int, default=5, help="Läufe pro Messung, gewertet wird der schnellste")
+    args = arg_parser.parse_args()
+
+    failures = 0
+    sources = collect_sources()
+    for name, source in sources:
+        difference = compare(source)
+        print(f"{'OK' if difference is None else 'FEHLER':<7}{name}")
+        if difference is not None:
+            print(f"  {difference}")
+            failures += 1
+
+    rng = random.Random(args.seed)
+    for _ in range(args.zufall):
+        fragment = random_fragment(rng)
+        difference = compare(fragment)
+        if difference is not None:
+            failures += 1
+            if failures <= 10:
+                print(f"FEHLER {fragment!r}\n  {difference}")
+    print(f"{len(sources)} Dateien, {args.zufall} Fragmente, {failures} Abweichungen")
+
+    combined = "\n".join(source for _, source in sources)
+    print(f"Durchsatz ({len(combined) // 1024} KiB):")
+    for label, lexer_class in (("Lexer", Lexer), ("Referenz", ReferenceLexer)):
+        count, seconds = throughput(lexer_class, combined, args.wiederholungen)
+        print(f"  {label:<12}{count / seconds:>12,.0f} Tokens/s")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Zufallstest und Latenz für Lexer.relex
+
+Wendet auf jede Datei aus examples/ und usercode/ nacheinander zufällige
+Änderungen an (Einfügen und Löschen an zufälliger Stelle, auch mit
+öffnenden/schließenden Anführungszeichen, //, HINWEIS:, ${ und }) und prüft
+nach jeder, dass Lexer.relex(...) dieselben Tokens liefert wie
+Lexer(geändert).tokenize(). Wirft das komplette Lexen, muss auch relex
+werfen; die Änderung wird dann verworfen, sonst bauen die folgenden auf ihr
+auf. Danach die mittlere Zeit von relex und von tokenize() pro Änderung.
+
+    python benchmarks/relex_check.py [--aenderungen 200] [--seed 0]
+
+Exit-Code 1 bei Abweichungen.
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from lexer import Lexer
+
+# Bausteine für eingefügten Text
+EDIT_FRAGMENTS = (
+    '"', "'", '""', '"text"', "'${x}'", '"${a + b}"', '${', '}', '{', '\\', '$',
+    '//', '// Kommentar', 'HINWEIS:', 'HINWEIS: Text', 'HINWEIS',
+    'GANZ', 'WENN', 'größe', 'x', '42', '3.14', '.', '==', '=', '+', '(', ')', ';',
+    ' ', '\t', '\n', '\n', '\r\n',
+)
+
+
+def collect_sources():
+    """(Name, Quelltext) aller Dateien aus examples/ und usercode/"""
+    sources = []
+    for pattern in ('examples/**/*.gerl', 'usercode/*.gerl'):
+        for path in sorted(glob.glob(os.path.join(ROOT, pattern), recursive=True)):
+            with open(path, encoding='utf-8') as f:
+                sources.append((os.path.relpath(path, ROOT), f.read()))
+    return sources
+
+
+def random_edit(rng: random.Random, source: str) -> tuple:
+    """(offset, entfernt, eingefügt) innerhalb von source"""
+    offset = rng.randint(0, len(source))
+    removed = rng.randint(0, min(8, len(source) - offset)) if rng.random() < 0.5 else 0
+    inserted = "".join(rng.choice(EDIT_FRAGMENTS) for _ in range(rng.randint(0 if removed else 1, 3)))
+    return offset, removed, inserted
+
+
+def check_file(name: str, source: str, edits: int, rng: random.Random, timings: list) -> tuple:
+    """(Abweichungen, verworfene Änderungen) für eine Folge von Änderungen"""
+    failures = rejected = 0
+    tokens = Lexer(source).tokenize()
+    for _ in range(edits):
+        offset, removed, inserted = random_edit(rng, source)
+        edited = source[:offset] + inserted + source[offset + removed:]
+        start = time.perf_counter()
+        try:
+            expected = Lexer(edited).tokenize()
+        except SyntaxError:
+            expected = None
+        full_time = time.perf_counter() - start
+
+        candidate = list(tokens)
+        start = time.perf_counter()
+        try:
+            new_source, candidate = Lexer.relex(source, candidate, offset, removed, inserted)
+        except SyntaxError:
+            candidate = None
+        relex_time = time.perf_counter() - start
+
+        edit = f"{name}: {offset}+{removed} -> {inserted!r}"
+        if expected is None:
+            rejected += 1
+            if candidate is not None:
+                failures += 1
+                print(f"FEHLER {edit}\n  tokenize() wirft, relex nicht")
+            continue
+        if candidate is None:
+            failures += 1
+            print(f"FEHLER {edit}\n  relex wirft, tokenize() nicht")
+        elif new_source != edited or candidate != expected:
+            failures += 1
+            index = next((i for i, (a, b) in enumerate(zip(candidate, expected)) if a != b),
+                         min(len(candidate), len(expected)))
+            print(f"FEHLER {edit}\n  Token {index}: erwartet "
+                  f"{expected[index] if index < len(expected) else None}, "
+                  f"erhalten {candidate[index] if index < len(candidate) else None}")
+        else:
+            timings.append((relex_time, full_time))
+        source, tokens = edited, expected
+    return failures, rejected
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Lexer.relex mit zufälligen Änderungen gegen tokenize() prüfen")
+    arg_parser.add_argument("--aenderungen", type=int, default=200, help="Änderungen pro Datei")
+    arg_parser.add_argument("--seed", type=int, default=0, help="Seed für die Änderungen")
+    args = arg_parser.parse_args()
+
+    rng = random.Random(args.seed)
+    timings = []
+    failures = rejected = 0
+    sources = collect_sources()
+    for name, source in sources:
+        file_failures, file_rejected = check_file(name, source, args.aenderungen, rng, timings)
+        print(f"{'OK' if not file_failures else 'FEHLER':<7}{name}")
+        failures += file_failures
+        rejected += file_rejected
+
+    total = len(sources) * args.aenderungen
+    print(f"{len(sources)} Dateien, {total} Änderungen ({rejected} mit Lexfehler), {failures} Abweichungen")
+    if timings:
+        relex_mean = sum(relex for relex, _ in timings) / len(timings)
+        full_mean = sum(full for _, full in timings) / len(timings)
+        print(f"Mittlere Zeit pro Änderung: relex {relex_mean * 1e6:.0f} µs, tokenize() {full_mean * 1e6:.0f} µs")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Benchmark für kompakte Tokens (lexer.TokenStore)
+
+Misst für ein großes synthetisches Programm die Bytes pro Token (tracemalloc)
+einer Token-Liste aus tokenize() und eines TokenStore aus
+tokenize_compact(), dazu die Zeit eines check()/match()-Durchlaufs über alle
+Tokens: mit dem TokenStore, mit einer Token-Liste (Typ-Codes wie im Parser)
+und mit einer Token-Liste und String-Vergleichen wie im früheren Parser.
+Beide Code-Varianten vergleichen dieselbe bytearray-Spalte, der Vorteil des
+TokenStore ist der Speicher. Gemessen werden nur check() und match();
+advance() und previous() bauen beim TokenStore das Token erst beim Zugriff.
+
+    python benchmarks/token_store.py [--funktionen 3000] [--wiederholungen 5]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from lexer import Lexer
+from parser import Parser
+
+
+class StringParser(Parser):
+    """check()/match() wie vor den Typ-Codes: Token holen, Typ-String vergleichen"""
+
+    def is_at_end(self) -> bool:
+        return self.peek().type == "EOF"
+
+    def advance(self):
+        if not self.is_at_end():
+            self.current += 1
+        return self.previous()
+
+    def check(self, token_type: str) -> bool:
+        if self.is_at_end():
+            return False
+        return self.peek().type == token_type
+
+    def match(self, *token_types: str) -> bool:
+        for token_type in token_types:
+            if self.check(token_type):
+                self.advance()
+                return True
+        return False
+
+
+def synthetic_program(functions: int) -> str:
+    """Viele Funktionen mit Schleifen, Bedingungen, Strings und Ausdrücken"""
+    lines = []
+    for i in range(functions):
+        lines.append(f"GANZ funktion_{i}(wert: GANZ, faktor: GANZ) {{")
+        lines.append(f"    GANZ summe = {i % 7};")
+        lines.append(f"    KISTE tabelle = [1, 2, 3, {i}, JA, NEIN, \"eintrag_{i}\"];")
+        lines.append("    FÜR (GANZ i = 0; i < wert; i = i + 1) {")
+        lines.append("        WENN (i % 2 == 0 UND faktor > 1) {")
+        lines.append("            summe = summe + i * faktor - tabelle[i % 4] / 2;")
+        lines.append("        } SONST {")
+        lines.append(f"            DRUCKE(\"Schritt ${{i}} von ${{wert}} in funktion_{i}\");")
+        lines.append("        }")
+        lines.append("    }")
+        lines.append("    ZURÜCK summe;")
+        lines.append("}")
+    return "\n".join(lines)
+
+
+def bytes_per_token(make_tokens) -> tuple:
+    """(Anzahl Tokens, Bytes pro Token) des Ergebnisses von make_tokens()"""
+    gc.collect()
+    tracemalloc.start()
+    tokens = make_tokens()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(tokens), size / len(tokens)
+
+
+def sweep(parser) -> int:
+    """check()/match() an jeder Position, wie der Parser sie stellt"""
+    matched = 0
+    while not parser.is_at_end():
+        parser.check("SEMICOLON")
+        parser.check("RBRACE")
+        if parser.match("IDENTIFIER", "INT_LITERAL", "PLUS", "ASSIGN", "LPAREN"):
+            matched += 1
+        else:
+            parser.current += 1
+    return matched
+
+
+def best_times(functions, repetitions: int) -> list:
+    """Beste Zeit je Funktion, abwechselnd gemessen (Reihenfolge verzerrt nicht)"""
+    best = [float("inf")] * len(functions)
+    for _ in range(repetitions):
+        for index, function in enumerate(functions):
+            start = time.perf_counter()
+            function()
+            best[index] = min(best[index], time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Speicher und check()/match() von TokenStore und Token-Liste")
+    arg_parser.add_argument("--funktionen", type=int, default=3000, help="Funktionen im synthetischen Programm")
+    arg_parser.add_argument("--wiederholungen", type=int, default=5, help="Läufe pro Messung, gewertet wird der schnellste")
+    args = arg_parser.parse_args()
+
+    source = synthetic_program(args.funktionen)
+    count, list_bytes = bytes_per_token(lambda: Lexer(source).tokenize())
+    _, store_bytes = bytes_per_token(lambda: Lexer(source).tokenize_compact())
+    print(f"{count} Tokens, Bytes pro Token:")
+    print(f"  {'Token-Liste':<28}{list_bytes:>8.1f}")
+    print(f"  {'TokenStore':<28}{store_bytes:>8.1f}")
+
+    token_list = Lexer(source).tokenize()
+    store = Lexer(source).tokenize_compact()
+    variants = (
+        ("Token-Liste, Typ-Strings", lambda: sweep(StringParser(token_list))),
+        ("Token-Liste, Typ-Codes", lambda: sweep(Parser(token_list))),
+        ("TokenStore", lambda: sweep(Parser(store))),
+    )
+    times = best_times([run for _, run in variants], args.wiederholungen)
+    print("check()/match() über alle Tokens:")
+    for (name, _), seconds in zip(variants, times):
+        print(f"  {name:<28}{seconds * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
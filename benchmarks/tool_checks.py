@@ -0,0 +1,179 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Prüfungen der Kommandozeilen-Werkzeuge
+
+Startet gerlang.py (check, dis, profile, ...) auf kleinen Programmen in einem temporären
+Verzeichnis und vergleicht die Ausgabe mit dem erwarteten Ergebnis.
+
+    python benchmarks/tool_checks.py [namen...]
+
+Exit-Code 1 bei Abweichungen.
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+GERLANG = os.path.join(ROOT, 'gerlang.py')
+
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def run_gerlang(directory: str, source: str, *arguments: str) -> tuple:
+    """(Exit-Code, Ausgabe ohne Farbcodes) von gerlang.py für source"""
+    path = os.path.join(directory, "programm.gerl")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+    result = subprocess.run([sys.executable, GERLANG, *arguments, path], capture_output=True,
+                            text=True, encoding="utf-8", cwd=directory)
+    return result.returncode, _ANSI.sub("", result.stdout + result.stderr)
+
+
+def check_header_errors(directory: str):
+    """gerlang check: Fehler im Kopf von WENN/FÜR ohne Folgefehler am '}'"""
+    source = (
+        "GANZ f(n: GANZ) {\n"
+        "  GANZ a = ;\n"
+        "  ZURÜCK n;\n"
+        "}\n"
+        "WENN (1 < 2 {\n"
+        "  DRUCKE(1 + );\n"
+        "} SONST {\n"
+        "  DRUCKE(2);\n"
+        "}\n"
+        "FÜR (GANZ i = 0; i < 3 i = i + 1) {\n"
+        "  DRUCKE(i);\n"
+        "}\n"
+        "DRUCKE(\"ende\");\n"
+    )
+    code, output = run_gerlang(directory, source, "check")
+    positions = re.findall(r"programm\.gerl:(\d+:\d+)", output)
+    expected = ["2:12", "5:13", "6:14", "10:24"]
+    if code != 2 or positions != expected or "❌ 4 Fehler" not in output:
+        return f"erwartet Fehler bei {expected}, erhalten {positions} (Exit-Code {code})"
+    return None
+
+
+def check_dis_lines(directory: str):
+    """gerlang dis: Zeile von Deklarationen, die nur aus (geteilten) Literalen bestehen"""
+    source = "GANZ x = 5;\nGANZ s = 0;\nJAIN b = JA;\nDRUCKE(x + s);\n"
+    code, output = run_gerlang(directory, source, "dis")
+    # Spalten wie in bytecode.disassemble: Zeile (nur bei Wechsel), Sprungziel, Offset, Opcode
+    lines, line = {}, None
+    for match in re.finditer(r"^([ \d]{5}) (?:>>| {2}) +\d+ (\w+) +-?\d+ \((\w+)\)$", output, re.MULTILINE):
+        line = int(match.group(1)) if match.group(1).strip() else line
+        if match.group(2) == "DEFINE_NAME":
+            lines[match.group(3)] = line
+    expected = {"x": 1, "s": 2, "b": 3}
+    if code != 0 or lines != expected:
+        return f"erwartet Zeilen {expected}, erhalten {lines} (Exit-Code {code})"
+    return None
+
+
+def check_profile_own_time(directory: str):
+    """gerlang profile: Eigenzeit einer Funktion ohne Aufrufe ist ihre Gesamtzeit"""
+    source = (
+        "GANZ schleife(n: GANZ) {\n"
+        "    GANZ s = 0;\n"
+        "    FÜR (GANZ i = 0; i < n; i = i + 1) {\n"
+        "        s = s + i;\n"
+        "    }\n"
+        "    ZURÜCK s;\n"
+        "}\n"
+        "GANZ haupt() {\n"
+        "    DRUCKE(schleife(5000));\n"
+        "    ZURÜCK 0;\n"
+        "}\n"
+    )
+    report_path = os.path.join(directory, "profil.json")
+    code, _ = run_gerlang(directory, source, "profile", "--json", report_path)
+    if code != 0:
+        return f"Exit-Code {code}"
+    with open(report_path, encoding="utf-8") as f:
+        rows = {row["funktion"]: row for row in json.load(f)["funktionen"]}
+    loop, main = rows["schleife"], rows["haupt"]
+    # Ohne Aufrufe ist die Differenz nur Messaufwand des Wrappers
+    if loop["eigen_ms"] < 0.95 * loop["gesamt_ms"] or main["eigen_ms"] > 0.5 * main["gesamt_ms"]:
+        return (f"schleife {loop['eigen_ms']:.2f} von {loop['gesamt_ms']:.2f} ms eigen, "
+                f"haupt {main['eigen_ms']:.2f} von {main['gesamt_ms']:.2f} ms eigen")
+    return None
+
+
+def check_nested_limit(directory: str):
+    """--max-elements: verschachtelte KISTE in ZU_WORT und Template, Position auch in der VM"""
+    source = (
+        "KISTE k = [1];\n"
+        "FÜR (GANZ i = 0; i < 22; i = i + 1) {\n"
+        "    k = [k, k];\n"
+        "}\n"
+        "WORT w = ZU_WORT(k);\n"
+        "DRUCKE(\"k = ${k}\");\n"
+    )
+    differences = []
+    for engine in ("tree", "closure", "vm"):
+        code, output = run_gerlang(directory, source, "run", "--no-cache", f"--engine={engine}",
+                                   "--max-elements=1000")
+        positions = re.findall(r"programm\.gerl:(\d+:\d+)", output)
+        if code == 0 or "GL010" not in output or positions[:1] != ["5:17"]:
+            differences.append(f"{engine}: Exit-Code {code}, Positionen {positions}")
+    # Die VM kennt nur Zeilen, Spalte 1 wie bei --max-steps
+    source = source.replace("WORT w = ZU_WORT(k);", "")
+    code, output = run_gerlang(directory, source, "run", "--no-cache", "--engine=vm", "--max-elements=1000")
+    positions = re.findall(r"programm\.gerl:(\d+:\d+)", output)
+    if code == 0 or positions[:1] != ["6:1"]:
+        differences.append(f"vm, Template: Exit-Code {code}, Positionen {positions}")
+    return "; ".join(differences) or None
+
+
+def check_nested_template(directory: str):
+    """${...} mit verschachtelten KISTEN: innere Listen wie str(), typisierte wie Listen"""
+    source = (
+        "KISTE k = [1, \"a\", [\"b\", JA, 2.5, [3]], NEUE_KISTE(2, 0)];\n"
+        "DRUCKE(\"k=${k}\");\n"
+    )
+    expected = "k=[1, \"a\", ['b', True, 2.5, [3]], [0, 0]]"
+    differences = []
+    for engine in ("tree", "closure", "vm"):
+        code, output = run_gerlang(directory, source, "run", "--no-cache", f"--engine={engine}")
+        if code != 0 or expected not in output.splitlines():
+            differences.append(f"{engine}: Exit-Code {code}, erwartet {expected!r}")
+    return "; ".join(differences) or None
+
+
+CHECKS = {
+    "check_kopf": check_header_errors,
+    "dis_zeilen": check_dis_lines,
+    "profil_eigenzeit": check_profile_own_time,
+    "limit_verschachtelt": check_nested_limit,
+    "vorlage_verschachtelt": check_nested_template,
+}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Ausgaben der gerlang.py-Werkzeuge prüfen")
+    arg_parser.add_argument("namen", nargs="*", help=f"Nur diese Prüfungen ({', '.join(CHECKS)})")
+    args = arg_parser.parse_args()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as directory:
+        for name in args.namen or CHECKS:
+            difference = CHECKS[name](directory)
+            print(f"{'OK' if difference is None else 'FEHLER':<7}{name}")
+            if difference is not None:
+                print(f"  {difference}")
+                failures += 1
+    print(f"{len(args.namen or CHECKS)} Prüfungen, {failures} Abweichungen")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
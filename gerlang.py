@@ -4,8 +4,10 @@
 # https://opensource.org/licenses/MIT
 
 import argparse
+import io
 import sys
 import os
+from contextlib import nullcontext
 from pathlib import Path
 
 # Füge src-Verzeichnis zum Python-Pfad hinzu
@@ -13,7 +15,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from lexer import Lexer, Token
 from parser import Parser
-from interpreter import Interpreter
+from interpreter import Interpreter, GERLANG_VERSION
+from governor import Limits
+import ast_cache
 
 def safe_print(text):
     """Sicherer Print der Unicode-Encoding-Probleme vermeidet"""
@@ -39,34 +43,37 @@ def print_banner():
     safe_print("GerLang - Die deutsche Programmiersprache")
     safe_print("=" * 50)
 
+def read_source(file_path: str) -> str:
+    """Liest den kompletten Quellcode (z.B. für Fehlermeldungen mit Kontext)"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
 def lexer_command(file_path: str, verbose: bool = False):
     """Führt nur den Lexer aus und zeigt die Tokens"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            source_code = f.read()
-
         if verbose:
+            source_code = read_source(file_path)
             safe_print(f"📄 Datei: {file_path}")
             safe_print("📝 Quellcode:")
             safe_print("-" * 30)
             safe_print(source_code)
             safe_print("-" * 30)
 
-        lexer = Lexer(source_code)
-        tokens = lexer.tokenize()
-
-        safe_print("\n🔍 Lexer-Analyse:")
-        safe_print("-" * 50)
-
-        for token in tokens:
-            if token.type == "EOF":
-                safe_print(f"{'EOF':<15} | {'<end>':<20} | Line {token.line:>2}, Col {token.column:>2}")
-            else:
-                # Kürze lange Values für bessere Darstellung
-                display_value = token.value[:20] + "..." if len(token.value) > 20 else token.value
-                safe_print(f"{token.type:<15} | {display_value:<20} | Line {token.line:>2}, Col {token.column:>2}")
+        with open(file_path, 'r', encoding='utf-8') as f:
+            safe_print("\n🔍 Lexer-Analyse:")
+            safe_print("-" * 50)
+
+            count = 0
+            for token in Lexer.stream(f):
+                count += 1
+                if token.type == "EOF":
+                    safe_print(f"{'EOF':<15} | {'<end>':<20} | Line {token.line:>2}, Col {token.column:>2}")
+                else:
+                    # Kürze lange Values für bessere Darstellung
+                    display_value = token.value[:20] + "..." if len(token.value) > 20 else token.value
+                    safe_print(f"{token.type:<15} | {display_value:<20} | Line {token.line:>2}, Col {token.column:>2}")
 
-        safe_print(f"\n✅ Lexer erfolgreich! {len(tokens)} Tokens erkannt.")
+        safe_print(f"\n✅ Lexer erfolgreich! {count} Tokens erkannt.")
 
     except FileNotFoundError:
         safe_print(f"❌ Fehler: Datei '{file_path}' nicht gefunden!")
@@ -75,10 +82,20 @@ def lexer_command(file_path: str, verbose: bool = False):
         safe_print(f"❌ Lexer-Fehler: {e}")
         sys.exit(1)
 
-def run_command(file_path: str):
+def run_command(file_path: str, use_cache: bool = True, cache_dir: str = None, engine: str = "tree", optimize: bool = False, max_depth: int = None,
+                memo_size: int = None, memo_stats: bool = False, sample_profile: str = None, sample_rate: int = None,
+                metrics_format: str = None, metrics_file: str = None, limits: Limits = None):
     """Führt eine GerLang-Datei aus (jetzt mit Parser & Interpreter!)"""
     safe_print(f"🚀 Führe {file_path} aus...")
 
+    metrics = None
+    phase = lambda name: nullcontext()
+    if metrics_format or metrics_file:
+        # Zähler und Phasen-Zeiten, siehe metrics.py
+        from metrics import Metrics
+        metrics = Metrics()
+        phase = metrics.phase
+
     def get_humorous_tip(msg):
         msg_lower = msg.lower()
         if "unexpected token" in msg_lower:
@@ -94,133 +111,88 @@ def run_command(file_path: str):
         return "Hinweis: Prüfe die Syntax und den Kontext der Fehlermeldung."
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            source_code = f.read()
-        lexer = Lexer(source_code)
-        tokens = lexer.tokenize()
-        parser = Parser(tokens, file_path=file_path)
-        try:
-            program = parser.parse()
-        except Exception as e:
-            # Importiere Error Reporter
-            from src.error_reporter import ErrorReporter, GerLangErrors
-            
-            reporter = ErrorReporter(source_code, file_path)
-            token = getattr(e, 'token', None)
-            
-            if token:
-                # Parser-Fehler mit Token-Information
-                error = GerLangErrors.syntax_error(
-                    file_path=file_path,
-                    line=token.line,
-                    column=token.column,
-                    expected="gültiges Token",
-                    found=token.value
-                )
-                reporter.print_error(error)
-            else:
-                # Fallback für andere Fehler
-                safe_print(f"\n❌ Parser-Fehler: {str(e)}")
-                safe_print("Tipp: Prüfe die Syntax und den Kontext der Fehlermeldung.")
-            sys.exit(2)
-        interpreter = Interpreter(current_file=os.path.abspath(file_path))
+        program = None
+        with open(file_path, 'rb') as raw:
+            key = None
+            if use_cache:
+                # Unveränderte Dateien nicht neu lexen/parsen (.gerlc, siehe ast_cache);
+                # der Schlüssel wird blockweise gehasht, die Datei nie ganz gelesen
+                key = ast_cache.file_cache_key(raw)
+                program = ast_cache.load(file_path, key, cache_dir)
+                raw.seek(0)
+            if program is None:
+                # Tokens werden lazy gelesen, der Parser startet vor dem Ende des Scans
+                f = io.TextIOWrapper(raw, encoding='utf-8')
+                if metrics is not None:
+                    # Für getrennte Zeiten von Lexer und Parser erst alle Tokens lesen
+                    with phase("lexen"):
+                        tokens = Lexer(f.read()).tokenize()
+                else:
+                    tokens = Lexer.stream(f)
+                parser = Parser(tokens, file_path=file_path)
+                try:
+                    with phase("parsen"):
+                        program = parser.parse()
+                except SyntaxError:
+                    # Lexer-Fehler wie bisher über den allgemeinen Handler melden
+                    raise
+                except Exception as e:
+                    # Importiere Error Reporter
+                    from src.error_reporter import ErrorReporter, GerLangErrors
+        
+                    reporter = ErrorReporter(read_source(file_path), file_path)
+                    token = getattr(e, 'token', None)
+        
+                    if token:
+                        # Parser-Fehler mit Token-Information
+                        error = GerLangErrors.syntax_error(
+                            file_path=file_path,
+                            line=token.line,
+                            column=token.column,
+                            expected="gültiges Token",
+                            found=token.value
+                        )
+                        reporter.print_error(error)
+                    else:
+                        # Fallback für andere Fehler
+                        safe_print(f"\n❌ Parser-Fehler: {str(e)}")
+                        safe_print("Tipp: Prüfe die Syntax und den Kontext der Fehlermeldung.")
+                    sys.exit(2)
+                if key is not None:
+                    ast_cache.store(file_path, key, program, cache_dir)
+        if optimize:
+            # Nach dem Cache: .gerlc enthält immer den unveränderten AST
+            from optimizer import Optimizer
+            with phase("optimieren"):
+                program = Optimizer().optimize(program)
+        interpreter = Interpreter(current_file=os.path.abspath(file_path), engine=engine, max_depth=max_depth, memo_size=memo_size,
+                                  limits=limits)
+        if metrics is not None:
+            metrics.attach(interpreter)
+        sampler = None
+        if sample_profile:
+            # Stichproben aus einem eigenen Thread, siehe profiler.SamplingProfiler
+            from profiler import SamplingProfiler, DEFAULT_SAMPLE_RATE
+            sampler = SamplingProfiler(interpreter, sample_rate or DEFAULT_SAMPLE_RATE)
+            sampler.start()
         try:
-            interpreter.interpret(program)
+            with phase("ausfuehren"):
+                interpreter.interpret(program)
         except Exception as e:
-            # Verbesserte Laufzeit-Fehlerbehandlung
-            from error_reporter import ErrorReporter as ErrReporter, GerLangErrors
-            from call_stack import RuntimeError as GerLangRuntimeError
-            
-            reporter = ErrReporter(source_code, file_path)
-            
-            # Prüfe ob es sich um einen GerLang Runtime-Error handelt
-            if isinstance(e, GerLangRuntimeError):
-                # Prüfe spezifische Fehlertypen für bessere Codes
-                if "Division durch Null" in e.message:
-                    error = GerLangErrors.division_by_zero(
-                        file_path=e.file_path,
-                        line=e.line,
-                        column=e.column
-                    )
-                elif "nicht definiert" in e.message and "Variable" in e.message:
-                    import re
-                    match = re.search(r"Variable '([^']+)' nicht definiert", e.message)
-                    var_name = match.group(1) if match else "unbekannt"
-                    error = GerLangErrors.undefined_variable(
-                        file_path=e.file_path,
-                        line=e.line,
-                        column=e.column,
-                        var_name=var_name
-                    )
-                elif "nicht gefunden" in e.message and "Funktion" in e.message:
-                    import re
-                    match = re.search(r"Funktion '([^']+)' nicht gefunden", e.message)
-                    func_name = match.group(1) if match else "unbekannt"
-                    error = GerLangErrors.undefined_function(
-                        file_path=e.file_path,
-                        line=e.line,
-                        column=e.column,
-                        func_name=func_name
-                    )
-                else:
-                    # Generischer Runtime-Error
-                    error = ErrorInfo(
-                        code="GL999",
-                        title=e.message,
-                        file_path=e.file_path,
-                        line=e.line,
-                        column=e.column,
-                        message=e.message
-                    )
-                
-                # Füge Stack-Trace hinzu falls vorhanden
-                if e.call_stack:
-                    stack_trace = "\n\nCall-Stack:"
-                    for i, frame in enumerate(reversed(e.call_stack)):
-                        stack_trace += f"\n  {i}: {frame.function_name}() at {frame.file_path}:{frame.line}:{frame.column}"
-                    error.hint = stack_trace
-                
-                reporter.print_error(error)
-            else:
-                # Fallback für andere Laufzeit-Fehler
-                msg = str(e)
-                if "nicht definiert" in msg and "Variable" in msg:
-                    # Extrahiere Variablennamen
-                    import re
-                    match = re.search(r"Variable '([^']+)' nicht definiert", msg)
-                    var_name = match.group(1) if match else "unbekannt"
-                    
-                    error = GerLangErrors.undefined_variable(
-                        file_path=file_path,
-                        line=1,  # TODO: Bessere Positionserkennung
-                        column=1,
-                        var_name=var_name
-                    )
-                    reporter.print_error(error)
-                elif "nicht gefunden" in msg and "Funktion" in msg:
-                    # Funktions-Fehler
-                    match = re.search(r"Funktion '([^']+)' nicht gefunden", msg)
-                    func_name = match.group(1) if match else "unbekannt"
-                    
-                    error = GerLangErrors.undefined_function(
-                        file_path=file_path,
-                        line=1,  # TODO: Bessere Positionserkennung
-                        column=1,
-                        func_name=func_name
-                    )
-                    reporter.print_error(error)
-                elif "Division durch Null" in msg:
-                    error = GerLangErrors.division_by_zero(
-                        file_path=file_path,
-                        line=1,  # TODO: Bessere Positionserkennung
-                        column=1
-                    )
-                    reporter.print_error(error)
-                else:
-                    # Fallback für andere Laufzeit-Fehler
-                    safe_print(f"\n❌ Laufzeitfehler: {msg}")
-                    safe_print("Tipp: Vielleicht hast du eine Variable vergessen, einen Typen verwechselt oder die Wurst zu früh gegessen.")
+            # Fehler-Code, Quelltext-Kontext und Call-Stack (siehe error_reporter)
+            from error_reporter import runtime_error_report
+            safe_print(runtime_error_report(e, read_source(file_path), file_path))
             sys.exit(3)
+        finally:
+            if sampler is not None:
+                sampler.stop()
+                count = sampler.write(sample_profile)
+                safe_print(f"\n🔥 {count} Stichproben gespeichert: {sample_profile} (Collapsed-Stack-Format)")
+            if metrics is not None:
+                metrics.detach()
+                write_metrics(metrics, metrics_file)
+        if memo_stats:
+            print_memo_statistics(interpreter.memo_statistics())
         safe_print("\n✅ Ausführung beendet!")
     except FileNotFoundError:
         safe_print(f"❌ Fehler: Datei '{file_path}' nicht gefunden!")
@@ -229,6 +201,203 @@ def run_command(file_path: str):
         safe_print(f"❌ Fehler bei der Ausführung: {e}")
         sys.exit(1)
 
+def write_metrics(metrics, metrics_file: str = None):
+    """Metriken als JSON auf stdout bzw. in metrics_file (gerlang run --metrics)"""
+    if metrics_file:
+        with open(metrics_file, 'w', encoding='utf-8') as f:
+            f.write(metrics.to_json(indent=2) + "\n")
+        safe_print(f"\n📈 Metriken gespeichert: {metrics_file}")
+    else:
+        safe_print("\n📈 Metriken:")
+        safe_print(metrics.to_json(indent=2))
+
+def print_memo_statistics(statistics):
+    """Tabelle der Cache-Treffer pro REIN-Funktion (gerlang run --memo-stats)"""
+    safe_print("\n📊 Memoisierung (REIN-Funktionen):")
+    if not statistics:
+        safe_print("  Keine REIN-Funktion aufgerufen")
+        return
+    safe_print(f"  {'Funktion':<20}{'Treffer':>10}{'Fehlschläge':>13}{'Umgangen':>10}{'Einträge':>12}")
+    for entry in statistics:
+        entries = f"{entry['eintraege']}/{entry['groesse']}"
+        safe_print(f"  {entry['funktion']:<20}{entry['treffer']:>10}{entry['fehlschlaege']:>13}{entry['umgangen']:>10}{entries:>12}")
+
+def profile_command(file_path: str, json_path: str = None, sort: str = "eigen", limit: int = 20, optimize: bool = False):
+    """Führt eine Datei mit Profil pro Funktion und Quellzeile aus (Baum-Engine)"""
+    from profiler import Profiler
+    try:
+        source = read_source(file_path)
+        program = Parser(Lexer(source).tokenize(), file_path=file_path).parse()
+    except FileNotFoundError:
+        safe_print(f"❌ Fehler: Datei '{file_path}' nicht gefunden!")
+        sys.exit(1)
+    except Exception as e:
+        safe_print(f"❌ Parser-Fehler: {e}")
+        sys.exit(2)
+
+    if optimize:
+        from optimizer import Optimizer
+        program = Optimizer().optimize(program)
+    safe_print(f"🚀 Führe {file_path} mit Profil aus...")
+    interpreter = Interpreter(current_file=os.path.abspath(file_path))
+    profiler = Profiler()
+    try:
+        profiler.run(interpreter, program)
+    except Exception as e:
+        from error_reporter import runtime_error_report
+        safe_print(runtime_error_report(e, source, file_path))
+        sys.exit(3)
+
+    source_lines = source.splitlines()
+    safe_print(profiler.format(source_lines, sort, limit))
+    if json_path:
+        import json
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(profiler.report(file_path, source_lines, sort), f, ensure_ascii=False, indent=2)
+        safe_print(f"\n💾 Profil gespeichert: {json_path}")
+
+def dis_command(file_path: str, optimize: bool = False):
+    """Zeigt den Bytecode einer Datei (globale Statements und alle Funktionen)"""
+    from bytecode import BytecodeCompiler, disassemble
+    from optimizer import Optimizer
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            program = Parser(Lexer.stream(f), file_path=file_path).parse()
+    except FileNotFoundError:
+        safe_print(f"❌ Fehler: Datei '{file_path}' nicht gefunden!")
+        sys.exit(1)
+    except Exception as e:
+        safe_print(f"❌ Parser-Fehler: {e}")
+        sys.exit(2)
+
+    if optimize:
+        program = Optimizer().optimize(program)
+    module, functions = BytecodeCompiler().compile_program(program)
+    safe_print(disassemble(module))
+    for code in functions.values():
+        safe_print("")
+        safe_print(disassemble(code))
+
+def compile_command(file_path: str, output: str = None, optimize: bool = False):
+    """Übersetzt eine GerLang-Datei in ein Python-Modul (siehe transpiler)"""
+    from transpiler import Transpiler, TranspileError
+    from call_stack import RuntimeError as GerLangRuntimeError
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            program = Parser(Lexer.stream(f), file_path=file_path).parse()
+    except FileNotFoundError:
+        safe_print(f"❌ Fehler: Datei '{file_path}' nicht gefunden!")
+        sys.exit(1)
+    except Exception as e:
+        safe_print(f"❌ Parser-Fehler: {e}")
+        sys.exit(2)
+
+    if optimize:
+        from optimizer import Optimizer
+        program = Optimizer().optimize(program)
+    if output is None:
+        output = os.path.join(os.path.dirname(file_path), Path(file_path).stem + '_gerl.py')
+    src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+    try:
+        code = Transpiler(os.path.abspath(file_path), file_path, src_dir).transpile(program)
+    except TranspileError as e:
+        position = f"{file_path}:{e.line}:{e.column}" if e.line else file_path
+        safe_print(f"❌ Nicht übersetzbar ({position}): {e.message}")
+        sys.exit(2)
+    except GerLangRuntimeError as e:
+        # z.B. Seiteneffekt in einer REIN-Funktion
+        from error_reporter import runtime_error_report
+        safe_print(runtime_error_report(e, read_source(file_path), file_path))
+        sys.exit(3)
+    with open(output, 'w', encoding='utf-8') as f:
+        f.write(code)
+    safe_print(f"✅ {file_path} -> {output} (ausführen mit: python {output})")
+
+def collect_gerl_files(paths):
+    """Alle .gerl-Dateien aus Dateien und Verzeichnissen, sortiert und ohne Duplikate"""
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                for name in names:
+                    if name.endswith('.gerl'):
+                        files.add(os.path.normpath(os.path.join(root, name)))
+        else:
+            files.add(os.path.normpath(path))
+    return sorted(files)
+
+def check_file(file_path: str):
+    """Parst eine Datei mit Fehler-Recovery (läuft im Worker-Prozess).
+
+    Liefert (Dateipfad, Anzahl Fehler, formatierte Fehlermeldungen).
+    """
+    from error_reporter import ErrorReporter, GerLangErrors
+
+    try:
+        source = read_source(file_path)
+    except (OSError, UnicodeDecodeError) as e:
+        return file_path, 1, [f"❌ {file_path}: Datei nicht lesbar ({e})\n"]
+
+    reporter = ErrorReporter(source, file_path)
+    try:
+        _, errors = Parser(Lexer(source).tokenize_compact(), file_path=file_path).parse_all()
+    except SyntaxError as e:
+        # Lexer-Fehler beenden die Prüfung der Datei
+        import re
+        position = re.search(r"line (\d+), column (\d+)", str(e))
+        line, column = (int(position.group(1)), int(position.group(2))) if position else (1, 1)
+        return file_path, 1, [reporter.report_error(GerLangErrors.lexer_error(file_path, line, column, str(e)))]
+    except RecursionError:
+        return file_path, 1, [f"❌ {file_path}: Zu tief verschachtelte Anweisungen\n"]
+
+    reports = []
+    for error in errors:
+        info = GerLangErrors.syntax_error(
+            file_path=file_path,
+            line=error.token.line,
+            column=error.token.column,
+            expected="gültiges Token",
+            found=error.token.value
+        )
+        info.message = str(error)
+        reports.append(reporter.report_error(info))
+    return file_path, len(errors), reports
+
+def check_command(paths, jobs: int = None):
+    """Prüft viele .gerl-Dateien parallel auf Syntaxfehler"""
+    files = collect_gerl_files(paths)
+    if not files:
+        safe_print("❌ Keine .gerl-Dateien gefunden")
+        sys.exit(1)
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(files) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=min(jobs, len(files)))
+        # map() liefert in Eingabereihenfolge, die Ausgabe ist unabhängig vom Scheduling
+        results = executor.map(check_file, files, chunksize=max(1, len(files) // (jobs * 4)))
+    else:
+        executor = None
+        results = map(check_file, files)
+
+    total_errors = 0
+    failed_files = 0
+    try:
+        for file_path, error_count, reports in results:
+            for report in reports:
+                safe_print(report)
+            if error_count:
+                total_errors += error_count
+                failed_files += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if total_errors:
+        safe_print(f"❌ {total_errors} Fehler in {failed_files} von {len(files)} Dateien")
+        sys.exit(2)
+    safe_print(f"✅ {len(files)} Dateien geprüft, keine Syntaxfehler")
+
 def repl_command():
     """Startet eine interaktive GerLang-Shell"""
     safe_print("GerLang REPL (Read-Eval-Print-Loop)")
@@ -296,7 +465,7 @@ def info_command():
         safe_print(f"  {german:<12} -> {english}")
 
     safe_print(f"\nDateierweiterung: .gerl")
-    safe_print(f"Version: 4.1.0 (release)")
+    safe_print(f"Version: {GERLANG_VERSION} (release)")
 
 def main():
     parser = argparse.ArgumentParser(
@@ -305,7 +474,19 @@ def main():
         epilog="""
 Beispiele:
   gerlang run beispiele/haupt.gerl     # Führe eine .gerl Datei aus
+  gerlang run --no-cache datei.gerl   # Ohne .gerlc-Cache ausführen
+  gerlang run --engine=closure datei.gerl  # Mit dem Closure-Compiler ausführen
+  gerlang run -O datei.gerl           # Konstanten falten, tote Zweige entfernen
+  gerlang run --engine=vm --max-depth=100000 datei.gerl  # Tiefe Rekursion
+  gerlang run --max-steps=1000000 --max-time=2 skript.gerl  # Fremde Skripte begrenzen
+  gerlang run --memo-stats datei.gerl  # Cache-Treffer der REIN-Funktionen zeigen
+  gerlang profile datei.gerl --json profil.json  # Zeit pro Funktion und Zeile
+  gerlang run --sample-profile=out.folded datei.gerl  # Stichproben für Flame-Graphs
+  gerlang run --metrics=json datei.gerl  # Zähler und Zeiten pro Lauf als JSON
   gerlang lex beispiele/haupt.gerl     # Zeige nur die Lexer-Tokens
+  gerlang dis beispiele/haupt.gerl     # Zeige den Bytecode der VM
+  gerlang compile datei.gerl -o datei_gerl.py  # Nach Python übersetzen
+  gerlang check skripte/              # Alle .gerl Dateien auf Syntaxfehler prüfen
   gerlang repl                        # Starte interaktive Shell
   gerlang info                        # Zeige Sprachinfos
         """
@@ -316,12 +497,50 @@ Beispiele:
     # run command
     run_parser = subparsers.add_parser('run', help='Führe eine GerLang-Datei aus')
     run_parser.add_argument('file', help='Pfad zur .gerl Datei')
+    run_parser.add_argument('--no-cache', action='store_true', help='Geparsten AST nicht aus .gerlc laden oder speichern')
+    run_parser.add_argument('--cache-dir', metavar='DIR', help=f'Verzeichnis für .gerlc-Dateien (Standard: {ast_cache.CACHE_DIR_NAME} neben der Quelle)')
+    run_parser.add_argument('--engine', choices=('tree', 'closure', 'vm'), default='tree', help='Ausführung per Baum-Interpreter (Standard), vorübersetzten Closures oder Bytecode-VM')
+    run_parser.add_argument('--max-depth', type=int, metavar='N', help='Höchstens N verschachtelte Funktionsaufrufe (--engine=vm ist nicht an Pythons Rekursionslimit gebunden)')
+    run_parser.add_argument('--max-steps', type=int, metavar='N', help='Höchstens N Schritte (Schleifenrunden und Funktionsaufrufe), sonst Fehler GL010')
+    run_parser.add_argument('--max-time', type=float, metavar='SEK', help='Höchstens SEK Sekunden Laufzeit, sonst Fehler GL010')
+    run_parser.add_argument('--max-elements', type=int, metavar='N', help='Höchstens N Elemente pro KISTE bzw. Zeichen pro WORT, sonst Fehler GL010')
+    run_parser.add_argument('-O', '--optimize', action='store_true', help='AST vor der Ausführung optimieren (Konstantenfaltung, tote Zweige)')
+    run_parser.add_argument('--memo-size', type=int, metavar='N', help='Gespeicherte Ergebnisse pro REIN-Funktion (Standard: 1024, 0 = aus)')
+    run_parser.add_argument('--memo-stats', action='store_true', help='Nach dem Lauf Cache-Treffer und -Fehlschläge der REIN-Funktionen zeigen')
+    run_parser.add_argument('--sample-profile', metavar='DATEI', help='Stichproben von Call-Stack und Zeile im Collapsed-Stack-Format (Flame-Graph) speichern')
+    run_parser.add_argument('--metrics', choices=('json',), help='Zähler (Statements, Aufrufe, Scopes, Fehler, ...) und Phasen-Zeiten nach dem Lauf ausgeben')
+    run_parser.add_argument('--metrics-file', metavar='DATEI', help='Metriken als JSON in DATEI statt auf die Konsole schreiben')
+    run_parser.add_argument('--sample-rate', type=int, metavar='HZ', help='Stichproben pro Sekunde für --sample-profile (Standard: 200)')
+
+    # profile command
+    profile_parser = subparsers.add_parser('profile', help='Führe eine Datei mit Profil pro Funktion und Zeile aus')
+    profile_parser.add_argument('file', help='Pfad zur .gerl Datei')
+    profile_parser.add_argument('--json', metavar='DATEI', help='Profil zusätzlich als JSON speichern')
+    profile_parser.add_argument('--sort', choices=('eigen', 'gesamt', 'aufrufe'), default='eigen', help='Sortierung der Funktionen (Standard: Eigenzeit)')
+    profile_parser.add_argument('--top', type=int, default=20, metavar='N', help='Höchstens N Funktionen und Zeilen zeigen (Standard: 20)')
+    profile_parser.add_argument('-O', '--optimize', action='store_true', help='AST vor der Ausführung optimieren')
 
     # lex command
     lex_parser = subparsers.add_parser('lex', help='Zeige Lexer-Tokens einer Datei')
     lex_parser.add_argument('file', help='Pfad zur .gerl Datei')
     lex_parser.add_argument('-v', '--verbose', action='store_true', help='Zeige auch den Quellcode')
 
+    # dis command
+    dis_parser = subparsers.add_parser('dis', help='Zeige den Bytecode einer Datei (--engine=vm)')
+    dis_parser.add_argument('file', help='Pfad zur .gerl Datei')
+    dis_parser.add_argument('-O', '--optimize', action='store_true', help='Bytecode des optimierten AST zeigen')
+
+    # compile command
+    compile_parser = subparsers.add_parser('compile', help='Übersetze eine GerLang-Datei in ein Python-Modul')
+    compile_parser.add_argument('file', help='Pfad zur .gerl Datei')
+    compile_parser.add_argument('-o', '--output', metavar='DATEI', help='Ziel-Datei (Standard: <name>_gerl.py neben der Quelle)')
+    compile_parser.add_argument('-O', '--optimize', action='store_true', help='AST vor dem Übersetzen optimieren')
+
+    # check command
+    check_parser = subparsers.add_parser('check', help='Prüfe .gerl-Dateien und Verzeichnisse auf Syntaxfehler')
+    check_parser.add_argument('paths', nargs='+', metavar='pfad', help='.gerl Dateien oder Verzeichnisse')
+    check_parser.add_argument('-j', '--jobs', type=int, help='Anzahl paralleler Prozesse (Standard: CPU-Kerne)')
+
     # repl command
     subparsers.add_parser('repl', help='Starte interaktive GerLang-Shell')
 
@@ -334,9 +553,20 @@ Beispiele:
     print_banner()
 
     if args.command == 'run':
-        run_command(args.file)
+        run_command(args.file, use_cache=not args.no_cache, cache_dir=args.cache_dir, engine=args.engine, optimize=args.optimize, max_depth=args.max_depth,
+                    memo_size=args.memo_size, memo_stats=args.memo_stats, sample_profile=args.sample_profile, sample_rate=args.sample_rate,
+                    metrics_format=args.metrics, metrics_file=args.metrics_file,
+                    limits=Limits(max_steps=args.max_steps, max_time=args.max_time, max_elements=args.max_elements))
+    elif args.command == 'profile':
+        profile_command(args.file, args.json, args.sort, args.top, args.optimize)
     elif args.command == 'lex':
         lexer_command(args.file, args.verbose)
+    elif args.command == 'dis':
+        dis_command(args.file, args.optimize)
+    elif args.command == 'compile':
+        compile_command(args.file, args.output, args.optimize)
+    elif args.command == 'check':
+        check_command(args.paths, args.jobs)
     elif args.command == 'repl':
         repl_command()
     elif args.command == 'info':
@@ -345,4 +575,7 @@ Beispiele:
         parser.print_help()
 
 if __name__ == "__main__":
+    # Nötig für den Prozess-Pool von 'check' in der PyInstaller-EXE
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
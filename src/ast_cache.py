@@ -0,0 +1,307 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+AST-Cache für GerLang 4.1.0
+Speichert geparste Programme als .gerlc-Dateien (ähnlich wie __pycache__)
+"""
+
+import gc
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from array import array
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import BinaryIO, Optional
+
+from parser import (
+    Program, BlockStatement, ExpressionStatement, VariableDeclaration,
+    IfStatement, WhileStatement, ForStatement, ReturnStatement, AssignmentStatement,
+    FunctionDeclaration, PrintStatement, TryCatchStatement, SetExpression,
+    ExportDeclaration, ImportDeclaration, ExportListDeclaration,
+    LiteralExpression, IdentifierExpression, BinaryExpression, UnaryExpression,
+    CallExpression, PropertyAccessExpression, MethodCallExpression,
+    ArrayLiteralExpression, ArrayAccessExpression, TemplateStringExpression,
+    TemplatePlan, SHARED_LITERALS
+)
+from interpreter import GERLANG_VERSION
+
+# Unterverzeichnis neben der Quelldatei, falls kein --cache-dir angegeben ist
+CACHE_DIR_NAME = "__gerlcache__"
+CACHE_SUFFIX = ".gerlc"
+
+# Blockgröße beim Hashen der Quelldatei (file_cache_key)
+HASH_CHUNK_SIZE = 1 << 16
+
+# Bei jeder Änderung am Format oder an _NODE_LAYOUTS erhöhen
+FORMAT_VERSION = 3
+MAGIC = b"GERLC"
+
+# (Klasse, Felder ohne Unterknoten, Felder mit Unterknoten). Die Reihenfolge
+# ist Teil des Dateiformats. Zeile/Spalte stehen immer vorne bei den Werten,
+# TemplatePlan wird beim Laden aus parts/expressions neu aufgebaut.
+_NODE_LAYOUTS = (
+    (Program, (), ("statements",)),
+    (BlockStatement, (), ("statements",)),
+    (ExpressionStatement, (), ("expression",)),
+    (VariableDeclaration, ("type_name", "name"), ("initializer",)),
+    (IfStatement, (), ("condition", "then_branch", "else_branch")),
+    (WhileStatement, (), ("condition", "body")),
+    (ForStatement, (), ("initializer", "condition", "increment", "body")),
+    (ReturnStatement, (), ("value",)),
+    (AssignmentStatement, ("name",), ("value",)),
+    (FunctionDeclaration, ("return_type", "name", "parameters", "pure"), ("body",)),
+    (PrintStatement, (), ("expression",)),
+    (TryCatchStatement, ("catch_var",), ("try_block", "catch_block")),
+    (SetExpression, (), ("target", "value")),
+    (ExportDeclaration, (), ("declaration",)),
+    (ImportDeclaration, ("names", "module"), ()),
+    (ExportListDeclaration, ("names",), ()),
+    (LiteralExpression, ("value", "type_name"), ()),
+    (IdentifierExpression, ("name",), ()),
+    (BinaryExpression, ("operator",), ("left", "right")),
+    (UnaryExpression, ("operator",), ("operand",)),
+    (CallExpression, (), ("function", "arguments")),
+    (PropertyAccessExpression, ("property_name",), ("object_expr",)),
+    (MethodCallExpression, ("method_name",), ("object_expr", "arguments")),
+    (ArrayLiteralExpression, (), ("elements",)),
+    (ArrayAccessExpression, (), ("array", "index")),
+    (TemplateStringExpression, ("parts",), ("expressions",)),
+)
+_SHARED_CODES = {id(node): code for code, node in enumerate(SHARED_LITERALS)}
+
+# Opcodes der flachen Postfix-Kodierung, Argument in den oberen Bits
+_CONST, _LIST, _NODE, _SHARED = range(4)
+_OP_BITS = 2
+_OP_MASK = (1 << _OP_BITS) - 1
+
+# Platzhalter für nicht gesetzte Positionen
+_UNSET = ...
+
+
+@contextmanager
+def _gc_paused():
+    """Garbage Collection aussetzen: der Baum enthält keine Zyklen, beim Auf-
+    und Abbau würden sonst nur wiederholt alle neuen Objekte durchlaufen"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class _Emit:
+    """Opcode (mit Werten), der erst nach den Unterknoten geschrieben wird"""
+    __slots__ = ("word", "values")
+
+    def __init__(self, word: int, values: tuple = ()):
+        self.word = word
+        self.values = values
+
+
+def dumps(program: Program) -> bytes:
+    """Serialisiert ein Program als flache Opcode-Folge plus Werteliste.
+
+    Die Kodierung ist iterativ (Postfix-Reihenfolge), auch sehr tief
+    verschachtelte Bäume brauchen daher keine Python-Rekursion. Felder ohne
+    Unterknoten landen direkt in der Werteliste, nur Unterknoten und Listen
+    von Unterknoten erzeugen eigene Opcodes.
+    """
+    with _gc_paused():
+        return marshal.dumps(_flatten(program))
+
+
+def _flatten(program: Program) -> tuple:
+    """Opcodes (als Bytes) und Werteliste in Postfix-Reihenfolge"""
+    code = array("I")
+    values = []
+    work = [program]
+    dump_layouts = _DUMP_LAYOUTS
+    while work:
+        item = work.pop()
+        kind = type(item)
+        layout = dump_layouts.get(kind)
+        if layout is not None:
+            shared = _SHARED_CODES.get(id(item))
+            if shared is not None and SHARED_LITERALS[shared] is item:
+                code.append(shared << _OP_BITS | _SHARED)
+                continue
+            word, get_values, get_children = layout
+            node_values = (getattr(item, "line", _UNSET), getattr(item, "column", _UNSET)) + get_values(item)
+            work.append(_Emit(word, node_values))
+            work.extend(get_children(item))
+        elif kind is _Emit:
+            code.append(item.word)
+            values.extend(item.values)
+        elif kind is list:
+            work.append(_Emit(len(item) << _OP_BITS | _LIST))
+            work.extend(reversed(item))
+        else:
+            code.append(_CONST)
+            values.append(item)
+    return code.tobytes(), values
+
+
+def _tuple_getter(fields: tuple):
+    """Wie attrgetter, liefert aber immer ein Tupel"""
+    if len(fields) > 1:
+        return attrgetter(*fields)
+    if fields:
+        name = fields[0]
+        return lambda node: (getattr(node, name),)
+    return lambda node: ()
+
+
+# Pro Klasse: (Opcode, Werte-Getter, Getter für Unterknoten in umgekehrter Reihenfolge)
+_DUMP_LAYOUTS = {
+    cls: (code << _OP_BITS | _NODE, _tuple_getter(value_fields), _tuple_getter(child_fields[::-1]))
+    for code, (cls, value_fields, child_fields) in enumerate(_NODE_LAYOUTS)
+}
+
+
+def loads(data: bytes) -> Program:
+    """Baut ein Program aus dumps()-Daten wieder auf"""
+    with _gc_paused():
+        return _build(*marshal.loads(data))
+
+
+def _build(raw_code: bytes, values: list) -> Program:
+    """Führt die Opcodes aus dumps() auf einem Wertestack aus"""
+    code = array("I")
+    code.frombytes(raw_code)
+    layouts = _NODE_LAYOUTS
+    new_node = object.__new__
+    stack = []
+    push = stack.append
+    position = 0
+    for word in code:
+        op = word & _OP_MASK
+        if op == _NODE:
+            cls, value_fields, child_fields = layouts[word >> _OP_BITS]
+            node = new_node(cls)
+            line = values[position]
+            if line is not _UNSET:
+                node.line = line
+                node.column = values[position + 1]
+            position += 2
+            for name in value_fields:
+                setattr(node, name, values[position])
+                position += 1
+            if child_fields:
+                count = len(child_fields)
+                for name, value in zip(child_fields, stack[-count:]):
+                    setattr(node, name, value)
+                del stack[-count:]
+            if cls is TemplateStringExpression:
+                node.plan = TemplatePlan(node.parts, node.expressions)
+            push(node)
+        elif op == _CONST:
+            push(values[position])
+            position += 1
+        elif op == _SHARED:
+            push(SHARED_LITERALS[word >> _OP_BITS])
+        else:
+            count = word >> _OP_BITS
+            if count:
+                items = stack[-count:]
+                del stack[-count:]
+                push(items)
+            else:
+                push([])
+    if len(stack) != 1 or not isinstance(stack[0], Program):
+        raise ValueError("Ungültige .gerlc-Daten")
+    return stack[0]
+
+
+def _key_hash():
+    return hashlib.sha256(f"{GERLANG_VERSION}:{FORMAT_VERSION}:{sys.implementation.cache_tag}\0".encode())
+
+
+def cache_key(source: bytes) -> bytes:
+    """Schlüssel aus Quelltext-Hash, Interpreter-, Format- und Python-Version"""
+    digest = _key_hash()
+    digest.update(source)
+    return digest.digest()
+
+
+def file_cache_key(file: BinaryIO, chunk_size: int = HASH_CHUNK_SIZE) -> bytes:
+    """cache_key() einer geöffneten Binärdatei, blockweise gelesen (ab der
+    aktuellen Position bis zum Ende, nie die ganze Datei im Speicher)"""
+    digest = _key_hash()
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return digest.digest()
+        digest.update(chunk)
+
+
+def cache_path(source_path: str, cache_dir: Optional[str] = None) -> str:
+    """Pfad der .gerlc-Datei zu einer Quelldatei.
+
+    Ohne cache_dir liegt sie in __gerlcache__ neben der Quelle. In einem
+    gemeinsamen cache_dir wird der absolute Quellpfad in den Namen
+    eingerechnet, damit gleichnamige Dateien sich nicht überschreiben.
+    """
+    source_path = os.path.abspath(source_path)
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    if cache_dir is None:
+        return os.path.join(os.path.dirname(source_path), CACHE_DIR_NAME, name + CACHE_SUFFIX)
+    path_hash = hashlib.sha256(source_path.encode("utf-8", "surrogateescape")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{name}-{path_hash}{CACHE_SUFFIX}")
+
+
+def load(source_path: str, key: bytes, cache_dir: Optional[str] = None) -> Optional[Program]:
+    """Liefert das gecachte Program oder None (fehlt, veraltet oder defekt).
+
+    key ist cache_key() bzw. file_cache_key() des aktuellen Quelltexts.
+    """
+    try:
+        with open(cache_path(source_path, cache_dir), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    header = MAGIC + key
+    if not data.startswith(header):
+        return None
+    try:
+        return loads(data[len(header):])
+    except Exception:
+        # Defekte Datei wie einen Cache-Fehlschlag behandeln, sie wird neu geschrieben
+        return None
+
+
+def store(source_path: str, key: bytes, program: Program, cache_dir: Optional[str] = None) -> bool:
+    """Schreibt das Program atomar (temporäre Datei + os.replace).
+
+    Parallele Schreiber überschreiben sich höchstens gegenseitig mit gleichem
+    Inhalt, Leser sehen nie eine halb geschriebene Datei. Fehler beim
+    Schreiben (z.B. fehlende Rechte) werden ignoriert.
+    """
+    path = cache_path(source_path, cache_dir)
+    try:
+        data = MAGIC + key + dumps(program)
+    except (ValueError, KeyError):
+        return False
+    directory = os.path.dirname(path)
+    temp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=CACHE_SUFFIX + ".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+        return True
+    except OSError:
+        if temp_path is not None:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+        return False
@@ -0,0 +1,514 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Bytecode-Compiler für GerLang 4.1.0
+Übersetzt den AST in kompakte Code-Objekte für die Stack-VM (vm.py)
+"""
+
+import operator
+from array import array
+from typing import Dict, List, Optional
+
+from parser import (
+    Program, FunctionDeclaration, BlockStatement, ExpressionStatement,
+    VariableDeclaration, AssignmentStatement, IfStatement, WhileStatement,
+    ForStatement, ReturnStatement, PrintStatement, TryCatchStatement,
+    ExportDeclaration, ImportDeclaration, ExportListDeclaration, SetExpression,
+    LiteralExpression, IdentifierExpression, BinaryExpression, UnaryExpression,
+    CallExpression, ArrayLiteralExpression, ArrayAccessExpression,
+    PropertyAccessExpression, MethodCallExpression, TemplateStringExpression
+)
+from resolver import mark_tail_calls
+
+# Opcodes, jeweils mit genau einem Argument (Index, Anzahl oder Sprungziel)
+OPCODE_NAMES = (
+    "CONST",          # Konstante constants[arg] auf den Stack
+    "LOAD_NAME",      # Variable names[arg] lesen (Environment.get)
+    "STORE_NAME",     # Oberstes Element an names[arg] zuweisen (Environment.assign)
+    "DEFINE_NAME",    # Oberstes Element als names[arg] definieren (Environment.define)
+    "POP",            # Oberstes Element verwerfen
+    "BINARY",         # Zwei Werte verknüpfen mit BINARY_OPERATORS[arg]
+    "BINARY_CONST",   # Wie BINARY mit Konstante rechts: arg = Konstanten-Index << 4 | Operator
+    "DIVIDE",         # Division mit Prüfung auf Null
+    "TRUTHY",         # Oberstes Element durch is_truthy ersetzen
+    "NOT",            # NICHT
+    "NEGATE",         # Unäres Minus
+    "JUMP",           # pc = arg
+    "JUMP_IF_FALSE",  # Wert holen, springen wenn nicht wahr
+    "JUMP_IF_TRUE",   # Wert holen, springen wenn wahr
+    "CALL",           # Funktionsaufruf, constants[arg] = (Name, Argumente, Zeile, Spalte)
+    "TAIL_CALL",      # ZURÜCK f(...) innerhalb von f, Argument wie bei CALL
+    "BUILD_LIST",     # arg Elemente zu einer KISTE
+    "INDEX",          # kiste[index]
+    "STORE_INDEX",    # kiste[index] = wert
+    "LENGTH",         # .LÄNGE
+    "METHOD",         # Methodenaufruf, constants[arg] = (Name, Argumente)
+    "TEMPLATE",       # Template-String, constants[arg] = (Textstücke, Slot-Indizes)
+    "PRINT",          # DRUCKE-Statement
+    "PUSH_SCOPE",     # Neues Environment für Block oder Schleife
+    "POP_SCOPE",      # Zurück zum umgebenden Environment
+    "SETUP_TRY",      # FANGE-Handler bei arg registrieren
+    "POP_TRY",        # Handler wieder entfernen
+    "RETURN",         # ZURÜCK mit dem obersten Element
+    "RAISE",          # Laufzeitfehler mit Meldung constants[arg]
+    "LOOP",           # Rücksprung einer Schleife: pc = arg (Schritt für governor.Limits)
+)
+for _code, _name in enumerate(OPCODE_NAMES):
+    globals()[_name] = _code
+del _code, _name
+
+# Binäroperatoren, die beide Seiten auswerten (Index = Argument von BINARY)
+BINARY_OPERATORS = ("+", "-", "*", "%", "==", "!=", "<", "<=", ">", ">=", "IST")
+BINARY_FUNCTIONS = (
+    operator.add, operator.sub, operator.mul, operator.mod,
+    operator.eq, operator.ne, operator.lt, operator.le, operator.gt, operator.ge,
+    operator.eq,
+)
+_BINARY_INDEX = {op: index for index, op in enumerate(BINARY_OPERATORS)}
+BINARY_CONST_BITS = 4
+BINARY_CONST_MASK = (1 << BINARY_CONST_BITS) - 1
+
+# Opcodes, deren Argument ein Sprungziel ist
+JUMP_OPCODES = frozenset((JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE, SETUP_TRY, LOOP))
+
+
+class CodeObject:
+    """Übersetzter Code einer Funktion, eines Statements oder einer Expression.
+
+    code enthält abwechselnd Opcode und Argument (array('i')), lines die
+    Quellzeile pro Instruktion (0 = unbekannt, Statements haben keine
+    Position). Konstanten und Namen liegen in eigenen Pools und werden über
+    ihren Index angesprochen.
+    """
+    __slots__ = ("name", "parameters", "is_function", "code", "lines", "constants", "names")
+
+    def __init__(self, name: str, parameters: tuple = (), is_function: bool = False):
+        self.name = name
+        self.parameters = parameters
+        self.is_function = is_function
+        self.code = array("i")
+        self.lines = array("i")
+        self.constants = []
+        self.names = []
+
+    def __repr__(self):
+        return f"<CodeObject {self.name}, {len(self.lines)} Instruktionen>"
+
+
+class BytecodeCompiler:
+    """Übersetzt AST-Knoten in CodeObjects.
+
+    Die Auswertungsreihenfolge und alle Fehlermeldungen entsprechen dem
+    Baum-Interpreter. Fehler unbekannter Knoten werden als RAISE übersetzt und
+    treten wie dort erst beim Ausführen auf.
+    """
+
+    def __init__(self):
+        self._code: Optional[CodeObject] = None
+        self._constant_index: Dict = {}
+        self._name_index: Dict[str, int] = {}
+        self._line = 0
+
+    # ===== Einstiegspunkte =====
+
+    def compile_program(self, program: Program):
+        """Übersetzt ein Programm: (Code der globalen Statements, {Name: Funktions-Code})"""
+        functions = {}
+        module = self._begin("<modul>")
+        for stmt in program.statements:
+            if isinstance(stmt, FunctionDeclaration):
+                functions[stmt.name] = stmt
+            else:
+                self._statement(stmt)
+        self._end()
+        return module, {name: self.compile_function(decl) for name, decl in functions.items()}
+
+    def compile_function(self, decl: FunctionDeclaration) -> CodeObject:
+        """Übersetzt eine Funktionsdeklaration.
+
+        Die Parameter liegen im Funktions-Environment, der Funktionsrumpf
+        braucht daher kein eigenes Environment mehr (nicht von außen sichtbar).
+        Endaufrufe der Funktion selbst werden zu TAIL_CALL.
+        """
+        mark_tail_calls(decl)
+        code = self._begin(decl.name, tuple(name for _, name in decl.parameters), True)
+        body = decl.body
+        if isinstance(body, BlockStatement):
+            for stmt in body.statements:
+                self._statement(stmt)
+        else:
+            self._statement(body)
+        self._end()
+        return code
+
+    def compile_statement(self, stmt) -> CodeObject:
+        """Übersetzt ein einzelnes (globales) Statement"""
+        code = self._begin(f"<{type(stmt).__name__}>")
+        self._statement(stmt)
+        self._end()
+        return code
+
+    def compile_expression(self, expr) -> CodeObject:
+        """Übersetzt eine Expression, ihr Wert bleibt am Ende auf dem Stack"""
+        code = self._begin(f"<{type(expr).__name__}>")
+        self._expression(expr)
+        self._end()
+        return code
+
+    # ===== Ausgabe =====
+
+    def _begin(self, name: str, parameters: tuple = (), is_function: bool = False) -> CodeObject:
+        self._code = CodeObject(name, parameters, is_function)
+        self._constant_index = {}
+        self._name_index = {}
+        self._line = 0
+        return self._code
+
+    def _end(self):
+        self._code = None
+
+    def _emit(self, op: int, arg: int = 0) -> int:
+        """Hängt eine Instruktion an und liefert ihre Position (für Sprünge)"""
+        code = self._code
+        position = len(code.code)
+        code.code.append(op)
+        code.code.append(arg)
+        code.lines.append(self._line)
+        return position
+
+    def _patch(self, position: int, target: Optional[int] = None):
+        """Setzt das Sprungziel einer Instruktion (Standard: aktuelle Position)"""
+        self._code.code[position + 1] = len(self._code.code) if target is None else target
+
+    def _constant(self, value) -> int:
+        # Nach Typ und Wert zusammenfassen (1, 1.0 und JA sind verschiedene Konstanten)
+        try:
+            key = (type(value), value)
+            index = self._constant_index.get(key)
+        except TypeError:
+            key = index = None
+        if index is None:
+            index = len(self._code.constants)
+            self._code.constants.append(value)
+            if key is not None:
+                self._constant_index[key] = index
+        return index
+
+    def _name(self, name: str) -> int:
+        index = self._name_index.get(name)
+        if index is None:
+            index = self._name_index[name] = len(self._code.names)
+            self._code.names.append(name)
+        return index
+
+    def _raise(self, message: str):
+        self._emit(RAISE, self._constant(message))
+
+    # ===== Statements =====
+
+    def _statement(self, stmt):
+        # Geteilte und gefaltete Literale tragen Zeile 0, die Zeile kommt von der Anweisung
+        line = getattr(stmt, "line", 0)
+        if line:
+            self._line = line
+        compiler = _STATEMENT_COMPILERS.get(type(stmt))
+        if compiler is None:
+            self._raise(f"Unbekannter Statement-Typ: {type(stmt).__name__}")
+        else:
+            compiler(self, stmt)
+
+    def _block(self, stmt):
+        self._emit(PUSH_SCOPE)
+        for s in stmt.statements:
+            self._statement(s)
+        self._emit(POP_SCOPE)
+
+    def _expression_statement(self, stmt):
+        self._expression(stmt.expression)
+        self._emit(POP)
+
+    def _variable_declaration(self, stmt):
+        if stmt.initializer:
+            self._expression(stmt.initializer)
+        else:
+            self._emit(CONST, self._constant(None))
+        self._emit(DEFINE_NAME, self._name(stmt.name))
+
+    def _assignment(self, stmt):
+        self._expression(stmt.value)
+        self._emit(STORE_NAME, self._name(stmt.name))
+
+    def _set(self, stmt):
+        target = stmt.target
+        if isinstance(target, IdentifierExpression):
+            self._expression(stmt.value)
+            self._emit(STORE_NAME, self._name(target.name))
+        elif isinstance(target, ArrayAccessExpression):
+            self._expression(target.array)
+            self._expression(target.index)
+            self._expression(stmt.value)
+            self._emit(STORE_INDEX)
+        else:
+            self._raise("Zuweisung nur an Variablen oder KISTE-Elemente möglich")
+
+    def _if(self, stmt):
+        self._expression(stmt.condition)
+        to_else = self._emit(JUMP_IF_FALSE)
+        self._statement(stmt.then_branch)
+        if stmt.else_branch:
+            to_end = self._emit(JUMP)
+            self._patch(to_else)
+            self._statement(stmt.else_branch)
+            self._patch(to_end)
+        else:
+            self._patch(to_else)
+
+    def _while(self, stmt):
+        start = len(self._code.code)
+        self._expression(stmt.condition)
+        to_end = self._emit(JUMP_IF_FALSE)
+        self._statement(stmt.body)
+        self._loop(stmt, start)
+        self._patch(to_end)
+
+    def _for(self, stmt):
+        self._emit(PUSH_SCOPE)
+        if stmt.initializer:
+            self._statement(stmt.initializer)
+        start = len(self._code.code)
+        to_end = None
+        if stmt.condition:
+            self._expression(stmt.condition)
+            to_end = self._emit(JUMP_IF_FALSE)
+        self._statement(stmt.body)
+        if stmt.increment:
+            if isinstance(stmt.increment, (AssignmentStatement, ExpressionStatement)):
+                self._statement(stmt.increment)
+            else:
+                self._expression(stmt.increment)
+                self._emit(POP)
+        self._loop(stmt, start)
+        if to_end is not None:
+            self._patch(to_end)
+        self._emit(POP_SCOPE)
+
+    def _loop(self, stmt, start: int):
+        """Rücksprung zum Schleifenanfang, in der Zeile der Schleife"""
+        self._line = getattr(stmt, "line", 0) or self._line
+        self._emit(LOOP, start)
+
+    def _return(self, stmt):
+        value = stmt.value
+        if type(value) is CallExpression and getattr(value, "tail_call", False):
+            for arg in value.arguments:
+                self._expression(arg)
+            self._line = value.line
+            self._emit(TAIL_CALL, self._constant((value.function.name, len(value.arguments), value.line, value.column)))
+            return
+        if stmt.value:
+            self._expression(stmt.value)
+        else:
+            self._emit(CONST, self._constant(None))
+        self._emit(RETURN)
+
+    def _print(self, stmt):
+        self._expression(stmt.expression)
+        self._emit(PRINT)
+
+    def _try_catch(self, stmt):
+        # Der Handler findet die Fehlermeldung (str(e)) oben auf dem Stack
+        setup = self._emit(SETUP_TRY)
+        self._statement(stmt.try_block)
+        self._emit(POP_TRY)
+        to_end = self._emit(JUMP)
+        self._patch(setup)
+        if stmt.catch_var:
+            self._emit(PUSH_SCOPE)
+            self._emit(DEFINE_NAME, self._name(stmt.catch_var))
+            self._statement(stmt.catch_block)
+            self._emit(POP_SCOPE)
+        else:
+            self._emit(POP)
+            self._statement(stmt.catch_block)
+        self._patch(to_end)
+
+    def _noop(self, stmt):
+        # Import/Export werden (wie im Baum-Interpreter) noch nicht ausgeführt
+        pass
+
+    # ===== Expressions =====
+
+    def _expression(self, expr):
+        line = getattr(expr, "line", None)
+        if line:
+            self._line = line
+        compiler = _EXPRESSION_COMPILERS.get(type(expr))
+        if compiler is None:
+            self._raise(f"Unbekannter Expression-Typ: {type(expr).__name__}")
+            return
+        compiler(self, expr)
+
+    def _literal(self, expr):
+        self._emit(CONST, self._constant(expr.value))
+
+    def _identifier(self, expr):
+        self._emit(LOAD_NAME, self._name(expr.name))
+
+    def _binary(self, expr):
+        op = expr.operator
+        self._expression(expr.left)
+        # Short-circuit evaluation für logische Operatoren
+        if op in ("UND", "ODER"):
+            short = self._emit(JUMP_IF_FALSE if op == "UND" else JUMP_IF_TRUE)
+            self._expression(expr.right)
+            self._emit(TRUTHY)
+            to_end = self._emit(JUMP)
+            self._patch(short)
+            self._emit(CONST, self._constant(op == "ODER"))
+            self._patch(to_end)
+            return
+        right = expr.right
+        if op in _BINARY_INDEX and type(right) is LiteralExpression:
+            # Häufigster Fall (i < n, i + 1, x % 2): eine Instruktion weniger
+            self._emit(BINARY_CONST, self._constant(right.value) << BINARY_CONST_BITS | _BINARY_INDEX[op])
+            return
+        self._expression(right)
+        if op == "/":
+            self._emit(DIVIDE)
+        elif op in _BINARY_INDEX:
+            self._emit(BINARY, _BINARY_INDEX[op])
+        else:
+            self._emit(POP)
+            self._emit(POP)
+            self._raise(f"Unbekannter binärer Operator: {op}")
+
+    def _unary(self, expr):
+        self._expression(expr.operand)
+        if expr.operator == "-":
+            self._emit(NEGATE)
+        elif expr.operator == "NICHT":
+            self._emit(NOT)
+        else:
+            self._emit(POP)
+            self._raise(f"Unbekannter unärer Operator: {expr.operator}")
+
+    def _call(self, expr):
+        for arg in expr.arguments:
+            self._expression(arg)
+        if not hasattr(expr.function, 'name'):
+            for _ in expr.arguments:
+                self._emit(POP)
+            self._raise("Komplexe Funktionsausdrücke noch nicht unterstützt")
+            return
+        self._line = expr.line
+        site = (expr.function.name, len(expr.arguments), expr.line, expr.column)
+        self._emit(CALL, self._constant(site))
+
+    def _array_literal(self, expr):
+        for element in expr.elements:
+            self._expression(element)
+        self._emit(BUILD_LIST, len(expr.elements))
+
+    def _array_access(self, expr):
+        self._expression(expr.array)
+        self._expression(expr.index)
+        self._emit(INDEX)
+
+    def _property_access(self, expr):
+        self._expression(expr.object_expr)
+        if expr.property_name == "LÄNGE":
+            self._emit(LENGTH)
+        else:
+            self._emit(POP)
+            self._raise(f"Unbekannte Property: {expr.property_name}")
+
+    def _method_call(self, expr):
+        self._expression(expr.object_expr)
+        for arg in expr.arguments:
+            self._expression(arg)
+        self._emit(METHOD, self._constant((expr.method_name, len(expr.arguments))))
+
+    def _template_string(self, expr):
+        plan = expr.plan
+        for _, slot_expr in plan.slots:
+            self._expression(slot_expr)
+        indices = tuple(index for index, _ in plan.slots)
+        # Slot-Ausdrücke tragen Positionen aus dem Template-Text, TEMPLATE die des Strings
+        self._line = expr.line or self._line
+        self._emit(TEMPLATE, self._constant((tuple(plan.pieces), indices)))
+
+
+_STATEMENT_COMPILERS = {
+    BlockStatement: BytecodeCompiler._block,
+    ExpressionStatement: BytecodeCompiler._expression_statement,
+    VariableDeclaration: BytecodeCompiler._variable_declaration,
+    AssignmentStatement: BytecodeCompiler._assignment,
+    SetExpression: BytecodeCompiler._set,
+    IfStatement: BytecodeCompiler._if,
+    WhileStatement: BytecodeCompiler._while,
+    ForStatement: BytecodeCompiler._for,
+    ReturnStatement: BytecodeCompiler._return,
+    PrintStatement: BytecodeCompiler._print,
+    TryCatchStatement: BytecodeCompiler._try_catch,
+    ExportDeclaration: BytecodeCompiler._noop,
+    ImportDeclaration: BytecodeCompiler._noop,
+    ExportListDeclaration: BytecodeCompiler._noop,
+}
+
+_EXPRESSION_COMPILERS = {
+    LiteralExpression: BytecodeCompiler._literal,
+    IdentifierExpression: BytecodeCompiler._identifier,
+    BinaryExpression: BytecodeCompiler._binary,
+    UnaryExpression: BytecodeCompiler._unary,
+    CallExpression: BytecodeCompiler._call,
+    ArrayLiteralExpression: BytecodeCompiler._array_literal,
+    ArrayAccessExpression: BytecodeCompiler._array_access,
+    PropertyAccessExpression: BytecodeCompiler._property_access,
+    MethodCallExpression: BytecodeCompiler._method_call,
+    TemplateStringExpression: BytecodeCompiler._template_string,
+}
+
+
+def disassemble(code: CodeObject) -> str:
+    """Lesbare Darstellung eines CodeObjects (für `gerlang dis`)"""
+    title = f"Code-Objekt {code.name}"
+    if code.is_function:
+        title += f"({', '.join(code.parameters)})"
+    lines: List[str] = [title]
+    targets = {code.code[i + 1] for i in range(0, len(code.code), 2) if code.code[i] in JUMP_OPCODES}
+    previous_line = None
+    for i in range(0, len(code.code), 2):
+        op, arg = code.code[i], code.code[i + 1]
+        line = code.lines[i // 2]
+        line_text = str(line) if line and line != previous_line else ""
+        previous_line = line or previous_line
+        marker = ">>" if i in targets else ""
+        lines.append(f"{line_text:>5} {marker:>2} {i:>5} {OPCODE_NAMES[op]:<14} {arg:>4} {_describe(code, op, arg)}".rstrip())
+    return "\n".join(lines)
+
+
+def _describe(code: CodeObject, op: int, arg: int) -> str:
+    """Erklärung des Arguments in Klammern (Konstante, Name, Ziel, ...)"""
+    if op in (CONST, RAISE):
+        return f"({code.constants[arg]!r})"
+    if op in (LOAD_NAME, STORE_NAME, DEFINE_NAME):
+        return f"({code.names[arg]})"
+    if op == BINARY:
+        return f"({BINARY_OPERATORS[arg]})"
+    if op == BINARY_CONST:
+        return f"({BINARY_OPERATORS[arg & BINARY_CONST_MASK]} {code.constants[arg >> BINARY_CONST_BITS]!r})"
+    if op in JUMP_OPCODES:
+        return f"(zu {arg})"
+    if op in (CALL, TAIL_CALL):
+        name, argc, line, column = code.constants[arg]
+        return f"({name}, {argc} Argumente, {line}:{column})"
+    if op == METHOD:
+        name, argc = code.constants[arg]
+        return f"({name}, {argc} Argumente)"
+    if op == TEMPLATE:
+        pieces, indices = code.constants[arg]
+        return f"({len(indices)} Slots)"
+    return ""
@@ -4,7 +4,7 @@
 # https://opensource.org/licenses/MIT
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 @dataclass
 class CallFrame:
@@ -13,6 +13,11 @@ class CallFrame:
     file_path: str
     line: int
     column: int
+    tail_calls: int = 0  # Wie oft der Frame für Endaufrufe wiederverwendet wurde
+
+    def describe(self) -> str:
+        """Hinweis für Stack-Traces, falls der Frame wiederverwendet wurde"""
+        return f" ({self.tail_calls}x per Endaufruf wiederverwendet)" if self.tail_calls else ""
 
 @dataclass 
 class RuntimeError(Exception):
@@ -31,6 +36,17 @@ class RuntimeError(Exception):
         self.column = column
         self.call_stack = call_stack or []
 
+def collapse_frames(frames: List[CallFrame]) -> List[Tuple[CallFrame, int]]:
+    """Fasst direkt aufeinanderfolgende gleiche Frames (tiefe Rekursion) zu
+    (Frame, Anzahl) zusammen, damit Stack-Traces lesbar bleiben"""
+    collapsed = []
+    for frame in frames:
+        if collapsed and collapsed[-1][0] == frame:
+            collapsed[-1][1] += 1
+        else:
+            collapsed.append([frame, 1])
+    return [(frame, count) for frame, count in collapsed]
+
 class CallStack:
     """Verwaltet den Call-Stack für bessere Fehlermeldungen"""
     
@@ -42,6 +58,10 @@ class CallStack:
         frame = CallFrame(function_name, file_path, line, column)
         self.frames.append(frame)
     
+    def reuse(self):
+        """Zählt einen Endaufruf, der den obersten Frame wiederverwendet"""
+        self.frames[-1].tail_calls += 1
+    
     def pop(self):
         """Entfernt den obersten Frame vom Call-Stack"""
         if self.frames:
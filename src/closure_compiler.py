@@ -0,0 +1,588 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Closure-Compiler für GerLang 4.1.0
+Übersetzt AST-Knoten einmalig in verschachtelte Python-Closures
+"""
+
+import operator
+
+from parser import (
+    BlockStatement, ExpressionStatement, VariableDeclaration, AssignmentStatement,
+    IfStatement, WhileStatement, ForStatement, ReturnStatement, PrintStatement,
+    TryCatchStatement, ExportDeclaration, ImportDeclaration, ExportListDeclaration,
+    SetExpression, LiteralExpression, IdentifierExpression, BinaryExpression,
+    UnaryExpression, CallExpression, ArrayLiteralExpression, ArrayAccessExpression,
+    PropertyAccessExpression, MethodCallExpression, TemplateStringExpression
+)
+from resolver import counted_loop
+from statement_executor import ReturnSignal
+from expression_evaluator import _TEMPLATE_FORMATTERS
+from call_stack import RuntimeError as GerLangRuntimeError
+from kiste import KISTE_TYPES, SIZED_TYPES, check_element, check_elements, printable
+from governor import ResourceLimitError, locate
+
+
+# Binäroperatoren, die beide Seiten auswerten und direkt rechnen
+_BINARY_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "%": operator.mod,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "IST": operator.eq,
+}
+
+
+class ClosureCompiler:
+    """Ersetzt StatementExecutor und ExpressionEvaluator (--engine=closure).
+
+    Jeder Knoten wird beim ersten Ausführen samt Unterbaum in eine Closure
+    übersetzt, in der Operator, Kinder und Namen schon gebunden sind. Danach
+    kostet ein Knotenbesuch nur noch einen Python-Aufruf statt Import und
+    isinstance-Kette. Verhalten und Fehlermeldungen entsprechen dem
+    Baum-Interpreter, auch Fehler unbekannter Knoten treten erst zur
+    Laufzeit auf.
+    """
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self._compiled = {}
+        self._statement_compilers = {
+            BlockStatement: self._compile_block,
+            ExpressionStatement: self._compile_expression_statement,
+            VariableDeclaration: self._compile_variable_declaration,
+            AssignmentStatement: self._compile_assignment,
+            SetExpression: self._compile_set,
+            IfStatement: self._compile_if,
+            WhileStatement: self._compile_while,
+            ForStatement: self._compile_for,
+            ReturnStatement: self._compile_return,
+            PrintStatement: self._compile_print,
+            TryCatchStatement: self._compile_try_catch,
+            ExportDeclaration: self._compile_noop,
+            ImportDeclaration: self._compile_noop,
+            ExportListDeclaration: self._compile_noop,
+        }
+        self._expression_compilers = {
+            LiteralExpression: self._compile_literal,
+            IdentifierExpression: self._compile_identifier,
+            BinaryExpression: self._compile_binary,
+            UnaryExpression: self._compile_unary,
+            CallExpression: self._compile_call,
+            ArrayLiteralExpression: self._compile_array_literal,
+            ArrayAccessExpression: self._compile_array_access,
+            PropertyAccessExpression: self._compile_property_access,
+            MethodCallExpression: self._compile_method_call,
+            TemplateStringExpression: self._compile_template_string,
+        }
+
+    # ===== Schnittstelle wie StatementExecutor / ExpressionEvaluator =====
+
+    def execute(self, stmt):
+        """Führt ein Statement über seine (gecachte) Closure aus"""
+        run = self._compiled.get(stmt)
+        if run is None:
+            run = self._compiled[stmt] = self.compile_statement(stmt)
+        return run()
+
+    def evaluate(self, expr):
+        """Evaluiert eine Expression über ihre (gecachte) Closure"""
+        run = self._compiled.get(expr)
+        if run is None:
+            run = self._compiled[expr] = self.compile_expression(expr)
+        return run()
+
+    def compile_statement(self, stmt):
+        """Übersetzt ein Statement in eine Closure ohne Argumente"""
+        compiler = self._statement_compilers.get(type(stmt))
+        if compiler is None:
+            message = f"Unbekannter Statement-Typ: {type(stmt).__name__}"
+            def run():
+                raise GerLangRuntimeError(message)
+            return run
+        return compiler(stmt)
+
+    def compile_expression(self, expr):
+        """Übersetzt eine Expression in eine Closure, die ihren Wert liefert"""
+        compiler = self._expression_compilers.get(type(expr))
+        if compiler is None:
+            message = f"Unbekannter Expression-Typ: {type(expr).__name__}"
+            def run():
+                raise GerLangRuntimeError(message)
+            return run
+        return compiler(expr)
+
+    # ===== Statements =====
+
+    def _compile_block(self, stmt):
+        interpreter = self.interpreter
+        statements = tuple(self.compile_statement(s) for s in stmt.statements)
+
+        def run():
+            # Neue Scope für Block erstellen
+            previous_env = interpreter.env
+            interpreter.env = interpreter.new_environment(previous_env)
+            try:
+                for statement in statements:
+                    statement()
+            finally:
+                interpreter.env = previous_env
+        return run
+
+    def _compile_expression_statement(self, stmt):
+        expression = self.compile_expression(stmt.expression)
+
+        def run():
+            expression()
+        return run
+
+    def _compile_variable_declaration(self, stmt):
+        interpreter = self.interpreter
+        name = stmt.name
+        if stmt.initializer:
+            initializer = self.compile_expression(stmt.initializer)
+
+            def run():
+                value = initializer()
+                interpreter.env.define(name, value)
+        else:
+            def run():
+                interpreter.env.define(name, None)
+        return run
+
+    def _compile_assignment(self, stmt):
+        interpreter = self.interpreter
+        name = stmt.name
+        value = self.compile_expression(stmt.value)
+
+        def run():
+            result = value()
+            interpreter.env.assign(name, result)
+        return run
+
+    def _compile_set(self, stmt):
+        interpreter = self.interpreter
+        value = self.compile_expression(stmt.value)
+        target = stmt.target
+        if isinstance(target, IdentifierExpression):
+            name = target.name
+
+            def run():
+                result = value()
+                interpreter.env.assign(name, result)
+            return run
+        if isinstance(target, ArrayAccessExpression):
+            array_expr = self.compile_expression(target.array)
+            index_expr = self.compile_expression(target.index)
+
+            def run():
+                array = array_expr()
+                index = index_expr()
+                _set_element(array, index, value())
+            return run
+
+        def run():
+            raise GerLangRuntimeError("Zuweisung nur an Variablen oder KISTE-Elemente möglich")
+        return run
+
+    def _compile_if(self, stmt):
+        is_truthy = self.interpreter.is_truthy
+        condition = self.compile_expression(stmt.condition)
+        then_branch = self.compile_statement(stmt.then_branch)
+        if stmt.else_branch:
+            else_branch = self.compile_statement(stmt.else_branch)
+
+            def run():
+                if is_truthy(condition()):
+                    then_branch()
+                else:
+                    else_branch()
+        else:
+            def run():
+                if is_truthy(condition()):
+                    then_branch()
+        return run
+
+    def _compile_while(self, stmt):
+        is_truthy = self.interpreter.is_truthy
+        condition = self.compile_expression(stmt.condition)
+        body = self.compile_statement(stmt.body)
+        governor = self.interpreter.governor
+
+        def run():
+            while is_truthy(condition()):
+                body()
+                if governor is not None:
+                    # Governor.tick ohne eigenen Python-Aufruf
+                    governor.countdown -= 1
+                    if governor.countdown <= 0:
+                        governor.check(stmt)
+        return run
+
+    def _compile_for(self, stmt):
+        interpreter = self.interpreter
+        is_truthy = interpreter.is_truthy
+        initializer = self.compile_statement(stmt.initializer) if stmt.initializer else None
+        condition = self.compile_expression(stmt.condition) if stmt.condition else None
+        body = self.compile_statement(stmt.body)
+        increment = None
+        if stmt.increment:
+            if isinstance(stmt.increment, (AssignmentStatement, ExpressionStatement)):
+                increment = self.compile_statement(stmt.increment)
+            else:
+                increment = self.compile_expression(stmt.increment)
+        counted = counted_loop(stmt)
+        if counted is not None:
+            run_counted = self._compile_counted(stmt, counted, body)
+        governor = interpreter.governor
+
+        def run():
+            # For-Loop Scope
+            previous_env = interpreter.env
+            interpreter.env = interpreter.new_environment(previous_env)
+            try:
+                if initializer:
+                    initializer()
+                if counted is not None and run_counted():
+                    return
+                while True:
+                    if condition and not is_truthy(condition()):
+                        break
+                    body()
+                    if increment:
+                        increment()
+                    if governor is not None:
+                        governor.countdown -= 1
+                        if governor.countdown <= 0:
+                            governor.check(stmt)
+            finally:
+                interpreter.env = previous_env
+        return run
+
+    def _compile_counted(self, stmt, counted, body):
+        """Zählschleife als range (siehe StatementExecutor._execute_counted).
+
+        Die Closure läuft nach dem Initializer im Scope der Schleife und gibt
+        False zurück, wenn die normale Schleife übernehmen muss.
+        """
+        interpreter = self.interpreter
+        name = counted.name
+        bound = self.compile_expression(counted.bound)
+        end_offset = counted.end_offset
+        step = counted.step
+        local_names = tuple(identifier.name for identifier in counted.local_names)
+        governor = interpreter.governor
+
+        def run():
+            env = interpreter.env
+            variables = env.vars
+            start = variables.get(name)
+            if type(start) is not int:
+                return False
+            for local_name in local_names:
+                owner = env
+                while owner is not None and local_name not in owner.vars:
+                    owner = owner.parent
+                if owner is None or owner is interpreter.globals:
+                    return False
+            stop = bound()
+            if type(stop) is not int:
+                return False
+            for value in range(start, stop + end_offset, step):
+                variables[name] = value
+                body()
+                if governor is not None:
+                    governor.countdown -= 1
+                    if governor.countdown <= 0:
+                        governor.check(stmt)
+            return True
+        return run
+
+    def _compile_return(self, stmt):
+        if stmt.value:
+            value = self.compile_expression(stmt.value)
+
+            def run():
+                raise ReturnSignal(value())
+        else:
+            def run():
+                raise ReturnSignal(None)
+        return run
+
+    def _compile_print(self, stmt):
+        expression = self.compile_expression(stmt.expression)
+        governor = self.interpreter.governor
+        if governor is not None:
+            def run():
+                value = expression()
+                governor.check_shown(value, stmt)
+                print(printable(value))
+            return run
+
+        def run():
+            print(printable(expression()))
+        return run
+
+    def _compile_try_catch(self, stmt):
+        interpreter = self.interpreter
+        try_block = self.compile_statement(stmt.try_block)
+        catch_block = self.compile_statement(stmt.catch_block)
+        catch_var = stmt.catch_var
+
+        def run():
+            try:
+                try_block()
+            except Exception as e:
+                for listener in interpreter.hooks.listeners["catch"]:
+                    listener(e)
+                if catch_var:
+                    # Fehler-Variable im neuen Scope setzen
+                    previous_env = interpreter.env
+                    catch_env = interpreter.new_environment(previous_env)
+                    catch_env.define(catch_var, str(e))
+                    interpreter.env = catch_env
+                    try:
+                        catch_block()
+                    finally:
+                        interpreter.env = previous_env
+                else:
+                    catch_block()
+        return run
+
+    def _compile_noop(self, stmt):
+        # Import/Export werden (wie im Baum-Interpreter) noch nicht ausgeführt
+        def run():
+            pass
+        return run
+
+    # ===== Expressions =====
+
+    def _compile_literal(self, expr):
+        value = expr.value
+
+        def run():
+            return value
+        return run
+
+    def _compile_identifier(self, expr):
+        interpreter = self.interpreter
+        name = expr.name
+
+        def run():
+            return interpreter.env.get(name)
+        return run
+
+    def _compile_binary(self, expr):
+        is_truthy = self.interpreter.is_truthy
+        left = self.compile_expression(expr.left)
+        right = self.compile_expression(expr.right)
+        op = expr.operator
+
+        # Short-circuit evaluation für logische Operatoren
+        if op == "UND":
+            def run():
+                if not is_truthy(left()):
+                    return False
+                return is_truthy(right())
+        elif op == "ODER":
+            def run():
+                if is_truthy(left()):
+                    return True
+                return is_truthy(right())
+        elif op == "/":
+            def run():
+                dividend = left()
+                divisor = right()
+                if divisor == 0:
+                    raise GerLangRuntimeError("Division durch Null")
+                return dividend / divisor
+        elif op in _BINARY_OPERATORS:
+            function = _BINARY_OPERATORS[op]
+            governor = self.interpreter.governor
+            checked = governor.operator(op) if governor is not None else None
+            if checked is not None:
+                # + und * prüfen die Größe von KISTEN/WORTEN (Limits.max_elements)
+                def run():
+                    return checked(left(), right(), expr)
+            else:
+                def run():
+                    return function(left(), right())
+        else:
+            message = f"Unbekannter binärer Operator: {op}"
+
+            def run():
+                left()
+                right()
+                raise GerLangRuntimeError(message)
+        return run
+
+    def _compile_unary(self, expr):
+        is_truthy = self.interpreter.is_truthy
+        operand = self.compile_expression(expr.operand)
+        op = expr.operator
+
+        if op == "-":
+            def run():
+                return -operand()
+        elif op == "NICHT":
+            def run():
+                return not is_truthy(operand())
+        else:
+            message = f"Unbekannter unärer Operator: {op}"
+
+            def run():
+                operand()
+                raise GerLangRuntimeError(message)
+        return run
+
+    def _compile_call(self, expr):
+        interpreter = self.interpreter
+        arguments = tuple(self.compile_expression(arg) for arg in expr.arguments)
+
+        if not hasattr(expr.function, 'name'):
+            def run():
+                for argument in arguments:
+                    argument()
+                raise GerLangRuntimeError("Komplexe Funktionsausdrücke noch nicht unterstützt")
+            return run
+
+        func_name = expr.function.name
+        functions = interpreter.functions
+        call_function = interpreter.call_function
+        argc = len(arguments)
+
+        def run():
+            args = [argument() for argument in arguments]
+            # Built-in Funktionen (oder aufrufbare Variablen) haben Vorrang
+            env = interpreter.env
+            if env.has(func_name):
+                func = env.get(func_name)
+                if callable(func):
+                    try:
+                        return func(*args)
+                    except ResourceLimitError as e:
+                        # Limits (z.B. NEUE_KISTE) bleiben GL010, an der Aufrufstelle
+                        raise locate(e, expr.line, expr.column)
+                    except Exception as e:
+                        raise GerLangRuntimeError(f"Fehler in Built-in Funktion '{func_name}': {e}")
+            # Benutzerdefinierte Funktion (Fehlermeldungen über execute_function)
+            func = functions.get(func_name)
+            if func is not None and len(func.parameters) == argc:
+                return call_function(func, args, expr)
+            return interpreter.execute_function(func_name, args, expr)
+        return run
+
+    def _compile_array_literal(self, expr):
+        elements = tuple(self.compile_expression(element) for element in expr.elements)
+
+        def run():
+            return [element() for element in elements]
+        return run
+
+    def _compile_array_access(self, expr):
+        array_expr = self.compile_expression(expr.array)
+        index_expr = self.compile_expression(expr.index)
+
+        def run():
+            array = array_expr()
+            index = index_expr()
+            if not isinstance(array, KISTE_TYPES):
+                raise GerLangRuntimeError("Array-Zugriff nur auf KISTE möglich")
+            try:
+                index_int = int(index)
+                if index_int < 0 or index_int >= len(array):
+                    raise GerLangRuntimeError(f"Array-Index {index_int} außerhalb der Grenzen")
+                return array[index_int]
+            except (TypeError, ValueError):
+                raise GerLangRuntimeError("Array-Index muss eine Zahl sein")
+        return run
+
+    def _compile_property_access(self, expr):
+        object_expr = self.compile_expression(expr.object_expr)
+        property_name = expr.property_name
+
+        if property_name == "LÄNGE":
+            def run():
+                obj = object_expr()
+                if isinstance(obj, SIZED_TYPES):
+                    return len(obj)
+                raise GerLangRuntimeError("LÄNGE nur für KISTE oder WORT verfügbar")
+        else:
+            message = f"Unbekannte Property: {property_name}"
+
+            def run():
+                object_expr()
+                raise GerLangRuntimeError(message)
+        return run
+
+    def _compile_method_call(self, expr):
+        object_expr = self.compile_expression(expr.object_expr)
+        arguments = tuple(self.compile_expression(arg) for arg in expr.arguments)
+        method_name = expr.method_name
+        governor = self.interpreter.governor
+
+        def run():
+            obj = object_expr()
+            args = [argument() for argument in arguments]
+            if not isinstance(obj, KISTE_TYPES):
+                raise GerLangRuntimeError(f"Methoden-Aufruf nur für KISTE möglich")
+            if method_name in ("HINZUFÜGEN", "ERWEITERN"):
+                check_elements(obj, args)
+            if method_name == "HINZUFÜGEN":
+                for arg in args:
+                    obj.insert(0, arg)  # Am Anfang einfügen
+            elif method_name == "ERWEITERN":
+                for arg in args:
+                    obj.append(arg)  # Am Ende anhängen
+            else:
+                raise GerLangRuntimeError(f"Unbekannte Methode für KISTE: {method_name}")
+            if governor is not None:
+                governor.check_size(obj, node=expr)
+            return None
+        return run
+
+    def _compile_template_string(self, expr):
+        plan = expr.plan
+        pieces = plan.pieces
+        slots = tuple((index, self.compile_expression(slot_expr)) for index, slot_expr in plan.slots)
+        formatters = _TEMPLATE_FORMATTERS
+        governor = self.interpreter.governor
+
+        def run():
+            result = pieces.copy()
+            for index, slot in slots:
+                value = slot()
+                if governor is not None:
+                    governor.check_shown(value, expr)
+                formatter = formatters.get(type(value))
+                result[index] = formatter(value) if formatter else str(value)
+            text = "".join(result)
+            if governor is not None:
+                governor.check_size(text, node=expr)
+            return text
+        return run
+
+
+def _set_element(array, index, value):
+    """Setzt ein KISTE-Element mit denselben Prüfungen wie der Lesezugriff"""
+    if type(array) is not list:
+        if not isinstance(array, KISTE_TYPES):
+            raise GerLangRuntimeError("Set-Operation nur auf KISTE möglich")
+        value = check_element(array, value)
+    try:
+        index_int = int(index)
+        if index_int < 0 or index_int >= len(array):
+            raise GerLangRuntimeError(f"Array-Index {index_int} außerhalb der Grenzen")
+        array[index_int] = value
+        return value
+    except (TypeError, ValueError):
+        raise GerLangRuntimeError("Array-Index muss eine Zahl sein")
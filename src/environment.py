@@ -8,8 +8,13 @@ Environment-Management für GerLang 4.1.0
 Verwaltet Variablen-Scopes und Umgebungen
 """
 
+import itertools
+
 from call_stack import RuntimeError as GerLangRuntimeError
 
+# Versionsnummern werden nie wiederverwendet, auch nicht über Interpreter hinweg
+_VERSIONS = itertools.count(1)
+
 
 class Environment:
     """Umgebung für Variablen-Scopes"""
@@ -60,3 +65,94 @@ class Environment:
             result.update(self.parent.get_all_vars())
         result.update(self.vars)
         return result
+
+
+class GlobalEnvironment(Environment):
+    """Globale Umgebung mit Versionsnummer für die Inline-Caches der Aufrufe.
+
+    Ein Aufruf name(...) hängt nur davon ab, ob global unter name etwas
+    Aufrufbares (ein Built-in) liegt, und von Interpreter.functions. Die
+    Version ändert sich deshalb nur, wenn ein aufrufbarer Wert definiert,
+    zugewiesen, überschrieben oder gelöscht wird, sowie über invalidate().
+    Zuweisungen normaler Werte bleiben so billig wie bisher.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.version = next(_VERSIONS)
+
+    def invalidate(self):
+        """Verwirft alle Inline-Caches (z.B. nach neuen Funktionen)"""
+        self.version = next(_VERSIONS)
+
+    def define(self, name, value):
+        variables = self.vars
+        if callable(value) or callable(variables.get(name)):
+            self.version = next(_VERSIONS)
+        variables[name] = value
+
+    def assign(self, name, value):
+        variables = self.vars
+        if name not in variables:
+            raise GerLangRuntimeError(f"Variable '{name}' nicht definiert")
+        if callable(value) or callable(variables[name]):
+            self.version = next(_VERSIONS)
+        variables[name] = value
+
+    def delete(self, name):
+        self.version = next(_VERSIONS)
+        super().delete(name)
+
+
+# ===== Slot-Scopes (aufgelöste Variablen, siehe resolver.py) =====
+#
+# Ein Scope ist eine Liste [parent, wert1, wert2, ...]: Index 0 zeigt auf den
+# umgebenden Scope (None = globale Ebene), ab Index 1 liegen die Slots der im
+# Scope deklarierten Variablen. Der Resolver bindet jede Verwendung an ein
+# Tupel von (depth, slot)-Kandidaten, innerster Scope zuerst. Ein Kandidat,
+# dessen Deklaration noch nicht ausgeführt wurde, enthält UNSET und wird
+# übersprungen (wie ein Environment, in dem der Name noch fehlt). Trifft kein
+# Kandidat, gilt der Name als global und wird im globalen Environment gesucht.
+
+class _Unset:
+    """Markiert einen Slot, dessen Deklaration noch nicht ausgeführt wurde"""
+    __slots__ = ()
+
+    def __repr__(self):
+        return "UNSET"
+
+
+UNSET = _Unset()
+
+
+def new_scope(parent, size):
+    """Neuer Scope mit size leeren Slots"""
+    scope = [UNSET] * (size + 1)
+    scope[0] = parent
+    return scope
+
+
+def lookup(scope, binding):
+    """Wert des ersten gesetzten Kandidaten oder UNSET (dann global suchen)"""
+    for depth, slot in binding:
+        target = scope
+        while depth:
+            target = target[0]
+            depth -= 1
+        value = target[slot]
+        if value is not UNSET:
+            return value
+    return UNSET
+
+
+def assign(scope, binding, value):
+    """Weist dem ersten gesetzten Kandidaten zu; False, falls der Name global ist"""
+    for depth, slot in binding:
+        target = scope
+        while depth:
+            target = target[0]
+            depth -= 1
+        if target[slot] is not UNSET:
+            target[slot] = value
+            return True
+    return False
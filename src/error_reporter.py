@@ -4,6 +4,7 @@
 # https://opensource.org/licenses/MIT
 
 import os
+import re
 from typing import Optional, List
 from dataclasses import dataclass
 
@@ -120,8 +121,10 @@ class ErrorReporter:
         # Stack-Trace anzeigen
         if runtime_error.call_stack:
             result += f"\n{BLUE}Call-Stack:{RESET}\n"
-            for i, frame in enumerate(reversed(runtime_error.call_stack)):
-                result += f"{BLUE}  {i+1}: {frame.function_name}(){RESET} in {frame.file_path}:{frame.line}:{frame.column}\n"
+            from call_stack import collapse_frames
+            for i, (frame, count) in enumerate(reversed(collapse_frames(runtime_error.call_stack))):
+                repeated = f" [{count} gleiche Aufrufe]" if count > 1 else ""
+                result += f"{BLUE}  {i+1}: {frame.function_name}(){RESET} in {frame.file_path}:{frame.line}:{frame.column}{frame.describe()}{repeated}\n"
         
         return result
     
@@ -228,3 +231,85 @@ class GerLangErrors:
             message=f"'{name}' ist nicht als exportiert in {module} deklariert",
             hint=f"Füge 'GIBFREI {name};' zum Modul hinzu oder prüfe die Schreibweise"
         )
+    
+    @staticmethod
+    def resource_limit(file_path: str, line: int, column: int, message: str) -> ErrorInfo:
+        return ErrorInfo(
+            code="GL010",
+            title="Ressourcenlimit überschritten",
+            file_path=file_path,
+            line=line,
+            column=column,
+            message=message,
+            hint="Das Programm hat ein gesetztes Limit (--max-steps, --max-time, --max-depth, --max-elements) erreicht"
+        )
+
+    @staticmethod
+    def lexer_error(file_path: str, line: int, column: int, message: str) -> ErrorInfo:
+        return ErrorInfo(
+            code="GL001",
+            title="Syntax-Fehler: Ungültiges Zeichen oder offener String",
+            file_path=file_path,
+            line=line,
+            column=column,
+            message=message,
+            hint="Prüfe Anführungszeichen und Sonderzeichen an dieser Stelle"
+        )
+
+
+def runtime_error_report(error: Exception, source_code: str, file_path: str) -> str:
+    """Meldung für einen Fehler aus der Ausführung (gerlang run, übersetzte Module).
+
+    Der Text ist für print() gedacht, genau wie ErrorReporter.print_error.
+
+    GerLang-Laufzeitfehler bekommen je nach Meldung einen Fehler-Code (GL003,
+    GL004, GL006, Limits GL010, sonst GL999) und den Call-Stack als Tipp, andere Ausnahmen
+    werden am Text erkannt oder als allgemeiner Laufzeitfehler gemeldet.
+    """
+    from call_stack import RuntimeError as GerLangRuntimeError, collapse_frames
+    from governor import ResourceLimitError
+
+    reporter = ErrorReporter(source_code, file_path)
+    if isinstance(error, GerLangRuntimeError):
+        # Prüfe spezifische Fehlertypen für bessere Codes
+        if isinstance(error, ResourceLimitError):
+            info = GerLangErrors.resource_limit(error.file_path, error.line or 1, error.column or 1, error.message)
+        elif "Division durch Null" in error.message:
+            info = GerLangErrors.division_by_zero(error.file_path, error.line, error.column)
+        elif "nicht definiert" in error.message and "Variable" in error.message:
+            match = re.search(r"Variable '([^']+)' nicht definiert", error.message)
+            info = GerLangErrors.undefined_variable(error.file_path, error.line, error.column,
+                                                    match.group(1) if match else "unbekannt")
+        elif "nicht gefunden" in error.message and "Funktion" in error.message:
+            match = re.search(r"Funktion '([^']+)' nicht gefunden", error.message)
+            info = GerLangErrors.undefined_function(error.file_path, error.line, error.column,
+                                                    match.group(1) if match else "unbekannt")
+        else:
+            # Generischer Runtime-Error
+            info = ErrorInfo(code="GL999", title=error.message, file_path=error.file_path,
+                             line=error.line, column=error.column, message=error.message)
+
+        # Füge Stack-Trace hinzu falls vorhanden
+        if error.call_stack:
+            stack_trace = "\n\nCall-Stack:"
+            for i, (frame, count) in enumerate(reversed(collapse_frames(error.call_stack))):
+                stack_trace += f"\n  {i}: {frame.function_name}() at {frame.file_path}:{frame.line}:{frame.column}{frame.describe()}"
+                if count > 1:
+                    stack_trace += f" [{count} gleiche Aufrufe]"
+            info.hint = stack_trace
+        return reporter.report_error(info)
+
+    # Fallback für andere Laufzeit-Fehler (ohne Positionsinformation)
+    message = str(error)
+    if "nicht definiert" in message and "Variable" in message:
+        match = re.search(r"Variable '([^']+)' nicht definiert", message)
+        info = GerLangErrors.undefined_variable(file_path, 1, 1, match.group(1) if match else "unbekannt")
+    elif "nicht gefunden" in message and "Funktion" in message:
+        match = re.search(r"Funktion '([^']+)' nicht gefunden", message)
+        info = GerLangErrors.undefined_function(file_path, 1, 1, match.group(1) if match else "unbekannt")
+    elif "Division durch Null" in message:
+        info = GerLangErrors.division_by_zero(file_path, 1, 1)
+    else:
+        return (f"\n❌ Laufzeitfehler: {message}\n"
+                "Tipp: Vielleicht hast du eine Variable vergessen, einen Typen verwechselt oder die Wurst zu früh gegessen.")
+    return reporter.report_error(info)
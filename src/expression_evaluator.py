@@ -10,6 +10,9 @@ Evaluiert verschiedene Expression-Typen
 
 import re
 from call_stack import RuntimeError as GerLangRuntimeError
+from environment import UNSET, lookup
+from kiste import KISTE_TYPES, SIZED_TYPES, TypedKiste, check_element, check_elements, printable
+from governor import ResourceLimitError, locate
 
 
 class ExpressionEvaluator:
@@ -57,8 +60,17 @@ class ExpressionEvaluator:
         return expr.value
 
     def _evaluate_identifier(self, expr):
-        """Evaluiert einen Identifier"""
-        return self.interpreter.env.get(expr.name)
+        """Evaluiert einen Identifier (lokale Slots, sonst global)"""
+        # environment.lookup, hier eingebettet (häufigster Knoten)
+        for depth, slot in expr.binding:
+            scope = self.interpreter.scope
+            while depth:
+                scope = scope[0]
+                depth -= 1
+            value = scope[slot]
+            if value is not UNSET:
+                return value
+        return self.interpreter.globals.get(expr.name)
 
     def _evaluate_binary(self, expr):
         """Evaluiert eine binäre Expression"""
@@ -124,28 +136,65 @@ class ExpressionEvaluator:
             raise GerLangRuntimeError(f"Unbekannter unärer Operator: {expr.operator}")
 
     def _evaluate_call(self, expr):
-        """Evaluiert einen Funktionsaufruf"""
+        """Evaluiert einen Funktionsaufruf.
+
+        Das Aufrufziel (Built-in oder FunctionDeclaration mit passender
+        Argumentanzahl) steht nach dem ersten Aufruf im Inline-Cache des
+        Knotens (call_cache) und gilt, solange sich die Version des globalen
+        Environments nicht ändert (siehe GlobalEnvironment). Nur wenn der
+        Resolver eine gleichnamige lokale Variable gefunden hat, wird diese
+        bei jedem Aufruf geprüft.
+        """
         # Argumente evaluieren
         args = [self.evaluate(arg) for arg in expr.arguments]
-        
-        # Funktionsname aus der Expression extrahieren
-        if hasattr(expr.function, 'name'):
-            func_name = expr.function.name
-        else:
+        interpreter = self.interpreter
+        function = expr.function
+        cache = getattr(expr, "call_cache", None)
+        if cache is None and not hasattr(function, 'name'):
             # Für komplexere Ausdrücke müssten wir das evaluieren
             raise GerLangRuntimeError("Komplexe Funktionsausdrücke noch nicht unterstützt")
-        
-        # Prüfen ob es eine Built-in Funktion ist
-        if self.interpreter.env.has(func_name):
-            func = self.interpreter.env.get(func_name)
-            if callable(func):
-                try:
-                    return func(*args)
-                except Exception as e:
-                    raise GerLangRuntimeError(f"Fehler in Built-in Funktion '{func_name}': {e}")
-        
-        # Benutzerdefinierte Funktion
-        return self.interpreter.execute_function(func_name, args, expr)
+
+        if function.binding:
+            # Eine lokale Variable gleichen Namens hat Vorrang
+            func = lookup(interpreter.scope, function.binding)
+            if func is not UNSET:
+                if callable(func):
+                    return self._call_builtin(function.name, func, args, expr)
+                return interpreter.execute_function(function.name, args, expr)
+
+        if cache is None or cache[0] != interpreter.globals.version:
+            cache = expr.call_cache = self._resolve_call(expr)
+        _, builtin, func = cache
+        if builtin is not None:
+            return self._call_builtin(function.name, builtin, args, expr)
+        if func is not None:
+            return interpreter.call_function(func, args, expr)
+        # Unbekannte Funktion oder falsche Argumentanzahl: Fehler wie bisher
+        return interpreter.execute_function(function.name, args, expr)
+
+    def _resolve_call(self, expr):
+        """Eintrag für den Inline-Cache: (Version, Built-in, Funktion)"""
+        globals_env = self.interpreter.globals
+        # Built-in Funktionen (oder aufrufbare globale Variablen) haben Vorrang
+        builtin = globals_env.vars.get(expr.function.name)
+        if not callable(builtin):
+            builtin = None
+        func = None
+        if builtin is None:
+            func = self.interpreter.functions.get(expr.function.name)
+            if func is not None and len(func.parameters) != len(expr.arguments):
+                func = None
+        return (globals_env.version, builtin, func)
+
+    @staticmethod
+    def _call_builtin(name, func, args, expr):
+        try:
+            return func(*args)
+        except ResourceLimitError as e:
+            # Limits (z.B. NEUE_KISTE) bleiben GL010, an der Aufrufstelle
+            raise locate(e, expr.line, expr.column)
+        except Exception as e:
+            raise GerLangRuntimeError(f"Fehler in Built-in Funktion '{name}': {e}")
 
     def _evaluate_array_literal(self, expr):
         """Evaluiert ein Array-Literal"""
@@ -156,7 +205,7 @@ class ExpressionEvaluator:
         array = self.evaluate(expr.array)
         index = self.evaluate(expr.index)
         
-        if not isinstance(array, list):
+        if not isinstance(array, KISTE_TYPES):
             raise GerLangRuntimeError("Array-Zugriff nur auf KISTE möglich")
         
         try:
@@ -172,7 +221,7 @@ class ExpressionEvaluator:
         obj = self.evaluate(expr.object_expr)
         
         if expr.property_name == "LÄNGE":
-            if isinstance(obj, (list, str)):
+            if isinstance(obj, SIZED_TYPES):
                 return len(obj)
             else:
                 raise GerLangRuntimeError("LÄNGE nur für KISTE oder WORT verfügbar")
@@ -184,28 +233,35 @@ class ExpressionEvaluator:
         obj = self.evaluate(expr.object_expr)
         args = [self.evaluate(arg) for arg in expr.arguments]
         
-        if isinstance(obj, list):
+        if isinstance(obj, KISTE_TYPES):
+            if expr.method_name in ("HINZUFÜGEN", "ERWEITERN"):
+                # Typisierte KISTE: erst alle Werte prüfen, dann einfügen
+                check_elements(obj, args)
             if expr.method_name == "HINZUFÜGEN":
                 for arg in args:
                     obj.insert(0, arg)  # Am Anfang einfügen
-                return None
             elif expr.method_name == "ERWEITERN":
                 for arg in args:
                     obj.append(arg)  # Am Ende anhängen
-                return None
             else:
                 raise GerLangRuntimeError(f"Unbekannte Methode für KISTE: {expr.method_name}")
+            governor = self.interpreter.governor
+            if governor is not None:
+                governor.check_size(obj, node=expr)
+            return None
         else:
             raise GerLangRuntimeError(f"Methoden-Aufruf nur für KISTE möglich")
 
     def _evaluate_set(self, expr):
         """Evaluiert Set-Expression (Array-Element setzen)"""
-        array = self.evaluate(expr.object)
-        index = self.evaluate(expr.index)
+        array = self.evaluate(expr.target.array)
+        index = self.evaluate(expr.target.index)
         value = self.evaluate(expr.value)
         
-        if not isinstance(array, list):
-            raise GerLangRuntimeError("Set-Operation nur auf KISTE möglich")
+        if type(array) is not list:
+            if not isinstance(array, KISTE_TYPES):
+                raise GerLangRuntimeError("Set-Operation nur auf KISTE möglich")
+            value = check_element(array, value)
         
         try:
             index_int = int(index)
@@ -217,35 +273,49 @@ class ExpressionEvaluator:
             raise GerLangRuntimeError("Array-Index muss eine Zahl sein")
 
     def _evaluate_template_string(self, expr):
-        """Evaluiert Template-String mit Interpolation"""
-        result = ""
-        
-        # Verarbeite parts und expressions abwechselnd
-        for i, part in enumerate(expr.parts):
-            # Füge String-Teil hinzu
-            result += part
-            
-            # Füge evaluierte Expression hinzu (falls vorhanden)
-            if i < len(expr.expressions):
-                value = self.evaluate(expr.expressions[i])
-                if isinstance(value, bool):
-                    result += "JA" if value else "NEIN"
-                elif value is None:
-                    result += "NIX"
-                elif isinstance(value, list):
-                    # Array zu String
-                    elements = []
-                    for item in value:
-                        if isinstance(item, str):
-                            elements.append(f'"{item}"')
-                        elif isinstance(item, bool):
-                            elements.append("JA" if item else "NEIN")
-                        elif item is None:
-                            elements.append("NIX")
-                        else:
-                            elements.append(str(item))
-                    result += f"[{', '.join(elements)}]"
-                else:
-                    result += str(value)
-        
+        """Evaluiert Template-String mit Interpolation über den vorübersetzten Plan"""
+        plan = expr.plan
+        pieces = plan.pieces.copy()
+        governor = self.interpreter.governor
+        for index, slot_expr in plan.slots:
+            value = self.evaluate(slot_expr)
+            if governor is not None:
+                governor.check_shown(value, expr)
+            formatter = _TEMPLATE_FORMATTERS.get(type(value))
+            pieces[index] = formatter(value) if formatter else str(value)
+        result = "".join(pieces)
+        if governor is not None:
+            governor.check_size(result, node=expr)
         return result
+
+
+def _format_template_item(item):
+    """Formatiert ein Element einer KISTE innerhalb eines Template-Strings.
+
+    Verschachtelte Listen wie bisher über str(), typisierte KISTEN darin als
+    Listen (wie bei DRUCKE).
+    """
+    if isinstance(item, str):
+        return f'"{item}"'
+    elif isinstance(item, bool):
+        return "JA" if item else "NEIN"
+    elif item is None:
+        return "NIX"
+    return str(printable(item))
+
+
+def _format_template_list(value):
+    """Array zu String"""
+    return f"[{', '.join(map(_format_template_item, value))}]"
+
+
+# Formatierung der ${...}-Werte nach exaktem Typ, alles andere über str()
+_TEMPLATE_FORMATTERS = {
+    str: str,
+    int: str,
+    float: str,
+    bool: lambda value: "JA" if value else "NEIN",
+    type(None): lambda value: "NIX",
+    list: _format_template_list,
+    TypedKiste: _format_template_list,
+}
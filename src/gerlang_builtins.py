@@ -13,6 +13,8 @@ import random
 import sys
 from typing import Any, Union
 
+from kiste import KISTE_TYPES, new_kiste, printable
+
 
 class BuiltinFunctions:
     """Container für alle Built-in Funktionen von GerLang"""
@@ -30,6 +32,9 @@ class BuiltinFunctions:
         environment.define("ZU_WORT", BuiltinFunctions._zu_wort)
         environment.define("ZU_GANZ", BuiltinFunctions._zu_ganz)
         environment.define("ZU_KOMMA", BuiltinFunctions._zu_komma)
+
+        # KISTEN (GANZ/KOMMA als typisiertes Array, siehe kiste.py)
+        environment.define("NEUE_KISTE", BuiltinFunctions._neue_kiste)
         
         # Math functions
         environment.define("WURZEL", BuiltinFunctions._wurzel)
@@ -39,6 +44,14 @@ class BuiltinFunctions:
         environment.define("ZUFALLSZAHL", BuiltinFunctions._zufallszahl)
         environment.define("ZUFALLSBEREICH", BuiltinFunctions._zufallsbereich)
 
+    @staticmethod
+    def names() -> frozenset:
+        """Namen aller Built-in Funktionen (wie von setup_builtins registriert)"""
+        from environment import Environment
+        environment = Environment()
+        BuiltinFunctions.setup_builtins(environment)
+        return frozenset(environment.vars)
+
     # I/O Funktionen
     @staticmethod
     def _drucke_builtin(*args):
@@ -51,7 +64,7 @@ class BuiltinFunctions:
                 output_parts.append("JA" if arg else "NEIN")
             elif arg is None:
                 output_parts.append("NIX")
-            elif isinstance(arg, list):
+            elif isinstance(arg, KISTE_TYPES):
                 # Array-Darstellung
                 elements = []
                 for item in arg:
@@ -62,7 +75,7 @@ class BuiltinFunctions:
                     elif item is None:
                         elements.append("NIX")
                     else:
-                        elements.append(str(item))
+                        elements.append(str(printable(item)))
                 output_parts.append(f"[{', '.join(elements)}]")
             else:
                 output_parts.append(str(arg))
@@ -90,7 +103,7 @@ class BuiltinFunctions:
             return "NIX"
         elif isinstance(value, bool):
             return "JA" if value else "NEIN"
-        elif isinstance(value, list):
+        elif isinstance(value, KISTE_TYPES):
             # Array zu String
             elements = [BuiltinFunctions._zu_wort(item) for item in value]
             return f"[{', '.join(elements)}]"
@@ -136,6 +149,11 @@ class BuiltinFunctions:
         else:
             raise ValueError(f"Typ {type(value).__name__} kann nicht zu KOMMA konvertiert werden")
 
+    @staticmethod
+    def _neue_kiste(length, value=0):
+        """NEUE_KISTE - KISTE mit length Elementen, alle gleich value"""
+        return new_kiste(length, value)
+
     # Math Functions
     @staticmethod
     def _wurzel(value):
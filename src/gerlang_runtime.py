@@ -0,0 +1,277 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Laufzeit-Unterstützung für übersetzte GerLang-Programme (gerlang compile)
+
+Von transpiler.py erzeugte Module importieren dieses Modul als _rt. Es
+enthält nur, was sich nicht als einfacher Python-Ausdruck schreiben lässt:
+Built-ins mit GerLang-Fehlermeldung, KISTE-Zugriffe mit Grenzprüfung,
+Formatierung (JA/NEIN/NIX), Memoisierung von REIN-Funktionen und die
+Zuordnung von Fehlern zu GL-Codes samt Call-Stack.
+
+Wahrheitswerte brauchen keine Hilfsfunktion: Pythons bool() stimmt für alle
+GerLang-Werte mit Interpreter.is_truthy überein, übersetzter Code schreibt
+Bedingungen daher direkt als `if x:`.
+"""
+
+import operator
+import os
+import sys
+
+from call_stack import CallFrame, RuntimeError as GerLangRuntimeError
+from environment import Environment, UNSET
+from error_reporter import runtime_error_report
+from expression_evaluator import _TEMPLATE_FORMATTERS
+from gerlang_builtins import BuiltinFunctions
+from kiste import KISTE_TYPES, SIZED_TYPES, check_element, check_elements, printable
+from memo import MemoCache, MISSING, DEFAULT_SIZE as DEFAULT_MEMO_SIZE
+from statement_executor import ReturnSignal
+
+# Built-in Name -> Funktion, wie im globalen Environment des Interpreters
+_builtin_environment = Environment()
+BuiltinFunctions.setup_builtins(_builtin_environment)
+BUILTINS = dict(_builtin_environment.vars)
+
+# Übersetzte Programme nach Dateiname ihres Python-Codes (co_filename)
+_PROGRAMS = {}
+
+# Vergleich einer Zählschleife -> (Python-Operator, Korrektur des range-Endes)
+_COMPARISONS = {
+    "<": (operator.lt, 0),
+    "<=": (operator.le, 1),
+    ">": (operator.gt, 0),
+    ">=": (operator.ge, -1),
+}
+
+
+class Program:
+    """Ein übersetztes Programm: Quelle, Funktionsnamen und Aufrufstellen.
+
+    calls ordnet (Python-Zeile, Byte-Spalte) eines Aufrufs im erzeugten Code
+    der Position des CallExpression-Knotens in der .gerl-Datei zu. Daraus
+    entsteht der Call-Stack erst im Fehlerfall aus den Python-Frames, der
+    übersetzte Code selbst führt keinen Stack mit.
+    """
+
+    def __init__(self, module_file: str, source: str, display_path: str, functions: dict, variables: dict, calls: dict):
+        self.source = source  # absoluter Pfad der .gerl-Datei (Interpreter.current_file)
+        self.display_path = display_path  # Pfad wie beim Übersetzen angegeben
+        self.functions = functions  # Python-Name -> GerLang-Name
+        self.variables = variables  # Python-Name -> GerLang-Name (globale Variablen)
+        self.calls = calls
+        _PROGRAMS[os.path.abspath(module_file)] = self
+
+    def run(self, main):
+        """Führt das Programm aus; Fehler wie `gerlang run` melden (Exit-Code 3)"""
+        try:
+            main()
+        except Exception as e:
+            try:
+                with open(self.source, "r", encoding="utf-8") as f:
+                    source_code = f.read()
+            except OSError:
+                source_code = ""
+            print(runtime_error_report(self.translate(e), source_code, self.display_path))
+            sys.exit(3)
+
+    def translate(self, error: Exception) -> Exception:
+        """Python-Fehler, die der Interpreter als GerLang-Fehler meldet, übersetzen"""
+        if isinstance(error, NameError) and getattr(error, "name", None) in self.variables:
+            # Globale Variable, deren Deklaration noch nicht ausgeführt wurde
+            return GerLangRuntimeError(f"Variable '{self.variables[error.name]}' nicht definiert")
+        return error
+
+    def message(self, error: Exception) -> str:
+        """Text für die Variable in FANGE name { ... }"""
+        return str(self.translate(error))
+
+    def call_error(self, message: str, line: int, column: int, *arguments):
+        """Fehler an einer Aufrufstelle (unbekannte Funktion, falsche Argumentanzahl).
+
+        Die Argumente sind zu diesem Zeitpunkt schon ausgewertet, wie im
+        Interpreter.
+        """
+        raise GerLangRuntimeError(message, self.source, line, column, self.call_stack(sys._getframe(1)))
+
+    def call_stack(self, frame) -> list:
+        """CallFrames der laufenden GerLang-Funktionen, äußerster zuerst.
+
+        Die Aufrufstelle einer Funktion ist die Position, an der der nächste
+        äußere Frame aus übersetztem Code gerade steht (Zwischenframes wie
+        die Memoisierung von REIN-Funktionen werden übersprungen). haupt()
+        und unbekannte Stellen bekommen wie im Interpreter 1:1.
+        """
+        stack = []
+        pending = None
+        while frame is not None:
+            if _PROGRAMS.get(os.path.abspath(frame.f_code.co_filename)) is self:
+                if pending is not None:
+                    stack.append(CallFrame(pending, self.source, *self._call_site(frame)))
+                pending = self.functions.get(frame.f_code.co_name)
+            frame = frame.f_back
+        if pending is not None:
+            stack.append(CallFrame(pending, self.source, 1, 1))
+        stack.reverse()
+        return stack
+
+    def _call_site(self, frame) -> tuple:
+        """GerLang-Position des Aufrufs, an dem frame gerade steht"""
+        positions = list(frame.f_code.co_positions())
+        index = frame.f_lasti // 2
+        if 0 <= index < len(positions):
+            line, _, column, _ = positions[index]
+            site = self.calls.get((line, column))
+            if site is not None:
+                return site
+        return 1, 1
+
+
+def builtin(name: str):
+    """Built-in als Funktion, die Fehler wie der Interpreter meldet"""
+    function = BUILTINS[name]
+
+    def call(*args):
+        try:
+            return function(*args)
+        except Exception as e:
+            raise GerLangRuntimeError(f"Fehler in Built-in Funktion '{name}': {e}")
+    call.__name__ = call.__qualname__ = name
+    return call
+
+
+def call_value(name: str, function, *args):
+    """Aufruf einer Variable, die ein Built-in enthält (GANZ f = ABS; f(-1))"""
+    try:
+        return function(*args)
+    except Exception as e:
+        raise GerLangRuntimeError(f"Fehler in Built-in Funktion '{name}': {e}")
+
+
+def pure(name: str, size: int = DEFAULT_MEMO_SIZE):
+    """Dekorator für REIN-Funktionen: LRU-Cache wie Interpreter.call_function"""
+    def decorate(function):
+        if not size:
+            return function
+        memo = MemoCache(name, size)
+
+        def call(*args):
+            key = memo.key(args)
+            if key is None:
+                return function(*args)
+            result = memo.get(key)
+            if result is MISSING:
+                result = function(*args)
+                memo.store(key, result)
+            return result
+        call.__name__ = function.__name__
+        call.__qualname__ = function.__qualname__
+        call.memo = memo
+        return call
+    return decorate
+
+
+def undefined(name: str, *values):
+    """Lesen oder Zuweisen (nach Auswertung von values) eines Namens, den es nirgends gibt"""
+    raise GerLangRuntimeError(f"Variable '{name}' nicht definiert")
+
+
+def defined(value, name: str):
+    """Wert einer bedingt deklarierten Variable (UNSET: Deklaration nicht ausgeführt)"""
+    if value is UNSET:
+        raise GerLangRuntimeError(f"Variable '{name}' nicht definiert")
+    return value
+
+
+def rebind(current, name: str, value):
+    """Zuweisung an eine bedingt deklarierte Variable"""
+    if current is UNSET:
+        raise GerLangRuntimeError(f"Variable '{name}' nicht definiert")
+    return value
+
+
+def fail(message: str, *values):
+    """Laufzeitfehler ohne Position, nachdem values ausgewertet wurden"""
+    raise GerLangRuntimeError(message)
+
+
+def divide(left, right):
+    """left / right mit der Fehlermeldung des Interpreters bei Null"""
+    if right == 0:
+        raise GerLangRuntimeError("Division durch Null")
+    return left / right
+
+
+def index(array, position):
+    """array[position] wie ExpressionEvaluator._evaluate_array_access"""
+    if not isinstance(array, KISTE_TYPES):
+        raise GerLangRuntimeError("Array-Zugriff nur auf KISTE möglich")
+    try:
+        position = int(position)
+    except (TypeError, ValueError):
+        raise GerLangRuntimeError("Array-Index muss eine Zahl sein")
+    if position < 0 or position >= len(array):
+        raise GerLangRuntimeError(f"Array-Index {position} außerhalb der Grenzen")
+    return array[position]
+
+
+def set_index(array, position, value):
+    """array[position] = value wie ExpressionEvaluator._evaluate_set"""
+    if type(array) is not list:
+        if not isinstance(array, KISTE_TYPES):
+            raise GerLangRuntimeError("Set-Operation nur auf KISTE möglich")
+        value = check_element(array, value)
+    try:
+        position = int(position)
+    except (TypeError, ValueError):
+        raise GerLangRuntimeError("Array-Index muss eine Zahl sein")
+    if position < 0 or position >= len(array):
+        raise GerLangRuntimeError(f"Array-Index {position} außerhalb der Grenzen")
+    array[position] = value
+    return value
+
+
+def length(value):
+    """value.LÄNGE"""
+    if isinstance(value, SIZED_TYPES):
+        return len(value)
+    raise GerLangRuntimeError("LÄNGE nur für KISTE oder WORT verfügbar")
+
+
+def method(target, name: str, *args):
+    """target.NAME(args) wie ExpressionEvaluator._evaluate_method_call"""
+    if not isinstance(target, KISTE_TYPES):
+        raise GerLangRuntimeError("Methoden-Aufruf nur für KISTE möglich")
+    if name in ("HINZUFÜGEN", "ERWEITERN"):
+        check_elements(target, args)
+    if name == "HINZUFÜGEN":
+        for arg in args:
+            target.insert(0, arg)  # Am Anfang einfügen
+    elif name == "ERWEITERN":
+        target.extend(args)  # Am Ende anhängen
+    else:
+        raise GerLangRuntimeError(f"Unbekannte Methode für KISTE: {name}")
+    return None
+
+
+def text(value) -> str:
+    """Wert innerhalb eines Template-Strings (${...})"""
+    formatter = _TEMPLATE_FORMATTERS.get(type(value))
+    return formatter(value) if formatter else str(value)
+
+
+def counter(start, bound, step: int, comparison: str):
+    """Werte einer Zählschleife (resolver.counted_loop): range für Ganzzahlen,
+    sonst schrittweise mit demselben Vergleich wie die Bedingung"""
+    compare, end_offset = _COMPARISONS[comparison]
+    if type(start) is int and type(bound) is int:
+        return range(start, bound + end_offset, step)
+    return _count(start, bound, step, compare)
+
+
+def _count(value, bound, step, compare):
+    while compare(value, bound):
+        yield value
+        value = value + step
@@ -0,0 +1,248 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Ressourcen-Limits für fremde GerLang-Skripte (gerlang run --max-steps ...)
+
+Limits begrenzt Schritte, Laufzeit, Aufruftiefe und die Größe einzelner
+KISTEN bzw. WORTE. Wird ein Limit überschritten, löst der Interpreter einen
+ResourceLimitError (GL010) an der Position der Schleife bzw. des Aufrufs
+aus. VERSUCHE kann ihn fangen, Schritt- und Zeitlimit bleiben danach aber
+erschöpft: die nächste Schleifenrunde oder der nächste Aufruf scheitert
+erneut.
+
+KISTEN dürfen andere KISTEN mehrfach enthalten (k = [k, k]). Beim Ausgeben
+und Umwandeln (DRUCKE, ZU_WORT, Template-Strings) zählt check_shown daher
+jedes Vorkommen mit und bricht ab, bevor der Text entsteht.
+
+Gezählt wird nicht jedes Statement, sondern nur an Rücksprüngen von
+Schleifen und bei Funktionsaufrufen (jeweils ein Schritt). Dort zählt
+Governor.tick einen Countdown herunter; erst wenn er abgelaufen ist, prüft
+checkpoint Schritte und Uhr. Ohne Limits ist Interpreter.governor None und
+die Engines überspringen die Prüfung.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from call_stack import RuntimeError as GerLangRuntimeError
+from kiste import KISTE_TYPES, SIZED_TYPES
+
+# Schritte zwischen zwei Blicken auf die Uhr
+CHECK_INTERVAL = 1000
+
+
+class ResourceLimitError(GerLangRuntimeError):
+    """Laufzeitfehler beim Überschreiten eines Limits (Fehler-Code GL010)"""
+
+
+@dataclass
+class Limits:
+    """Obergrenzen für einen Lauf (None = unbegrenzt)"""
+    max_steps: Optional[int] = None      # Schleifenrunden + Funktionsaufrufe
+    max_time: Optional[float] = None     # Sekunden Wall-Clock pro interpret()
+    max_depth: Optional[int] = None      # Verschachtelte Funktionsaufrufe
+    max_elements: Optional[int] = None   # Elemente pro KISTE bzw. Zeichen pro WORT
+
+    def active(self) -> bool:
+        return any(value is not None for value in
+                   (self.max_steps, self.max_time, self.max_depth, self.max_elements))
+
+
+class Governor:
+    """Überwacht die Limits eines Interpreters (Interpreter.governor)"""
+
+    def __init__(self, limits: Limits, interpreter=None, clock=time.monotonic):
+        self.limits = limits
+        self.interpreter = interpreter
+        self.clock = clock
+        self.countdown = 0  # Schritte bis zum nächsten checkpoint()
+        self._chunk = 0
+        self._steps = 0  # Schritte bis zum letzten checkpoint()
+        self._deadline = None
+        self._exceeded = None  # Meldung, sobald Schritt- oder Zeitlimit erschöpft ist
+
+    def start(self):
+        """Budgets für einen neuen Lauf setzen (Interpreter.interpret)"""
+        self._steps = 0
+        self._exceeded = None
+        max_time = self.limits.max_time
+        self._deadline = self.clock() + max_time if max_time is not None else None
+        self._next_chunk()
+
+    @property
+    def steps(self) -> int:
+        """Bisher gezählte Schritte"""
+        return self._steps + self._chunk - self.countdown
+
+    def tick(self, node=None):
+        """Ein Schritt an einer Schleife bzw. einem Aufruf (node: Position).
+
+        Heiße Stellen (Closure-Engine, VM, call_function) zählen countdown
+        selbst herunter und rufen erst bei 0 check() bzw. checkpoint() auf.
+        """
+        self.countdown -= 1
+        if self.countdown <= 0:
+            self.check(node)
+
+    def check(self, node=None):
+        """checkpoint() an der Position eines AST-Knotens"""
+        self.checkpoint(getattr(node, "line", 0) or 1, getattr(node, "column", 0) or 1)
+
+    def checkpoint(self, line: int, column: int):
+        """Countdown abgelaufen: Schritte und Uhr prüfen"""
+        self._steps += self._chunk - self.countdown
+        limits = self.limits
+        if self._exceeded is None:
+            if limits.max_steps is not None and self._steps > limits.max_steps:
+                self._exceeded = f"Schrittlimit von {limits.max_steps} überschritten (Schleifenrunden und Funktionsaufrufe)"
+            elif self._deadline is not None and self.clock() > self._deadline:
+                self._exceeded = f"Zeitlimit von {limits.max_time:g} s überschritten"
+        if self._exceeded is not None:
+            # Erschöpft: jeder weitere Schritt scheitert sofort
+            self._chunk = self.countdown = 1
+            raise self.error(self._exceeded, line, column)
+        self._next_chunk()
+
+    def _next_chunk(self):
+        chunk = CHECK_INTERVAL
+        if self.limits.max_steps is not None:
+            # Genau beim ersten Schritt über dem Limit anhalten
+            chunk = max(1, min(chunk, self.limits.max_steps + 1 - self._steps))
+        self._chunk = self.countdown = chunk
+
+    # ===== Größe von KISTEN und WORTEN =====
+
+    def add(self, left, right, node=None):
+        """left + right, bei KISTEN/WORTEN vorher die Größe des Ergebnisses prüfen"""
+        if isinstance(left, SIZED_TYPES) and isinstance(right, SIZED_TYPES):
+            self.check_size(left, len(left) + len(right), node)
+        return left + right
+
+    def mul(self, left, right, node=None):
+        """left * right, bei KISTE/WORT mal Zahl vorher die Größe prüfen"""
+        if isinstance(left, SIZED_TYPES) and type(right) is int:
+            self.check_size(left, len(left) * right, node)
+        elif isinstance(right, SIZED_TYPES) and type(left) is int:
+            self.check_size(right, len(right) * left, node)
+        return left * right
+
+    def operator(self, op: str):
+        """Geprüfte Funktion für + bzw. * (None für andere Operatoren oder ohne max_elements)"""
+        if self.limits.max_elements is None:
+            return None
+        return {"+": self.add, "*": self.mul}.get(op)
+
+    def check_size(self, value, size: int = None, node=None):
+        """Fehler, wenn value (bzw. ein Ergebnis mit size Elementen) zu groß ist.
+
+        Ohne node (Built-ins, VM) bleibt die Position 0:0, die Engine trägt
+        sie über locate() nach.
+        """
+        max_elements = self.limits.max_elements
+        if max_elements is None:
+            return
+        if size is None:
+            size = len(value)
+        if size > max_elements:
+            what = "WORT mit" if isinstance(value, str) else "KISTE mit"
+            unit = "Zeichen" if isinstance(value, str) else "Elementen"
+            raise self.error(f"Elementlimit von {max_elements} überschritten ({what} {size} {unit})",
+                             getattr(node, "line", 0), getattr(node, "column", 0))
+
+    def check_shown(self, value, node=None):
+        """Fehler, wenn die Ausgabe einer KISTE mehr als max_elements Elemente zeigt.
+
+        Verschachtelte KISTEN zählen mit, geteilte bei jedem Vorkommen; eine
+        KISTE in sich selbst erscheint als [...] und zählt nicht weiter. Die
+        Suche endet, sobald das Limit überschritten ist.
+        """
+        max_elements = self.limits.max_elements
+        if max_elements is None or not isinstance(value, KISTE_TYPES):
+            return
+        shown = 0
+        work = [(value, False)]
+        path = set()  # KISTEN auf dem Weg von value zur aktuellen
+        while work:
+            kiste, leaving = work.pop()
+            if leaving:
+                path.discard(id(kiste))
+                continue
+            shown += len(kiste)
+            if shown > max_elements:
+                raise self.error(f"Elementlimit von {max_elements} überschritten "
+                                 f"(Ausgabe einer KISTE mit mehr als {max_elements} Elementen)",
+                                 getattr(node, "line", 0), getattr(node, "column", 0))
+            if type(kiste) is list:
+                path.add(id(kiste))
+                work.append((kiste, True))
+                work.extend((item, False) for item in kiste if type(item) is list and id(item) not in path)
+
+    def binary_functions(self, functions: tuple, operators: tuple) -> tuple:
+        """Tabelle der Binäroperatoren (bytecode.BINARY_FUNCTIONS) mit geprüftem + und *"""
+        return tuple(self.operator(op) or function for op, function in zip(operators, functions))
+
+    def attach(self, interpreter):
+        """Im Baum-Interpreter + und * über add() bzw. mul() laufen lassen.
+
+        Closure-Engine und VM lesen interpreter.governor beim Übersetzen bzw.
+        Ausführen selbst; der Baum-Interpreter rechnet + und * direkt in
+        _evaluate_binary und bekommt dafür (nur mit max_elements) einen
+        Wrapper an der Instanz. NEUE_KISTE prüft die Länge vorab.
+        """
+        self.interpreter = interpreter
+        if self.limits.max_elements is None:
+            return
+        globals_env = interpreter.globals
+        check_size, check_shown = self.check_size, self.check_shown
+        # NEUE_KISTE legt die KISTE in einem Stück an
+        new_kiste = globals_env.vars.get("NEUE_KISTE")
+        if callable(new_kiste):
+            def governed_new_kiste(length, value=0):
+                if type(length) is int:
+                    check_size([], length)
+                return new_kiste(length, value)
+            globals_env.vars["NEUE_KISTE"] = governed_new_kiste
+        # ZU_WORT einer KISTE: erst die gezeigten Elemente, dann die Länge des WORTS
+        to_text = globals_env.vars.get("ZU_WORT")
+        if callable(to_text):
+            def governed_to_text(value):
+                check_shown(value)
+                text = to_text(value)
+                check_size(text)
+                return text
+            globals_env.vars["ZU_WORT"] = governed_to_text
+        if interpreter.engine != "tree":
+            return
+        evaluator = interpreter.expression_evaluator
+        evaluate_binary = evaluator._evaluate_binary
+        add, mul = self.add, self.mul
+
+        def governed_binary(expr):
+            op = expr.operator
+            if op == "+":
+                left = evaluator.evaluate(expr.left)
+                return add(left, evaluator.evaluate(expr.right), expr)
+            if op == "*":
+                left = evaluator.evaluate(expr.left)
+                return mul(left, evaluator.evaluate(expr.right), expr)
+            return evaluate_binary(expr)
+        evaluator._evaluate_binary = governed_binary
+
+    def error(self, message: str, line: int, column: int) -> ResourceLimitError:
+        """ResourceLimitError an line:column (0:0 = Position noch unbekannt)"""
+        interpreter = self.interpreter
+        if interpreter is None:
+            return ResourceLimitError(message, "", line, column)
+        return ResourceLimitError(message, interpreter.current_file or "", line, column,
+                                  interpreter.call_stack.get_stack_trace())
+
+
+def locate(error: ResourceLimitError, line: int, column: int) -> ResourceLimitError:
+    """Position eines ohne Knoten ausgelösten Fehlers nachtragen (Built-ins, VM)"""
+    if not error.line:
+        error.line, error.column = line or 1, column or 1
+    return error
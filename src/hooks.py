@@ -0,0 +1,162 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Hook-Registry für eingebettete Interpreter (Interpreter.hooks)
+
+Listener werden für Ereignisse registriert:
+
+    call       listener(name, args)      vor einem Funktionsaufruf
+    return     listener(name, value)     nach der Rückkehr
+    exception  listener(name, fehler)    Fehler verlässt die Funktion
+    statement  listener(stmt)            vor jedem Statement (nur tree)
+    builtin    listener(name, args)      vor einem Built-in-Aufruf
+    catch      listener(fehler)          VERSUCHE hat einen Fehler gefangen
+
+Ohne Listener enthält der Ausführungspfad keine einzige Hook-Prüfung: erst
+der erste Listener eines Ereignisses tauscht call_function, den
+Statement-Dispatcher bzw. die Built-ins im globalen Environment gegen
+Wrapper aus, der letzte entfernte stellt die Originale wieder her. Nur
+catch lesen die Engines direkt im FANGE-Pfad, der ohnehin erst nach
+einem Fehler läuft.
+"""
+
+from typing import Callable, Dict, Tuple
+
+from gerlang_builtins import BuiltinFunctions
+from statement_executor import TailCallSignal
+
+EVENTS = ("call", "return", "exception", "statement", "builtin", "catch")
+
+# Ereignisse, die eine Engine nicht liefern kann: die VM ruft Funktionen
+# ohne call_function auf, closure und vm haben keinen Statement-Dispatcher
+_UNSUPPORTED = {
+    "closure": ("statement",),
+    "vm": ("call", "return", "exception", "statement"),
+}
+
+_MISSING = object()
+
+
+class HookRegistry:
+    """Listener pro Ereignis und die dafür installierten Wrapper.
+
+    call/return/exception hängen an Interpreter.call_function, das die
+    Closure-Engine beim Übersetzen eines Aufrufs übernimmt; Listener dafür
+    also vor interpret() registrieren. Endaufrufe (ZURÜCK f(...) in f)
+    melden call, aber kein eigenes return: sie übernehmen den Frame des
+    Aufrufers, dessen return später folgt.
+    """
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.listeners: Dict[str, Tuple[Callable, ...]] = dict.fromkeys(EVENTS, ())
+        self._originals = []  # (Objekt, Attribut, Wert vor dem Austausch)
+        self._builtins = {}  # Name -> Original-Built-in
+
+    def add(self, event: str, listener: Callable) -> Callable:
+        """Registriert einen Listener (auch als Dekorator nutzbar)"""
+        self._check(event)
+        self.listeners[event] += (listener,)
+        self._install()
+        return listener
+
+    def remove(self, event: str, listener: Callable):
+        """Entfernt einen Listener; ohne Listener verschwinden die Wrapper"""
+        self._check(event)
+        listeners = list(self.listeners[event])
+        listeners.remove(listener)
+        self.listeners[event] = tuple(listeners)
+        self._install()
+
+    def active(self) -> bool:
+        return any(self.listeners.values())
+
+    def _check(self, event: str):
+        if event not in self.listeners:
+            raise ValueError(f"Unbekanntes Hook-Ereignis: {event} (erlaubt: {', '.join(EVENTS)})")
+        engine = self.interpreter.engine
+        if event in _UNSUPPORTED.get(engine, ()):
+            raise ValueError(f"Hook '{event}' wird von der Engine '{engine}' nicht unterstützt")
+
+    # ===== Wrapper =====
+
+    def _install(self):
+        """Wrapper passend zu den aktuellen Listenern setzen"""
+        self._restore()
+        interpreter = self.interpreter
+        listeners = self.listeners
+        if listeners["call"] or listeners["return"] or listeners["exception"]:
+            self._replace(interpreter, "call_function", self._wrap_call(interpreter.call_function))
+        if listeners["statement"]:
+            executor = interpreter.statement_executor
+            self._replace(executor, "execute", self._wrap_statement(executor.execute))
+        if listeners["builtin"]:
+            globals_env = interpreter.globals
+            for name in BuiltinFunctions.names():
+                builtin = globals_env.vars.get(name)
+                if callable(builtin):
+                    self._builtins[name] = builtin
+                    globals_env.vars[name] = self._wrap_builtin(name, builtin)
+            # Inline-Caches der Aufrufe verweisen sonst weiter auf die Originale
+            globals_env.invalidate()
+
+    def _restore(self):
+        for target, attribute, original in reversed(self._originals):
+            if original is _MISSING:
+                delattr(target, attribute)
+            else:
+                setattr(target, attribute, original)
+        self._originals.clear()
+        if self._builtins:
+            globals_env = self.interpreter.globals
+            globals_env.vars.update(self._builtins)
+            self._builtins.clear()
+            globals_env.invalidate()
+
+    def _replace(self, target, attribute: str, wrapper):
+        """Attribut der Instanz ersetzen und den vorherigen Zustand merken"""
+        self._originals.append((target, attribute, vars(target).get(attribute, _MISSING)))
+        setattr(target, attribute, wrapper)
+
+    def _wrap_call(self, call_function):
+        on_call = self.listeners["call"]
+        on_return = self.listeners["return"]
+        on_exception = self.listeners["exception"]
+
+        def call(func, args, call_site_node=None):
+            name = func.name
+            for listener in on_call:
+                listener(name, args)
+            try:
+                value = call_function(func, args, call_site_node)
+            except TailCallSignal:
+                raise
+            except Exception as error:
+                for listener in on_exception:
+                    listener(name, error)
+                raise
+            for listener in on_return:
+                listener(name, value)
+            return value
+        return call
+
+    def _wrap_statement(self, execute):
+        on_statement = self.listeners["statement"]
+
+        def statement(stmt):
+            for listener in on_statement:
+                listener(stmt)
+            return execute(stmt)
+        return statement
+
+    def _wrap_builtin(self, name: str, builtin):
+        on_builtin = self.listeners["builtin"]
+
+        def call(*args):
+            for listener in on_builtin:
+                listener(name, args)
+            return builtin(*args)
+        return call
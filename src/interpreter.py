@@ -10,39 +10,106 @@ Hauptklasse für die Interpretation von GerLang-Code
 
 import os
 from parser import Program, FunctionDeclaration
-from environment import Environment
+from environment import Environment, GlobalEnvironment, new_scope
+from resolver import Resolver, mark_tail_calls
 from gerlang_builtins import BuiltinFunctions
-from statement_executor import StatementExecutor, ReturnSignal
+from statement_executor import StatementExecutor, ReturnSignal, TailCallSignal
 from expression_evaluator import ExpressionEvaluator
 from error_reporter import ErrorReporter, ErrorInfo, GerLangErrors
 from call_stack import CallStack, CallFrame, RuntimeError as GerLangRuntimeError
+from memo import MemoCache, DEFAULT_SIZE as DEFAULT_MEMO_SIZE, MISSING, check_purity
+from hooks import HookRegistry
+from kiste import KISTE_TYPES
+from governor import Governor, ResourceLimitError
+
+# Interpreter-Version (u.a. Teil des Schlüssels im AST-Cache)
+GERLANG_VERSION = "4.1.0"
 
 
 class Interpreter:
     """Hauptklasse für die Interpretation von GerLang-Code"""
     
-    def __init__(self, current_file=None):
-        """Initialisiert den Interpreter"""
-        self.globals = Environment()
+    def __init__(self, current_file=None, engine="tree", max_depth=None, memo_size=None, limits=None):
+        """Initialisiert den Interpreter (engine: "tree", "closure" oder "vm").
+
+        max_depth begrenzt die Anzahl verschachtelter Funktionsaufrufe (None =
+        unbegrenzt). Die VM hält ihre Frames selbst und kommt damit beliebig
+        tief, Baum-Interpreter und Closure-Engine bleiben an Pythons
+        Rekursionslimit gebunden.
+
+        memo_size ist die Anzahl gespeicherter Ergebnisse pro REIN-Funktion
+        (None = memo.DEFAULT_SIZE, 0 = keine Memoisierung), siehe memo.py.
+
+        limits (governor.Limits) begrenzt Schritte, Laufzeit, Tiefe und die
+        Größe von KISTEN/WORTEN für fremde Skripte, siehe governor.py.
+        """
+        self.globals = GlobalEnvironment()
         self.env = self.globals
+        self.scope = None  # Aktueller Slot-Scope des Baum-Interpreters (None = global)
+        # Neue Scopes (Slot-Scopes bzw. Environments) entstehen über diese
+        # Attribute, damit Metrics nur diesen Interpreter zählt
+        self.new_scope = new_scope
+        self.new_environment = Environment
         self.functions = {}
         self.current_file = current_file  # Aktueller Dateipfad für relative Imports
         self.error_reporter = ErrorReporter()
         self.call_stack = CallStack()
+        self.max_depth = max_depth
+        self.governor = None  # Ohne Limits keine Prüfung an Schleifen und Aufrufen
+        if limits is not None and limits.active():
+            self.governor = Governor(limits)
+            if limits.max_depth is not None:
+                self.max_depth = limits.max_depth if max_depth is None else min(max_depth, limits.max_depth)
+        self.memo_size = DEFAULT_MEMO_SIZE if memo_size is None else memo_size
+        self.memo_caches = {}  # Funktionsname -> MemoCache (nur REIN-Funktionen)
         
         # Module für Statement- und Expression-Handling
-        self.statement_executor = StatementExecutor(self)
-        self.expression_evaluator = ExpressionEvaluator(self)
+        if engine == "closure":
+            # Ein Compiler übernimmt beide Rollen, siehe closure_compiler.py
+            from closure_compiler import ClosureCompiler
+            self.statement_executor = self.expression_evaluator = ClosureCompiler(self)
+        elif engine == "vm":
+            # Bytecode-Compiler + Stack-VM, siehe bytecode.py / vm.py
+            from vm import VirtualMachine
+            self.statement_executor = self.expression_evaluator = VirtualMachine(self)
+        elif engine == "tree":
+            self.statement_executor = StatementExecutor(self)
+            self.expression_evaluator = ExpressionEvaluator(self)
+        else:
+            raise ValueError(f"Unbekannte Engine: {engine}")
+        self.engine = engine
+        # Nur der Baum-Interpreter nutzt Slot-Scopes (siehe resolver.py)
+        self.slot_scopes = engine == "tree"
         
         # Built-in Funktionen registrieren
         BuiltinFunctions.setup_builtins(self.globals)
 
+        # Listener für Aufrufe, Statements, Built-ins und Fehler (siehe hooks.py)
+        self.hooks = HookRegistry(self)
+
+        if self.governor is not None:
+            self.governor.attach(self)
+
     def interpret(self, program: Program):
         """Interpretiert das gesamte Programm"""
         # Erst alle Funktionen sammeln
         for stmt in program.statements:
             if isinstance(stmt, FunctionDeclaration):
                 self.functions[stmt.name] = stmt
+                mark_tail_calls(stmt)
+        # Gecachte Aufrufziele gelten nur für die bisherigen Funktionen
+        self.globals.invalidate()
+        if self.governor is not None:
+            self.governor.start()
+
+        # REIN-Funktionen dürfen keine Seiteneffekte haben, sonst wäre der Cache falsch
+        for func in self.functions.values():
+            if func.pure:
+                check_purity(func, self.functions, self.current_file)
+
+        # Lokale Variablen vorab an Slots binden
+        if self.slot_scopes:
+            Resolver().resolve(program)
 
         # Dann alle globalen Statements ausführen (außer Funktionen)
         for stmt in program.statements:
@@ -59,7 +126,7 @@ class Interpreter:
         return None
 
     def execute_function(self, name, args, call_site_node=None):
-        """Führt eine Funktion aus"""
+        """Sucht eine Funktion, prüft die Argumente und führt sie aus"""
         func = self.functions.get(name)
         if not func:
             raise GerLangRuntimeError(
@@ -80,39 +147,117 @@ class Interpreter:
                 self.call_stack.get_stack_trace()
             )
 
+        return self.call_function(func, args, call_site_node)
+
+    def call_function(self, func, args, call_site_node=None):
+        """Führt eine bereits gefundene Funktion mit passend vielen Argumenten
+        aus (Aufrufer mit Inline-Cache überspringen execute_function)"""
+        if call_site_node is not None and getattr(call_site_node, "tail_call", False):
+            # ZURÜCK name(...) in name: die laufende Ausführung übernimmt den Aufruf
+            raise TailCallSignal(args)
+
+        key = None
+        if func.pure and self.memo_size:
+            # REIN: gleiche Argumente liefern das gespeicherte Ergebnis
+            memo = self.memo_cache(func)
+            key = memo.key(args)
+            if key is not None:
+                result = memo.get(key)
+                if result is not MISSING:
+                    return result
+
+        governor = self.governor
+        if governor is not None:
+            # Governor.tick ohne eigenen Python-Aufruf (jeder Aufruf ist ein Schritt)
+            governor.countdown -= 1
+            if governor.countdown <= 0:
+                governor.check(call_site_node)
+        if self.max_depth is not None and len(self.call_stack.frames) >= self.max_depth:
+            raise self.depth_error(
+                call_site_node.line if call_site_node else 1,
+                call_site_node.column if call_site_node else 1
+            )
+
         # Call-Stack Frame hinzufügen
         self.call_stack.push(
-            name, 
+            func.name, 
             self.current_file or "",
-            call_site_node.line if call_site_node and hasattr(call_site_node, 'line') else 1,
-            call_site_node.column if call_site_node and hasattr(call_site_node, 'column') else 1
+            call_site_node.line if call_site_node else 1,
+            call_site_node.column if call_site_node else 1
         )
 
-        # Neue lokale Umgebung erstellen
-        local_env = Environment(self.globals)
-
-        # Parameter binden
-        for (ptype, pname), arg in zip(func.parameters, args):
-            local_env.define(pname, arg)
-
-        # Umgebung wechseln
         previous_env = self.env
-        self.env = local_env
+        previous_scope = self.scope
+        self._bind_parameters(func, args)
 
         try:
-            self.execute(func.body)
-            # Kein explizites Return -> None zurückgeben
-            result = None
-        except ReturnSignal as r:
-            result = r.value
+            while True:
+                try:
+                    self.execute(func.body)
+                    # Kein explizites Return -> None zurückgeben
+                    result = None
+                except ReturnSignal as r:
+                    result = r.value
+                except TailCallSignal as t:
+                    # Endaufruf: Frame wiederverwenden und den Rumpf mit neuen
+                    # Argumenten wiederholen, statt verschachtelt aufzurufen
+                    if governor is not None:
+                        governor.tick(call_site_node)
+                    self.call_stack.reuse()
+                    self._bind_parameters(func, t.arguments)
+                    continue
+                break
         finally:
             # Call-Stack Frame entfernen
             self.call_stack.pop()
             # Umgebung zurücksetzen
             self.env = previous_env
-        
+            self.scope = previous_scope
+
+        if key is not None:
+            memo.store(key, result)
         return result
 
+    def memo_cache(self, func):
+        """MemoCache einer REIN-Funktion (None ohne REIN oder bei memo_size 0)"""
+        if not func.pure or not self.memo_size:
+            return None
+        memo = self.memo_caches.get(func.name)
+        if memo is None:
+            memo = self.memo_caches[func.name] = MemoCache(func.name, self.memo_size)
+        return memo
+
+    def memo_statistics(self):
+        """Treffer/Fehlschläge pro memoisierter Funktion, nach Namen sortiert"""
+        return [self.memo_caches[name].statistics() for name in sorted(self.memo_caches)]
+
+    def depth_error(self, line, column):
+        """Fehler beim Überschreiten von max_depth (an der Aufrufstelle)"""
+        return ResourceLimitError(
+            f"Maximale Aufruftiefe von {self.max_depth} überschritten",
+            self.current_file or "", line, column,
+            self.call_stack.get_stack_trace()
+        )
+
+    def _bind_parameters(self, func, args):
+        """Neuer Frame bzw. neue lokale Umgebung mit den Argumenten"""
+        if self.slot_scopes:
+            # Frame mit Slots für Parameter und Rumpf (aufgelöst vom Resolver)
+            frame = self.new_scope(None, func.frame_size)
+            for slot, arg in zip(func.parameter_slots, args):
+                frame[slot] = arg
+            self.scope = frame
+        else:
+            # Neue lokale Umgebung erstellen
+            local_env = self.new_environment(self.globals)
+
+            # Parameter binden
+            for (ptype, pname), arg in zip(func.parameters, args):
+                local_env.define(pname, arg)
+
+            # Umgebung wechseln
+            self.env = local_env
+
     def execute(self, stmt):
         """Führt ein Statement aus - delegiert an StatementExecutor"""
         return self.statement_executor.execute(stmt)
@@ -131,7 +276,7 @@ class Interpreter:
             return value != 0
         elif isinstance(value, str):
             return len(value) > 0
-        elif isinstance(value, list):
+        elif isinstance(value, KISTE_TYPES):
             return len(value) > 0
         else:
             return True
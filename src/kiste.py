@@ -0,0 +1,159 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Typisierte KISTEN für Zahlen (NEUE_KISTE)
+
+Eine KISTE ist normalerweise eine Python-Liste mit einem Objekt pro Element.
+NEUE_KISTE(n, 0) bzw. NEUE_KISTE(n, 0.0) legt stattdessen ein array('q')
+bzw. array('d') an: 8 Byte pro Element statt Zeiger plus Zahl-Objekt.
+Lesen, .LÄNGE, Ausgabe, HINZUFÜGEN/ERWEITERN und Zuweisungen funktionieren
+wie bei jeder KISTE; geschrieben werden dürfen aber nur passende Zahlen
+(check_element), eine GANZ-KISTE nimmt also kein KOMMA und kein JA auf.
+
+TypedKiste ist ein array mit den Operatoren einer KISTE: == vergleicht mit
+Listen elementweise, + mit einer Liste (oder einem anderen Typcode) ergibt
+eine normale Liste. So verhalten sich alle Engines und das übersetzte
+Python gleich, ohne dass + und == für Listen langsamer werden.
+"""
+
+from array import array
+
+from call_stack import RuntimeError as GerLangRuntimeError
+
+
+class TypedKiste(array):
+    """Typisierte KISTE (array('q') bzw. array('d'))"""
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if type(other) is list:
+            return self.tolist() == other
+        return array.__eq__(self, other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __add__(self, other):
+        if type(other) is TypedKiste and other.typecode == self.typecode:
+            result = TypedKiste(self.typecode, self)
+            result.extend(other)
+            return result
+        if isinstance(other, KISTE_TYPES):
+            return self.tolist() + list(other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if type(other) is list:
+            return other + self.tolist()
+        return NotImplemented
+
+    def __mul__(self, count):
+        if type(count) is not int:
+            return NotImplemented
+        return TypedKiste(self.typecode, array.__mul__(self, count))
+
+    __rmul__ = __mul__
+
+    def __copy__(self):
+        return TypedKiste(self.typecode, self)
+
+    def __deepcopy__(self, memo):
+        return TypedKiste(self.typecode, self)
+
+
+# Python-Typen einer KISTE (Liste oder typisiertes Array)
+KISTE_TYPES = (list, TypedKiste)
+
+# Werte mit .LÄNGE
+SIZED_TYPES = (list, TypedKiste, str)
+
+# Typ des Startwerts -> Typcode des Arrays
+TYPECODES = {int: "q", float: "d"}
+
+# GerLang-Namen für Fehlermeldungen
+_TYPE_NAMES = {int: "GANZ", float: "KOMMA", str: "WORT", bool: "JAIN", type(None): "NIX",
+               list: "KISTE", TypedKiste: "KISTE"}
+_ELEMENT_NAMES = {"q": "GANZ", "d": "KOMMA"}
+
+_GANZ_MIN, _GANZ_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def new_kiste(length, value=0):
+    """NEUE_KISTE(länge, startwert): typisiert für GANZ und KOMMA, sonst Liste"""
+    if type(length) is not int or length < 0:
+        raise ValueError("Die Länge muss eine nicht negative GANZ-Zahl sein")
+    typecode = TYPECODES.get(type(value))
+    if typecode is not None:
+        check_element(TypedKiste(typecode), value)
+        return TypedKiste(typecode, array(typecode, (value,)) * length)
+    if isinstance(value, KISTE_TYPES):
+        # Alle Elemente wären dieselbe KISTE
+        raise ValueError("Der Startwert darf keine KISTE sein")
+    return [value] * length
+
+
+def check_element(kiste, value):
+    """Wert, der in eine typisierte KISTE geschrieben werden soll, prüfen"""
+    kind = type(value)
+    typecode = kiste.typecode
+    if typecode == "q":
+        if kind is int:
+            if _GANZ_MIN <= value <= _GANZ_MAX:
+                return value
+            raise GerLangRuntimeError(f"Wert {value} passt nicht in eine KISTE GANZ (64 Bit)")
+    elif kind is float or kind is int:
+        return value
+    raise GerLangRuntimeError(
+        f"KISTE {_ELEMENT_NAMES[typecode]} nimmt nur {_ELEMENT_NAMES[typecode]}-Werte auf, nicht {type_name(value)}")
+
+
+def check_elements(kiste, values):
+    """check_element für alle Werte (HINZUFÜGEN/ERWEITERN), Listen bleiben ungeprüft"""
+    if type(kiste) is not list:
+        for value in values:
+            check_element(kiste, value)
+
+
+def printable(value):
+    """Wert für das DRUCKE-Statement (print): typisierte KISTEN wie Listen, auch verschachtelt"""
+    kind = type(value)
+    if kind is TypedKiste:
+        return value.tolist()
+    if kind is list and _contains_typed(value, set()):
+        return _plain(value, {})
+    return value
+
+
+def _contains_typed(items, seen: set) -> bool:
+    seen.add(id(items))
+    for item in items:
+        kind = type(item)
+        if kind is TypedKiste:
+            return True
+        if kind is list and id(item) not in seen and _contains_typed(item, seen):
+            return True
+    return False
+
+
+def _plain(value, converted: dict):
+    """Kopie aus Listen statt TypedKiste (geteilte und zyklische Listen bleiben es)"""
+    kind = type(value)
+    if kind is TypedKiste:
+        return value.tolist()
+    if kind is not list:
+        return value
+    result = converted.get(id(value))
+    if result is None:
+        result = converted[id(value)] = []
+        result.extend([_plain(item, converted) for item in value])
+    return result
+
+
+def type_name(value) -> str:
+    return _TYPE_NAMES.get(type(value), type(value).__name__)
@@ -1,15 +1,17 @@
 # Copyright (c) 2025 KibaOfficial
-# 
+#
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 import re
-from typing import List, NamedTuple, Optional
+import sys
+from array import array
+from typing import Iterable, Iterator, List, NamedTuple, TextIO, Tuple
 from tokens import KEYWORDS, LITERALS, OPERATORS
 
 # Ein-Zeichen Operatoren und Delimiters
 single_char_tokens = {
   '(': 'LPAREN',
-  ')': 'RPAREN', 
+  ')': 'RPAREN',
   '{': 'LBRACE',
   '}': 'RBRACE',
   '[': 'LBRACKET',
@@ -29,12 +31,154 @@ single_char_tokens = {
   ':': 'COLON'  # <-- Doppelpunkt für Parameter
 }
 
+# Zwei-Zeichen Operatoren sind ihr eigener Token-Typ
+two_char_tokens = ["==", "!=", "<=", ">=", "&&", "||", "++"]
+
+# Operator-Text -> Token-Typ (Zwei-Zeichen-Operatoren haben Vorrang)
+_OPERATOR_TYPES = {op: op for op in two_char_tokens}
+_OPERATOR_TYPES.update(single_char_tokens)
+
+# Wort -> Token-Typ. Reihenfolge wie früher: KEYWORDS vor LITERALS vor OPERATORS
+_WORD_TYPES = {word: mapped for word, mapped in OPERATORS.items()}
+_WORD_TYPES.update({word: "BOOL_LITERAL" for word in LITERALS})
+_WORD_TYPES.update(KEYWORDS)
+
+# Ein einziges Master-Pattern: überspringt Leerraum und Kommentare und erkennt
+# danach genau ein Token. Die Alternativen stehen in derselben Reihenfolge, in
+# der der alte zeichenweise Lexer geprüft hat. Die Token-Gruppe ist optional,
+# damit das Pattern immer matcht und Fehler an m.end() erkannt werden.
+_TOKEN_PATTERN = re.compile(r"""
+  (?:\s+|//[^\n]*|HINWEIS:[^\n]*)*
+  (?:
+      (?P<STRING>"[^"\\]*(?:\\.[^"\\]*)*"|'[^'\\]*(?:\\.[^'\\]*)*')
+    | (?P<NUMBER>\d+(?:\.\d*)?)
+    | (?P<OPERATOR>==|!=|<=|>=|&&|\|\||\+\+|[(){}\[\];,.+\-*/%=<>!:])
+    | (?P<IDENTIFIER>[^\W\d]\w*)
+  )?
+""", re.VERBOSE | re.DOTALL)
+
+# Alle Token-Typen mit kleinem Integer-Code. EOF hat Code 0, damit der Parser
+# "nicht am Ende" als einfachen Wahrheitswert prüfen kann.
+TOKEN_TYPES = ["EOF", "IDENTIFIER", "INT_LITERAL", "FLOAT_LITERAL", "STRING_LITERAL",
+               "TEMPLATE_STRING_LITERAL", "BOOL_LITERAL"]
+for _token_type in list(_OPERATOR_TYPES.values()) + list(_WORD_TYPES.values()):
+  if _token_type not in TOKEN_TYPES:
+    TOKEN_TYPES.append(_token_type)
+TOKEN_TYPES = tuple(TOKEN_TYPES)
+TOKEN_CODES = {token_type: code for code, token_type in enumerate(TOKEN_TYPES)}
+EOF_CODE = TOKEN_CODES["EOF"]
+
+# Werte dieser Typen wiederholen sich ständig und werden interniert
+_INTERNED_CODES = frozenset(
+  TOKEN_CODES[t] for t in TOKEN_TYPES
+  if t not in ("INT_LITERAL", "FLOAT_LITERAL", "STRING_LITERAL", "TEMPLATE_STRING_LITERAL")
+)
+
+# Escape-Sequenzen und Interpolations-Marker innerhalb eines String-Literals
+_STRING_SPECIALS = re.compile(r"\\(.)|(\$\{)", re.DOTALL)
+_ESCAPES = {'n': '\n', 't': '\t'}
+
+# Standard-Blockgröße beim Lesen aus Dateien im Streaming-Modus
+STREAM_CHUNK_SIZE = 64 * 1024
+
 class Token(NamedTuple):
   type: str
   value: str
   line: int
   column: int
 
+# tuple.__new__ spart den Python-Frame des NamedTuple-Konstruktors
+_new_tuple = tuple.__new__
+
+class TokenStore:
+  """Kompakte Token-Liste.
+
+  Typen liegen als Byte-Codes (TOKEN_CODES), Zeile und Spalte in parallelen
+  array('i')-Spalten, Identifier- und Keyword-Werte sind interniert. Per
+  Index oder Iteration erhält man wieder normale Token-Tupel, z.B. für die
+  lex-Ausgabe oder den ErrorReporter.
+  """
+  __slots__ = ("types", "values", "lines", "columns")
+
+  def __init__(self):
+    self.types = bytearray()
+    self.values = []
+    self.lines = array('i')
+    self.columns = array('i')
+
+  @classmethod
+  def from_tokens(cls, tokens: Iterable[Token]) -> "TokenStore":
+    store = cls()
+    store.extend(tokens)
+    return store
+
+  def append(self, token: Token):
+    code = TOKEN_CODES[token.type]
+    self.types.append(code)
+    self.values.append(sys.intern(token.value) if code in _INTERNED_CODES else token.value)
+    self.lines.append(token.line)
+    self.columns.append(token.column)
+
+  def extend(self, tokens: Iterable[Token]):
+    for token in tokens:
+      self.append(token)
+
+  def __len__(self) -> int:
+    return len(self.types)
+
+  def __getitem__(self, index: int) -> Token:
+    return _new_tuple(Token, (TOKEN_TYPES[self.types[index]], self.values[index],
+                              self.lines[index], self.columns[index]))
+
+  def __iter__(self) -> Iterator[Token]:
+    for code, value, line, column in zip(self.types, self.values, self.lines, self.columns):
+      yield _new_tuple(Token, (TOKEN_TYPES[code], value, line, column))
+
+def _position_at(source: str, offset: int) -> Tuple[int, int]:
+  """(Zeile, Spalte) eines Offsets, gezählt wie im Lexer (nur '\\n' bricht um)"""
+  line_start = source.rfind('\n', 0, offset) + 1
+  return source.count('\n', 0, offset) + 1, offset - line_start + 1
+
+def _advance_position(line: int, column: int, text: str) -> Tuple[int, int]:
+  """Position nach text, wenn text bei (Zeile, Spalte) beginnt"""
+  newlines = text.count('\n')
+  if newlines:
+    return line + newlines, len(text) - text.rfind('\n')
+  return line, column + len(text)
+
+def _shift_tokens(tokens: List[Token], start: int, old_end: Tuple[int, int],
+                  new_end: Tuple[int, int]):
+  """Verschiebt tokens[start:] in-place von hinter old_end nach hinter new_end"""
+  line_delta = new_end[0] - old_end[0]
+  column_delta = new_end[1] - old_end[1]
+  index = start
+  # Tokens in der Zeile des Änderungsendes verschieben sich auch in der Spalte
+  while index < len(tokens) and tokens[index].line == old_end[0]:
+    token_type, value, _, column = tokens[index]
+    tokens[index] = _new_tuple(Token, (token_type, value, new_end[0], column + column_delta))
+    index += 1
+  # Alle weiteren Tokens nur bei Zeilenverschiebung anfassen
+  if line_delta:
+    tokens[index:] = [_new_tuple(Token, (token_type, value, line + line_delta, column))
+                      for token_type, value, line, column in tokens[index:]]
+
+def _decode_string(body: str):
+  """Löst Escapes auf und erkennt ${...}. Gibt (Wert, ist_template) zurück"""
+  if '\\' not in body:
+    return body, '${' in body
+
+  has_interpolation = False
+
+  def replace(match):
+    nonlocal has_interpolation
+    escaped = match.group(1)
+    if escaped is None:
+      has_interpolation = True
+      return '${'
+    return _ESCAPES.get(escaped, escaped)
+
+  return _STRING_SPECIALS.sub(replace, body), has_interpolation
+
 class Lexer:
   def __init__(self, source: str):
     self.source = source
@@ -42,186 +186,171 @@ class Lexer:
     self.line = 1
     self.column = 1
     self.tokens = []
+    # Offset des aktuellen Zeilenanfangs, daraus ergibt sich die Spalte
+    self._line_start = 0
 
-  def current_char(self) -> Optional[str]:
-    if self.position >= len(self.source):
-      return None
-    return self.source[self.position]
-
-  def peek_char(self, offset: int = 1) -> Optional[str]:
-    peek_pos = self.position + offset
-    if peek_pos >= len(self.source):
-      return None
-    return self.source[peek_pos]
-
-  def advance(self):
-    if (self.position < len(self.source) and self.source[self.position] == '\n'):
-      self.line += 1
-      self.column = 1
-    else:
-      self.column += 1
-    self.position += 1
-
-  def skip_whitespace(self):
-    while self.current_char() is not None and self.current_char().isspace():
-      self.advance()
-  
-  def skip_comment(self):
-    # Einzeilige Kommentare mit // oder HINWEIS:
-    if self.current_char() == '/' and self.peek_char() == '/':
-        while self.current_char() and self.current_char() != '\n':
-            self.advance()
-    elif self.match_word("HINWEIS:"):
-        # Überspringe "HINWEIS:" erst
-        for _ in range(8):  # Länge von "HINWEIS:"
-            self.advance()
-        while self.current_char() and self.current_char() != '\n':
-            self.advance()
-
-  def match_word(self, word: str) -> bool:
-    """Prüft ob das aktuelle Wort mit dem gegebenen Wort übereinstimmt"""
-    if self.position + len(word) > len(self.source):
-      return False
-    return self.source[self.position:self.position + len(word)] == word
-  
-  def read_string(self) -> str:
-    """Liest einen String zwischen Anführungszeichen"""
-    quote_char = self.current_char() # " oder '
-    self.advance()  # Anführungszeichen überspringen
-
-    value = ""
-    has_interpolation = False
-    
-    while self.current_char() and self.current_char() != quote_char:
-      if self.current_char() == '\\': # Escape-Sequenz
-        self.advance()
-        if self.current_char() == 'n':
-          value += '\n'
-        elif self.current_char() == 't':
-          value += '\t'
-        elif self.current_char() == '\\':
-            value += '\\'
-        elif self.current_char() == quote_char:
-          value += quote_char
-        else:
-          value += self.current_char()
-      elif self.current_char() == '$' and self.peek_char() == '{':
-        # Template-String erkannt
-        has_interpolation = True
-        value += self.current_char()  # $
-        self.advance()
-        value += self.current_char()  # {
+  def _scan(self, text: str, final: bool = True) -> Iterator[Token]:
+    """Zerlegt text ab self.position in Tokens (inklusive EOF-Token).
+
+    Mit final=False ist text nur ein Präfix der Eingabe: Tokens, die bis ans
+    Ende von text reichen, könnten mit mehr Eingabe noch anders aussehen und
+    werden zurückgehalten. Der Zustand zeigt danach auf den Rest.
+    """
+    match = _TOKEN_PATTERN.match
+    operator_types = _OPERATOR_TYPES
+    word_types = _WORD_TYPES
+    end = len(text)
+    pos = self.position
+    line = self.line
+    line_start = self._line_start
+
+    while True:
+      m = match(text, pos)
+      kind = m.lastgroup
+      start = m.start(kind) if kind else m.end()
+
+      if not final and (m.end() >= end or (kind is None and (start >= end - 1 or text[start] in '"\''))):
+        self.position, self.line, self._line_start = pos, line, line_start
+        self.column = pos - line_start + 1
+        return
+
+      # Zeilenumbrüche im übersprungenen Leerraum nachzählen
+      if start != pos:
+        newlines = text.count('\n', pos, start)
+        if newlines:
+          line += newlines
+          line_start = text.rfind('\n', pos, start) + 1
+
+      if kind is None:
+        self.position, self.line, self._line_start = start, line, line_start
+        self.column = start - line_start + 1
+        if start >= end:
+          yield Token("EOF", "", line, self.column)
+          return
+        char = text[start]
+        if char in '"\'':
+          # Der alte Lexer las bis zum Dateiende, bevor er abbrach
+          newlines = text.count('\n', start, end)
+          if newlines:
+            self.line = line + newlines
+            self._line_start = text.rfind('\n', start, end) + 1
+          self.position = end
+          self.column = end - self._line_start + 1
+          raise SyntaxError(f"Unterminated string at line {self.line}, column {self.column}")
+        raise SyntaxError(f"Unexpected character '{char}' at line {line}, column {self.column}")
+
+      pos = m.end()
+      value = m.group(kind)
+      column = start - line_start + 1
+
+      if kind == "IDENTIFIER":
+        yield Token(word_types.get(value, "IDENTIFIER"), value, line, column)
+      elif kind == "OPERATOR":
+        yield Token(operator_types[value], value, line, column)
+      elif kind == "NUMBER":
+        yield Token("FLOAT_LITERAL" if '.' in value else "INT_LITERAL", value, line, column)
       else:
-        value += self.current_char()
-      self.advance()
-    
-    if self.current_char() == quote_char:
-      self.advance()
-    else:
-      raise SyntaxError(f"Unterminated string at line {self.line}, column {self.column}")
-    
-    # Markiere als Template-String wenn Interpolation gefunden
-    if has_interpolation:
-        return ("TEMPLATE_STRING", value)
-    
-    return value
-
-  def read_number(self) -> str:
-    """Liest eine Zahl (int oder float)"""
-    value = ""
-    has_dot = False
-    
-    while self.current_char() and (self.current_char().isdigit() or self.current_char() == '.'):
-      if self.current_char() == '.':
-        if has_dot:
-            break
-        has_dot = True
-      value += self.current_char()
-      self.advance()
-
-    
-    return value
-  
-  def read_identifier(self) -> str:
-    """Liest einen Identifier (Variablennamen, Keywords, etc.)"""
-    value = ""
-
-    while (self.current_char() and 
-            (self.current_char().isalnum() or 
-              self.current_char() in '_ÄÖÜäöüß')):
-            value += self.current_char()
-            self.advance()
-    return value
-  
+        decoded, is_template = _decode_string(value[1:-1])
+        token_type = "TEMPLATE_STRING_LITERAL" if is_template else "STRING_LITERAL"
+        yield Token(token_type, decoded, line, column)
+        newlines = value.count('\n')
+        if newlines:
+          line += newlines
+          line_start = text.rfind('\n', start, pos) + 1
+
   def tokenize(self) -> List[Token]:
     """Hauptfunktion - zerlegt den Quellcode in Tokens"""
-    while self.current_char():
-      self.skip_whitespace()
-
-      if not self.current_char():
-        break
-
-      # Kommentare
-      if (self.current_char() == '/' and self.peek_char() == '/') or self.match_word("HINWEIS:"):
-        self.skip_comment()
-        continue
-
-      # Strings
-      if self.current_char() in '"\'':
-        line, col = self.line, self.column
-        result = self.read_string()
-        
-        # Prüfe ob es ein Template-String ist
-        if isinstance(result, tuple) and result[0] == "TEMPLATE_STRING":
-            self.tokens.append(Token("TEMPLATE_STRING_LITERAL", result[1], line, col))
-        else:
-            self.tokens.append(Token("STRING_LITERAL", result, line, col))
-        continue
-      
-      # Zahlen
-      if self.current_char().isdigit():
-        line, col = self.line, self.column
-        number = self.read_number()
-        token_type = "FLOAT_LITERAL" if '.' in number else "INT_LITERAL"
-        self.tokens.append(Token(token_type, number, line, col))
-        continue
-
-      # Zwei-Zeichen-Operatoren
-      two_char = self.source[self.position:self.position + 2] if self.position + 1 < len(self.source) else ""
-      if two_char in ["==", "!=", "<=", ">=", "&&", "||", "++"]:
-        line, col = self.line, self.column
-        self.advance()
-        self.advance()
-        self.tokens.append(Token(two_char, two_char, line, col))
-        continue
-
-      if self.current_char() in single_char_tokens:
-        line, col = self.line, self.column
-        char = self.current_char()
-        self.advance()
-        self.tokens.append(Token(single_char_tokens[char], char, line, col))
-        continue
-      
-      # Identifiers und Keywords
-      if self.current_char().isalpha() or self.current_char() in '_ÄÖÜäöüß':
-        line, col = self.line, self.column
-        identifier = self.read_identifier()
-        
-        # Prüfe ob es ein Keyword ist
-        if identifier in KEYWORDS:
-            self.tokens.append(Token(KEYWORDS[identifier], identifier, line, col))
-        elif identifier in LITERALS:
-            self.tokens.append(Token("BOOL_LITERAL", identifier, line, col))
-        elif identifier in OPERATORS:
-            mapped_op = OPERATORS[identifier]
-            self.tokens.append(Token(mapped_op, identifier, line, col))
+    self.tokens.extend(self._scan(self.source))
+    return self.tokens
+
+  def tokenize_compact(self) -> TokenStore:
+    """Wie tokenize(), speichert die Tokens aber in einem TokenStore"""
+    return TokenStore.from_tokens(self._scan(self.source))
+
+  @classmethod
+  def relex(cls, source: str, tokens: List[Token], offset: int, removed: int,
+            inserted: str) -> Tuple[str, List[Token]]:
+    """Zerlegt nach einer Textänderung nur den betroffenen Bereich neu.
+
+    tokens ist das Ergebnis von tokenize() für source. Die Änderung ersetzt
+    removed Zeichen ab offset durch inserted. Ergebnis ist (neuer Quelltext,
+    tokens); die Liste wird in-place aktualisiert und ist danach identisch
+    zu einem kompletten tokenize() des neuen Texts.
+
+    Gescannt wird ab dem letzten Token vor der Änderung, bis ein neues Token
+    wieder an derselben (verschobenen) Stelle beginnt wie ein altes. Ab dort
+    ist der Rest des Texts gleich, also auch die Tokens; sie werden nur in
+    Zeile/Spalte verschoben. Öffnet oder schließt die Änderung einen String
+    oder Kommentar, läuft der Scan entsprechend weiter.
+    """
+    if not 0 <= offset <= offset + removed <= len(source):
+      raise ValueError(f"Änderung {offset}+{removed} liegt außerhalb des Quelltexts")
+    new_source = source[:offset] + inserted + source[offset + removed:]
+
+    # Änderung in Zeile/Spalte: Beginn, altes Ende, neues Ende
+    edit_pos = _position_at(source, offset)
+    old_end = _advance_position(*edit_pos, source[offset:offset + removed])
+    new_end = _advance_position(*edit_pos, inserted)
+    line_delta = new_end[0] - old_end[0]
+
+    # Letztes Token, das vor der Änderung beginnt (Tokens sind nach Position sortiert)
+    low, high = 0, len(tokens) - 1  # EOF nie als Startpunkt
+    while low < high:
+      mid = (low + high) // 2
+      if (tokens[mid].line, tokens[mid].column) < edit_pos:
+        low = mid + 1
+      else:
+        high = mid
+    restart = low - 1
+
+    lexer = cls(new_source)
+    if restart >= 0:
+      anchor = tokens[restart]
+      # Offset des Anker-Tokens: vom Zeilenanfang der Änderung zurücklaufen
+      line_start = offset - (edit_pos[1] - 1)
+      for _ in range(edit_pos[0] - anchor.line):
+        line_start = source.rfind('\n', 0, line_start - 1) + 1
+      lexer.position = line_start + anchor.column - 1
+      lexer.line = anchor.line
+      lexer._line_start = line_start
+
+    fresh = []
+    old_index = max(restart, 0)
+    for token in lexer._scan(new_source):
+      position = (token.line, token.column)
+      if token.type != "EOF" and position >= new_end:
+        # Neue Position auf den alten Text zurückrechnen
+        if token.line == new_end[0]:
+          old_position = (old_end[0], token.column - new_end[1] + old_end[1])
         else:
-            self.tokens.append(Token("IDENTIFIER", identifier, line, col))
-        continue
-
-      # Unbekanntes Zeichen
-      raise SyntaxError(f"Unexpected character '{self.current_char()}' at line {self.line}, column {self.column}")
-    
-    # EOF Token
-    self.tokens.append(Token("EOF", "", self.line, self.column))
-    return self.tokens
\ No newline at end of file
+          old_position = (token.line - line_delta, token.column)
+        while (tokens[old_index].line, tokens[old_index].column) < old_position:
+          old_index += 1
+        candidate = tokens[old_index]
+        if (candidate.line, candidate.column) == old_position and candidate.type != "EOF":
+          _shift_tokens(tokens, old_index, old_end, new_end)
+          tokens[max(restart, 0):old_index] = fresh
+          return new_source, tokens
+      fresh.append(token)
+    tokens[max(restart, 0):] = fresh
+    return new_source, tokens
+
+  @classmethod
+  def stream(cls, file: TextIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Token]:
+    """Liest eine Datei blockweise und liefert die Tokens lazy (inklusive EOF).
+
+    Im Speicher liegt nur der noch nicht zerlegte Rest der Eingabe, nie die
+    ganze Datei oder die komplette Token-Liste.
+    """
+    lexer = cls("")
+    buffer = ""
+    while True:
+      chunk = file.read(chunk_size)
+      # Bereits zerlegten Teil verwerfen; Offsets auf den neuen Puffer umrechnen
+      buffer = buffer[lexer.position:] + chunk
+      lexer._line_start -= lexer.position
+      lexer.position = 0
+      lexer.source = buffer
+      yield from lexer._scan(buffer, final=not chunk)
+      if not chunk:
+        return
@@ -0,0 +1,204 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Memoisierung reiner Funktionen für GerLang 4.1.0
+Prüft REIN-Funktionen auf Seiteneffekte und speichert ihre Ergebnisse in
+einem LRU-Cache pro Funktion (siehe Interpreter.execute_function)
+"""
+
+import copy
+import math
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from parser import (
+    ASTNode, FunctionDeclaration, VariableDeclaration, AssignmentStatement,
+    PrintStatement, TryCatchStatement, SetExpression, IdentifierExpression,
+    CallExpression, MethodCallExpression, iter_children
+)
+from gerlang_builtins import BuiltinFunctions
+from optimizer import PURE_BUILTINS
+from call_stack import RuntimeError as GerLangRuntimeError
+from kiste import KISTE_TYPES, TypedKiste
+
+# Standardgröße des Caches pro Funktion (gerlang run --memo-size)
+DEFAULT_SIZE = 1024
+
+# KISTE-Argumente mit mehr Elementen (inkl. verschachtelter) werden nicht
+# memoisiert: der Schlüssel kostet bei jedem Aufruf Zeit und Speicher
+MAX_KISTE_KEY = 1000
+
+# Rückgabe von MemoCache.get für Schlüssel ohne gespeichertes Ergebnis
+MISSING = object()
+
+
+_BUILTIN_NAMES = BuiltinFunctions.names()
+
+
+class MemoCache:
+    """LRU-Cache der Ergebnisse einer REIN-Funktion.
+
+    Der Schlüssel enthält neben den Argumenten auch deren Typen, damit z.B.
+    f(1), f(1.0) und f(JA) getrennt bleiben, bei KOMMA-Argumenten auch das
+    Vorzeichen (0.0 == -0.0, DRUCKE zeigt aber -0.0). KISTE-Argumente werden
+    über ihren Inhalt gehasht (Schnappschuss als Tupel), ab MAX_KISTE_KEY
+    Elementen läuft der Aufruf ohne Cache (bypassed). KISTE-Ergebnisse werden
+    beim Speichern und bei jedem Treffer kopiert: jeder Aufrufer bekommt wie
+    ohne Cache eine eigene KISTE.
+    """
+
+    __slots__ = ("name", "max_size", "entries", "hits", "misses", "bypassed")
+
+    def __init__(self, name: str, max_size: int = DEFAULT_SIZE):
+        self.name = name
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def key(self, args) -> Optional[tuple]:
+        """Schlüssel für einen Aufruf, None wenn er nicht memoisiert wird"""
+        key = (*args, *map(type, args))
+        types = key[len(args):]
+        if float in types and 0.0 in args:
+            key += tuple(math.copysign(1.0, arg) for arg in args if type(arg) is float)
+        if list in types or TypedKiste in types:
+            try:
+                key = _freeze(args, [MAX_KISTE_KEY])
+            except (_TooLarge, RecursionError):
+                self.bypassed += 1
+                return None
+        return key
+
+    def get(self, key):
+        """Gespeichertes Ergebnis oder MISSING"""
+        value = self.entries.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+            return MISSING
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return copy.deepcopy(value) if isinstance(value, KISTE_TYPES) else value
+
+    def store(self, key, value):
+        """Speichert ein Ergebnis und verdrängt ggf. das älteste"""
+        entries = self.entries
+        entries[key] = copy.deepcopy(value) if isinstance(value, KISTE_TYPES) else value
+        if len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+    def statistics(self) -> Dict[str, int]:
+        return {
+            "funktion": self.name,
+            "treffer": self.hits,
+            "fehlschlaege": self.misses,
+            "umgangen": self.bypassed,
+            "eintraege": len(self.entries),
+            "groesse": self.max_size,
+        }
+
+
+class _TooLarge(Exception):
+    pass
+
+
+def _freeze(values, budget: list) -> tuple:
+    """Hashbarer Schnappschuss (Werte + Typen, Vorzeichen von KOMMA), KISTEN rekursiv als Tupel"""
+    frozen = []
+    for value in values:
+        if type(value) is list:
+            budget[0] -= len(value)
+            if budget[0] < 0:
+                raise _TooLarge()
+            frozen.append((list, _freeze(value, budget)))
+        elif type(value) is TypedKiste:
+            budget[0] -= len(value)
+            if budget[0] < 0:
+                raise _TooLarge()
+            # Rohbytes unterscheiden auch 0.0 und -0.0
+            frozen.append((TypedKiste, value.typecode, value.tobytes()))
+        elif type(value) is float:
+            frozen.append((float, value, math.copysign(1.0, value)))
+        else:
+            frozen.append((type(value), value))
+    return tuple(frozen)
+
+
+def purity_violation(decl: FunctionDeclaration, functions: Dict[str, FunctionDeclaration]) -> Optional[Tuple[str, ASTNode]]:
+    """Erster Seiteneffekt im Rumpf einer Funktion als (Beschreibung, Knoten).
+
+    Verboten sind DRUCKE, Built-ins außer PURE_BUILTINS (LESE, ZUFALLSZAHL,
+    ...), Aufrufe nicht reiner Funktionen, Lesen und Schreiben globaler
+    Variablen (Namen, die weder Parameter noch lokal deklariert sind) sowie
+    Änderungen an KISTEN (Element-Zuweisung, HINZUFÜGEN/ERWEITERN).
+    """
+    local_names = {name for _, name in decl.parameters}
+    work = [decl.body]
+    while work:
+        node = work.pop()
+        kind = type(node)
+        if kind is VariableDeclaration:
+            local_names.add(node.name)
+        elif kind is TryCatchStatement and node.catch_var:
+            local_names.add(node.catch_var)
+        elif kind is FunctionDeclaration:
+            continue
+        work.extend(iter_children(node))
+
+    work = [decl.body]
+    while work:
+        node = work.pop()
+        kind = type(node)
+        if kind is PrintStatement:
+            return "nicht mit DRUCKE ausgeben", node.expression
+        elif kind is AssignmentStatement:
+            if node.name not in local_names:
+                return f"die globale Variable '{node.name}' nicht verändern", node.value
+        elif kind is SetExpression:
+            target = node.target
+            if type(target) is not IdentifierExpression:
+                return "keine KISTE verändern", target
+            if target.name not in local_names:
+                return f"die globale Variable '{target.name}' nicht verändern", target
+            work.append(node.value)
+            continue
+        elif kind is MethodCallExpression:
+            return "keine KISTE verändern", node
+        elif kind is IdentifierExpression:
+            if node.name not in local_names:
+                if node.name in _BUILTIN_NAMES and node.name not in PURE_BUILTINS:
+                    return f"die Built-in Funktion '{node.name}' nicht verwenden", node
+                if node.name not in PURE_BUILTINS:
+                    return f"die globale Variable '{node.name}' nicht lesen", node
+        elif kind is CallExpression:
+            name = getattr(node.function, "name", None)
+            if name in local_names:
+                return f"die Variable '{name}' nicht als Funktion aufrufen", node
+            if name in _BUILTIN_NAMES:
+                # Built-ins haben beim Aufruf Vorrang vor gleichnamigen Funktionen
+                if name not in PURE_BUILTINS:
+                    return f"die Built-in Funktion '{name}' nicht verwenden", node
+            elif name in functions and not functions[name].pure:
+                return f"die Funktion '{name}' nicht aufrufen (nicht REIN)", node
+            work.extend(node.arguments)
+            continue
+        elif kind is FunctionDeclaration:
+            # Verschachtelte Funktionen werden nicht ausgeführt
+            continue
+        work.extend(iter_children(node))
+    return None
+
+
+def check_purity(decl: FunctionDeclaration, functions: Dict[str, FunctionDeclaration], file_path: str = ""):
+    """Meldet einen Seiteneffekt in einer REIN-Funktion als Laufzeitfehler"""
+    violation = purity_violation(decl, functions)
+    if violation is not None:
+        reason, node = violation
+        raise GerLangRuntimeError(
+            f"REIN-Funktion '{decl.name}' darf {reason}",
+            file_path or "", getattr(node, "line", 1), getattr(node, "column", 1)
+        )
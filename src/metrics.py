@@ -0,0 +1,174 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Laufzeit-Metriken für GerLang-Programme (gerlang run --metrics=json)
+
+Zählt pro Lauf ausgeführte Statements und Ausdrücke, Funktions- und
+Built-in-Aufrufe, angelegte Scopes, die maximale Aufruftiefe sowie
+ausgelöste und von VERSUCHE gefangene Laufzeitfehler und misst die Zeit
+für Lexen, Parsen und Ausführen.
+
+Wie Profiler und Hooks kostet das nur etwas, solange ein Metrics-Objekt
+angehängt ist: attach() installiert zählende Wrapper (zum Teil über
+Interpreter.hooks), detach() entfernt sie wieder. Alle Wrapper hängen an
+Attributen dieses einen Interpreters; andere Interpreter im selben Prozess
+zählen nicht mit. Eingebettet:
+
+    metrics = Metrics()
+    metrics.attach(interpreter)
+    with metrics.phase("ausfuehren"):
+        interpreter.interpret(program)
+    metrics.detach()
+    daten = metrics.to_dict()
+
+Werte, die eine Engine nicht liefern kann, stehen als None im Ergebnis:
+Statements und Ausdrücke gibt es nur im Baum-Interpreter. Ausgelöste
+Fehler sind die von VERSUCHE gefangenen Laufzeitfehler plus der, mit dem
+interpret() abbricht.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from call_stack import RuntimeError as GerLangRuntimeError
+from parser import BlockStatement
+
+# Zähler in der Reihenfolge des JSON-Exports
+COUNTERS = (
+    "statements", "ausdruecke", "funktionsaufrufe", "builtin_aufrufe", "scopes",
+    "max_aufruftiefe", "fehler_ausgeloest", "fehler_gefangen",
+)
+PHASES = ("lexen", "parsen", "optimieren", "ausfuehren")
+
+# Nur im Baum-Interpreter messbar (Statement-Dispatcher, ExpressionEvaluator)
+_TREE_ONLY = ("statements", "ausdruecke")
+
+
+class Metrics:
+    """Zähler und Phasen-Zeiten eines oder mehrerer Läufe"""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.counters: Dict[str, Optional[int]] = dict.fromkeys(COUNTERS, 0)
+        self.timings: Dict[str, float] = {}
+        self.engine = None
+        self._undo = []  # Funktionen, die die Wrapper wieder entfernen
+
+    @contextmanager
+    def phase(self, name: str):
+        """Zeit eines Abschnitts (lexen, parsen, optimieren, ausfuehren) addieren"""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + self.clock() - start
+
+    # ===== Wrapper =====
+
+    def attach(self, interpreter):
+        """Zählende Wrapper an einem Interpreter installieren"""
+        counters = self.counters
+        self.engine = interpreter.engine
+        if interpreter.engine != "tree":
+            for name in _TREE_ONLY:
+                counters[name] = None
+
+        # Funktionsaufrufe und Tiefe über den CallStack (in allen Engines,
+        # Treffer im REIN-Cache legen keinen Frame an und zählen nicht)
+        call_stack = interpreter.call_stack
+        push, reuse = call_stack.push, call_stack.reuse
+        frames = call_stack.frames
+
+        def counting_push(*args):
+            push(*args)
+            counters["funktionsaufrufe"] += 1
+            if len(frames) > counters["max_aufruftiefe"]:
+                counters["max_aufruftiefe"] = len(frames)
+
+        def counting_reuse():
+            reuse()
+            counters["funktionsaufrufe"] += 1
+        call_stack.push, call_stack.reuse = counting_push, counting_reuse
+        self._undo.append(lambda: (vars(call_stack).pop("push"), vars(call_stack).pop("reuse")))
+
+        def count_builtin(name, args):
+            counters["builtin_aufrufe"] += 1
+        self._listen(interpreter, "builtin", count_builtin)
+
+        if interpreter.engine == "tree":
+            self._attach_tree(interpreter)
+
+        # Scopes: Slot-Scopes (tree) bzw. Environment-Objekte (closure, vm)
+        new_scope, new_environment = interpreter.new_scope, interpreter.new_environment
+
+        def counting_new_scope(parent, size):
+            counters["scopes"] += 1
+            return new_scope(parent, size)
+
+        def counting_new_environment(parent=None):
+            counters["scopes"] += 1
+            return new_environment(parent)
+        interpreter.new_scope, interpreter.new_environment = counting_new_scope, counting_new_environment
+        self._undo.append(lambda: (setattr(interpreter, "new_scope", new_scope),
+                                   setattr(interpreter, "new_environment", new_environment)))
+
+        # Laufzeitfehler: von VERSUCHE gefangen oder am Ende von interpret()
+        def count_catch(error):
+            counters["fehler_gefangen"] += 1
+            if isinstance(error, GerLangRuntimeError):
+                counters["fehler_ausgeloest"] += 1
+        self._listen(interpreter, "catch", count_catch)
+
+        interpret = interpreter.interpret
+
+        def counting_interpret(program):
+            try:
+                return interpret(program)
+            except GerLangRuntimeError:
+                counters["fehler_ausgeloest"] += 1
+                raise
+        interpreter.interpret = counting_interpret
+        self._undo.append(lambda: vars(interpreter).pop("interpret"))
+
+    def _attach_tree(self, interpreter):
+        counters = self.counters
+        evaluator = interpreter.expression_evaluator
+
+        def count_statement(stmt):
+            if type(stmt) is not BlockStatement:
+                counters["statements"] += 1
+        self._listen(interpreter, "statement", count_statement)
+
+        evaluate = evaluator.evaluate
+
+        def counting_evaluate(expr):
+            counters["ausdruecke"] += 1
+            return evaluate(expr)
+        evaluator.evaluate = counting_evaluate
+        self._undo.append(lambda: vars(evaluator).pop("evaluate"))
+
+    def _listen(self, interpreter, event: str, listener):
+        interpreter.hooks.add(event, listener)
+        self._undo.append(lambda: interpreter.hooks.remove(event, listener))
+
+    def detach(self):
+        """Alle Wrapper entfernen (in umgekehrter Reihenfolge)"""
+        while self._undo:
+            self._undo.pop()()
+
+    # ===== Export =====
+
+    def to_dict(self) -> dict:
+        return {
+            "engine": self.engine,
+            **self.counters,
+            "zeit_ms": {name: self.timings[name] * 1000 for name in PHASES if name in self.timings},
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, **kwargs)
@@ -0,0 +1,293 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+AST-Optimierer für GerLang 4.1.0
+Vereinfacht den AST zwischen Parser und Interpreter (gerlang run -O)
+"""
+
+import operator
+from typing import List, Optional
+
+from parser import (
+    Program, FunctionDeclaration, BlockStatement, ExpressionStatement,
+    VariableDeclaration, AssignmentStatement, IfStatement, WhileStatement,
+    ForStatement, ReturnStatement, PrintStatement, TryCatchStatement, SetExpression,
+    ImportDeclaration, Statement, LiteralExpression, IdentifierExpression,
+    BinaryExpression, UnaryExpression, CallExpression, ArrayLiteralExpression,
+    ArrayAccessExpression, PropertyAccessExpression, MethodCallExpression,
+    TemplateStringExpression, TemplatePlan, iter_children
+)
+from gerlang_builtins import BuiltinFunctions
+from resolver import _collect_declarations
+from expression_evaluator import _TEMPLATE_FORMATTERS
+
+# Operatoren, die mit zwei Literalen vorab berechnet werden ("/" nur ohne Division durch Null)
+_FOLDABLE_OPERATORS = {
+    "+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv,
+    "%": operator.mod, "==": operator.eq, "!=": operator.ne, "<": operator.lt,
+    "<=": operator.le, ">": operator.gt, ">=": operator.ge, "IST": operator.eq,
+}
+
+# Built-ins ohne Seiteneffekte, deren Ergebnis nur von den Argumenten abhängt
+PURE_BUILTINS = {
+    "WURZEL": BuiltinFunctions._wurzel,
+    "POTENZ": BuiltinFunctions._potenz,
+    "ABS": BuiltinFunctions._abs,
+    "RUNDEN": BuiltinFunctions._runden,
+    "ZU_WORT": BuiltinFunctions._zu_wort,
+    "ZU_GANZ": BuiltinFunctions._zu_ganz,
+    "ZU_KOMMA": BuiltinFunctions._zu_komma,
+}
+
+# Typen, die als Literal zurück in den AST dürfen (keine KISTE: veränderlich)
+_LITERAL_TYPES = {bool: "BOOL", int: "INT", float: "FLOAT", str: "STRING"}
+
+# Längere Strings werden nicht vorab gebaut (z.B. "-" * 100000)
+MAX_FOLDED_LENGTH = 1000
+
+
+class Optimizer:
+    """Konstantenfaltung und Entfernen toter Zweige auf dem AST.
+
+    - arithmetische Ausdrücke, Vergleiche, Verkettung, NICHT/Minus und
+      UND/ODER mit Literalen werden zu Literalen gefaltet, ebenso reine
+      Built-ins (PURE_BUILTINS) mit Literal-Argumenten, sofern das Programm
+      den Namen nirgends als Variable, Parameter oder Zuweisungsziel nutzt
+    - WENN mit konstanter Bedingung wird durch den erreichbaren Zweig
+      ersetzt, SOLANGE (NEIN) und wirkungslose Ausdrucks-Statements entfallen
+    - Blöcke ohne eigene Deklarationen werden in den umgebenden Block
+      übernommen bzw. als Zweig durch ihr einziges Statement ersetzt
+
+    Gefaltete Literale erhalten die Position des ursprünglichen Ausdrucks.
+    Was zur Laufzeit einen Fehler auslösen würde (Division durch Null,
+    Typfehler, WURZEL(-1)), bleibt unverändert im AST und meldet sich wie
+    ohne -O an derselben Stelle.
+    """
+
+    def __init__(self):
+        self._shadowed = set()
+
+    def optimize(self, program: Program) -> Program:
+        """Optimiert ein Programm in-place und gibt es zurück"""
+        self._shadowed = _bound_names(program)
+        try:
+            program.statements = self._statements(program.statements)
+        except RecursionError:
+            # Sehr tief verschachtelter Code: bisherige Ersetzungen sind
+            # gleichwertig, der Rest bleibt unoptimiert
+            pass
+        return program
+
+    # ===== Statements =====
+
+    def _statements(self, statements: List[Statement]) -> List[Statement]:
+        result = []
+        for stmt in statements:
+            stmt = self._statement(stmt)
+            if stmt is None:
+                continue
+            if type(stmt) is BlockStatement and _is_transparent(stmt):
+                # Block ohne eigene Deklarationen: Statements direkt übernehmen
+                result.extend(stmt.statements)
+            else:
+                result.append(stmt)
+        return result
+
+    def _branch(self, stmt: Statement) -> Optional[Statement]:
+        """Zweig oder Schleifenrumpf; ein Block mit nur einem Statement entfällt"""
+        stmt = self._statement(stmt)
+        if type(stmt) is BlockStatement and _is_transparent(stmt):
+            if not stmt.statements:
+                return None
+            if len(stmt.statements) == 1:
+                return stmt.statements[0]
+        return stmt
+
+    def _statement(self, stmt: Statement) -> Optional[Statement]:
+        """Optimiertes Statement oder None, falls es wegfallen kann"""
+        kind = type(stmt)
+        if kind is ExpressionStatement:
+            stmt.expression = self._expression(stmt.expression)
+            if type(stmt.expression) is LiteralExpression:
+                return None
+        elif kind is VariableDeclaration:
+            if stmt.initializer:
+                stmt.initializer = self._expression(stmt.initializer)
+        elif kind is AssignmentStatement:
+            stmt.value = self._expression(stmt.value)
+        elif kind is SetExpression:
+            if type(stmt.target) is ArrayAccessExpression:
+                stmt.target = self._expression(stmt.target)
+            stmt.value = self._expression(stmt.value)
+        elif kind is BlockStatement:
+            stmt.statements = self._statements(stmt.statements)
+        elif kind is IfStatement:
+            stmt.condition = self._expression(stmt.condition)
+            then_branch = self._branch(stmt.then_branch)
+            else_branch = self._branch(stmt.else_branch) if stmt.else_branch else None
+            if type(stmt.condition) is LiteralExpression:
+                # Nur der erreichbare Zweig bleibt übrig
+                return then_branch if _is_truthy(stmt.condition.value) else else_branch
+            stmt.then_branch = then_branch or BlockStatement([])
+            stmt.else_branch = else_branch
+        elif kind is WhileStatement:
+            stmt.condition = self._expression(stmt.condition)
+            if type(stmt.condition) is LiteralExpression and not _is_truthy(stmt.condition.value):
+                return None
+            stmt.body = self._branch(stmt.body) or BlockStatement([])
+        elif kind is ForStatement:
+            if stmt.initializer:
+                stmt.initializer = self._statement(stmt.initializer)
+            if stmt.condition:
+                stmt.condition = self._expression(stmt.condition)
+            if stmt.increment:
+                if isinstance(stmt.increment, Statement):
+                    stmt.increment = self._statement(stmt.increment)
+                else:
+                    stmt.increment = self._expression(stmt.increment)
+            stmt.body = self._branch(stmt.body) or BlockStatement([])
+        elif kind is ReturnStatement:
+            if stmt.value:
+                stmt.value = self._expression(stmt.value)
+        elif kind is PrintStatement:
+            stmt.expression = self._expression(stmt.expression)
+        elif kind is TryCatchStatement:
+            stmt.try_block = self._branch(stmt.try_block) or BlockStatement([])
+            stmt.catch_block = self._branch(stmt.catch_block) or BlockStatement([])
+        elif kind is FunctionDeclaration:
+            # Der Rumpf bleibt ein Block (teilt sich den Frame mit den Parametern)
+            body = self._statement(stmt.body)
+            stmt.body = body if body is not None else BlockStatement([])
+        # Import und Export bleiben unverändert
+        return stmt
+
+    # ===== Expressions =====
+
+    def _expression(self, expr):
+        """Optimierte Expression (gefaltet zu einem Literal, wo möglich)"""
+        kind = type(expr)
+        if kind is BinaryExpression:
+            expr.left = self._expression(expr.left)
+            expr.right = self._expression(expr.right)
+            return self._fold_binary(expr)
+        elif kind is UnaryExpression:
+            expr.operand = self._expression(expr.operand)
+            operand = expr.operand
+            if type(operand) is LiteralExpression:
+                if expr.operator == "-":
+                    return _fold(expr, operator.neg, operand.value)
+                if expr.operator == "NICHT":
+                    return _literal(not _is_truthy(operand.value), expr)
+        elif kind is CallExpression:
+            expr.arguments = [self._expression(arg) for arg in expr.arguments]
+            name = getattr(expr.function, "name", None)
+            if (name in PURE_BUILTINS and name not in self._shadowed
+                    and all(type(arg) is LiteralExpression for arg in expr.arguments)):
+                return _fold(expr, PURE_BUILTINS[name], *(arg.value for arg in expr.arguments))
+        elif kind is ArrayLiteralExpression:
+            expr.elements = [self._expression(element) for element in expr.elements]
+        elif kind is ArrayAccessExpression:
+            expr.array = self._expression(expr.array)
+            expr.index = self._expression(expr.index)
+        elif kind is PropertyAccessExpression:
+            expr.object_expr = self._expression(expr.object_expr)
+            target = expr.object_expr
+            if expr.property_name == "LÄNGE" and type(target) is LiteralExpression and type(target.value) is str:
+                return _literal(len(target.value), expr)
+        elif kind is MethodCallExpression:
+            expr.object_expr = self._expression(expr.object_expr)
+            expr.arguments = [self._expression(arg) for arg in expr.arguments]
+        elif kind is TemplateStringExpression:
+            return self._template_string(expr)
+        return expr
+
+    def _fold_binary(self, expr: BinaryExpression):
+        left, right, op = expr.left, expr.right, expr.operator
+        if type(left) is not LiteralExpression:
+            return expr
+        if op in ("UND", "ODER"):
+            # Kurzschluss: steht das Ergebnis fest, wird rechts nicht ausgewertet
+            if _is_truthy(left.value) == (op == "ODER"):
+                return _literal(op == "ODER", expr)
+            if type(right) is LiteralExpression:
+                return _literal(_is_truthy(right.value), expr)
+            return expr
+        if type(right) is not LiteralExpression or op not in _FOLDABLE_OPERATORS:
+            return expr
+        if op == "/" and right.value == 0:
+            return expr  # Fehler bleibt zur Laufzeit an dieser Position
+        return _fold(expr, _FOLDABLE_OPERATORS[op], left.value, right.value)
+
+    def _template_string(self, expr: TemplateStringExpression):
+        expressions = [self._expression(slot) for slot in expr.expressions]
+        if all(type(slot) is LiteralExpression for slot in expressions):
+            # Template ohne variable Teile wird zum festen String
+            pieces = expr.plan.pieces.copy()
+            for (index, _), slot in zip(expr.plan.slots, expressions):
+                formatter = _TEMPLATE_FORMATTERS.get(type(slot.value))
+                pieces[index] = formatter(slot.value) if formatter else str(slot.value)
+            return _literal("".join(pieces), expr)
+        if any(new is not old for new, old in zip(expressions, expr.expressions)):
+            expr.expressions = expressions
+            expr.plan = TemplatePlan(expr.parts, expressions)
+        return expr
+
+
+def _is_truthy(value) -> bool:
+    """Wie Interpreter.is_truthy, für Literal-Werte"""
+    if value is None:
+        return False
+    if isinstance(value, (bool, int, float)):
+        return value != 0
+    return len(value) > 0
+
+
+def _literal(value, origin) -> Optional[LiteralExpression]:
+    """Neuer Literal-Knoten an der Position von origin (None bei ungeeignetem Wert)"""
+    type_name = _LITERAL_TYPES.get(type(value))
+    if type_name is None or (type_name == "STRING" and len(value) > MAX_FOLDED_LENGTH):
+        return None
+    return LiteralExpression(value, type_name).set_position(origin.line, origin.column)
+
+
+def _fold(expr, function, *values):
+    """Berechnet function(*values) vorab; bei Fehlern bleibt expr erhalten"""
+    try:
+        value = function(*values)
+    except Exception:
+        return expr
+    return _literal(value, expr) or expr
+
+
+def _is_transparent(block: BlockStatement) -> bool:
+    """Block, der weder Variablen deklariert noch Funktionen enthält (braucht keinen Scope)"""
+    names = []
+    for stmt in block.statements:
+        if type(stmt) is FunctionDeclaration:
+            return False
+        _collect_declarations(stmt, names)
+    return not names
+
+
+def _bound_names(program: Program) -> set:
+    """Alle Namen, an die das Programm irgendwo etwas bindet oder zuweist"""
+    names = set()
+    work = [program]
+    while work:
+        node = work.pop()
+        kind = type(node)
+        if kind is VariableDeclaration or kind is AssignmentStatement:
+            names.add(node.name)
+        elif kind is FunctionDeclaration:
+            names.update(name for _, name in node.parameters)
+        elif kind is TryCatchStatement and node.catch_var:
+            names.add(node.catch_var)
+        elif kind is SetExpression and type(node.target) is IdentifierExpression:
+            names.add(node.target.name)
+        elif kind is ImportDeclaration:
+            names.update(node.names)
+        work.extend(iter_children(node))
+    return names
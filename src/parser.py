@@ -3,13 +3,16 @@
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 
+import sys
 from abc import ABC
-from typing import List, Optional, Any
-from lexer import Token
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Any, Tuple
+from lexer import Lexer, Token, TokenStore, TOKEN_CODES, EOF_CODE
 
 # ===== AST NODE DEFINITIONS =====
 
 class ASTNode(ABC):
+    __slots__ = ("line", "column")
     def __init__(self):
         self.line = 1
         self.column = 1
@@ -19,13 +22,33 @@ class ASTNode(ABC):
         self.column = column
         return self
 
+# Slots mit möglichen Kindknoten pro Knotenklasse (ohne line/column)
+_CHILD_SLOTS = {}
+
+def iter_children(node: ASTNode) -> Iterator[ASTNode]:
+    """Direkte Kindknoten, gefunden über die __slots__ aller Knotenklassen"""
+    kind = type(node)
+    slots = _CHILD_SLOTS.get(kind)
+    if slots is None:
+        slots = _CHILD_SLOTS[kind] = tuple(
+            slot for cls in kind.__mro__ for slot in getattr(cls, "__slots__", ())
+            if slot not in ASTNode.__slots__
+        )
+    for slot in slots:
+        value = getattr(node, slot, None)
+        if isinstance(value, ASTNode):
+            yield value
+        elif isinstance(value, list):
+            yield from (item for item in value if isinstance(item, ASTNode))
+
 class Expression(ASTNode):
-    pass
+    __slots__ = ()
 
 class Statement(ASTNode):
-    pass
+    __slots__ = ()
 
 class LiteralExpression(Expression):
+    __slots__ = ("value", "type_name")
     def __init__(self, value: Any, type_name: str):
         super().__init__()
         self.value = value
@@ -34,13 +57,15 @@ class LiteralExpression(Expression):
         return f"Literal({self.value}, {self.type_name})"
 
 class IdentifierExpression(Expression):
+    __slots__ = ("name", "binding")  # binding: vom Resolver gesetzt
     def __init__(self, name: str):
         super().__init__()
-        self.name = name
+        self.name = sys.intern(name)
     def __repr__(self):
         return f"Identifier({self.name})"
 
 class BinaryExpression(Expression):
+    __slots__ = ("left", "operator", "right")
     def __init__(self, left: Expression, operator: str, right: Expression):
         super().__init__()
         self.left = left
@@ -50,6 +75,7 @@ class BinaryExpression(Expression):
         return f"Binary({self.left} {self.operator} {self.right})"
 
 class UnaryExpression(Expression):
+    __slots__ = ("operator", "operand")
     def __init__(self, operator: str, operand: Expression):
         super().__init__()
         self.operator = operator
@@ -58,6 +84,7 @@ class UnaryExpression(Expression):
         return f"Unary({self.operator} {self.operand})"
 
 class CallExpression(Expression):
+    __slots__ = ("function", "arguments", "tail_call", "call_cache")  # tail_call: vom Resolver gesetzt (nur bei Endaufrufen), call_cache: siehe ExpressionEvaluator._evaluate_call
     def __init__(self, function: Expression, arguments: List[Expression]):
         super().__init__()
         self.function = function
@@ -66,43 +93,49 @@ class CallExpression(Expression):
         return f"Call({self.function}, {self.arguments})"
 
 class PropertyAccessExpression(Expression):
+    __slots__ = ("object_expr", "property_name")
     def __init__(self, object_expr: Expression, property_name: str):
         super().__init__()
         self.object_expr = object_expr
-        self.property_name = property_name
+        self.property_name = sys.intern(property_name)
     def __repr__(self):
         return f"PropertyAccess({self.object_expr}.{self.property_name})"
 
 class MethodCallExpression(Expression):
+    __slots__ = ("object_expr", "method_name", "arguments")
     def __init__(self, object_expr: Expression, method_name: str, arguments: List[Expression]):
         super().__init__()
         self.object_expr = object_expr
-        self.method_name = method_name
+        self.method_name = sys.intern(method_name)
         self.arguments = arguments
     def __repr__(self):
         return f"MethodCall({self.object_expr}.{self.method_name}({self.arguments}))"
 
 class BlockStatement(Statement):
+    __slots__ = ("statements", "scope_size")  # scope_size: vom Resolver gesetzt
     def __init__(self, statements: List[Statement]):
         self.statements = statements
     def __repr__(self):
         return f"Block({len(self.statements)} statements)"
 
 class ExpressionStatement(Statement):
+    __slots__ = ("expression",)
     def __init__(self, expression: Expression):
         self.expression = expression
     def __repr__(self):
         return f"ExprStmt({self.expression})"
 
 class VariableDeclaration(Statement):
+    __slots__ = ("type_name", "name", "initializer", "slot")  # slot: vom Resolver gesetzt
     def __init__(self, type_name: str, name: str, initializer: Optional[Expression] = None):
         self.type_name = type_name
-        self.name = name
+        self.name = sys.intern(name)
         self.initializer = initializer
     def __repr__(self):
         return f"VarDecl({self.type_name} {self.name} = {self.initializer})"
 
 class IfStatement(Statement):
+    __slots__ = ("condition", "then_branch", "else_branch")
     def __init__(self, condition: Expression, then_branch: Statement, else_branch: Optional[Statement] = None):
         self.condition = condition
         self.then_branch = then_branch
@@ -111,6 +144,7 @@ class IfStatement(Statement):
         return f"If({self.condition}, {self.then_branch}, {self.else_branch})"
 
 class WhileStatement(Statement):
+    __slots__ = ("condition", "body")
     def __init__(self, condition: Expression, body: Statement):
         self.condition = condition
         self.body = body
@@ -118,6 +152,7 @@ class WhileStatement(Statement):
         return f"While({self.condition}, {self.body})"
 
 class ForStatement(Statement):
+    __slots__ = ("initializer", "condition", "increment", "body", "scope_size", "counted")  # scope_size/counted: vom Resolver gesetzt
     def __init__(self, initializer: Optional[Statement], condition: Optional[Expression],
                  increment: Optional[Statement], body: Statement):
         self.initializer = initializer
@@ -128,35 +163,41 @@ class ForStatement(Statement):
         return f"For({self.initializer}, {self.condition}, {self.increment}, {self.body})"
 
 class ReturnStatement(Statement):
+    __slots__ = ("value",)
     def __init__(self, value: Optional[Expression] = None):
         self.value = value
     def __repr__(self):
         return f"Return({self.value})"
 
 class AssignmentStatement(Statement):
+    __slots__ = ("name", "value", "binding")  # binding: vom Resolver gesetzt
     def __init__(self, name: str, value: Expression):
-        self.name = name
+        self.name = sys.intern(name)
         self.value = value
     def __repr__(self):
         return f"Assignment({self.name} = {self.value})"
 
 class FunctionDeclaration(Statement):
-    def __init__(self, return_type: str, name: str, parameters: List[tuple], body: Statement):
+    __slots__ = ("return_type", "name", "parameters", "body", "pure", "frame_size", "parameter_slots")  # frame_size/parameter_slots: vom Resolver gesetzt
+    def __init__(self, return_type: str, name: str, parameters: List[tuple], body: Statement, pure: bool = False):
         self.return_type = return_type
-        self.name = name
+        self.name = sys.intern(name)
         self.parameters = parameters  # List of (type, name) tuples
         self.body = body
+        self.pure = pure  # REIN: Ergebnisse dürfen memoisiert werden (siehe memo.py)
     def __repr__(self):
         return f"Function({self.return_type} {self.name}({self.parameters}))"
 
 # NEW: Print statement for DRUCKE
 class PrintStatement(Statement):
+    __slots__ = ("expression",)
     def __init__(self, expression: Expression):
         self.expression = expression
     def __repr__(self):
         return f"Print({self.expression})"
 
 class ArrayLiteralExpression(Expression):
+    __slots__ = ("elements",)
     def __init__(self, elements: List[Expression]):
         super().__init__()
         self.elements = elements
@@ -164,6 +205,7 @@ class ArrayLiteralExpression(Expression):
         return f"ArrayLiteral({self.elements})"
 
 class ArrayAccessExpression(Expression):
+    __slots__ = ("array", "index")
     def __init__(self, array: Expression, index: Expression):
         super().__init__()
         self.array = array
@@ -172,6 +214,7 @@ class ArrayAccessExpression(Expression):
         return f"ArrayAccess({self.array}[{self.index}])"
 
 class Program(ASTNode):
+    __slots__ = ("statements",)
     def __init__(self, statements: List[Statement]):
         self.statements = statements
     def __repr__(self):
@@ -179,6 +222,7 @@ class Program(ASTNode):
 
 # NEW: TryCatchStatement for error handling
 class TryCatchStatement(Statement):
+    __slots__ = ("try_block", "catch_var", "catch_block", "scope_size")  # scope_size: vom Resolver gesetzt
     def __init__(self, try_block, catch_var, catch_block):
         self.try_block = try_block  # BlockStatement
         self.catch_var = catch_var  # Optional[str]
@@ -188,6 +232,7 @@ class TryCatchStatement(Statement):
 
 # NEW: SetExpression for assignments to arbitrary expressions (e.g. array elements)
 class SetExpression(Statement):
+    __slots__ = ("target", "value")
     def __init__(self, target: Expression, value: Expression):
         self.target = target
         self.value = value
@@ -196,12 +241,14 @@ class SetExpression(Statement):
 
 # NEW: Export and Import declarations
 class ExportDeclaration(Statement):
+    __slots__ = ("declaration",)
     def __init__(self, declaration: Statement):
         self.declaration = declaration
     def __repr__(self):
         return f"Export({self.declaration})"
 
 class ImportDeclaration(Statement):
+    __slots__ = ("names", "module")
     def __init__(self, names: List[str], module: str):
         self.names = names  # Liste der importierten Namen
         self.module = module  # Dateiname als String
@@ -210,17 +257,44 @@ class ImportDeclaration(Statement):
 
 # NEW: Export list declaration for multiple exports
 class ExportListDeclaration(Statement):
+    __slots__ = ("names",)
     def __init__(self, names: list):
         self.names = names
     def __repr__(self):
         return f"ExportList({self.names})"
 
+# Vorübersetzter Template-String, wird von gleichen Templates geteilt
+class TemplatePlan:
+    """Literal-Stücke und Ausdrucks-Slots eines Template-Strings.
+
+    pieces enthält die nicht-leeren Literal-Teile und None als Platzhalter,
+    slots ordnet jedem Platzhalter-Index seinen Ausdruck zu. Ausgewertet
+    wird durch Füllen einer Kopie von pieces und einem einzigen join.
+    """
+    __slots__ = ("parts", "expressions", "pieces", "slots")
+
+    def __init__(self, parts: List[str], expressions: List[Expression]):
+        self.parts = parts
+        self.expressions = expressions
+        pieces = []
+        slots = []
+        for i, part in enumerate(parts):
+            if part:
+                pieces.append(part)
+            if i < len(expressions):
+                slots.append((len(pieces), expressions[i]))
+                pieces.append(None)
+        self.pieces = pieces
+        self.slots = tuple(slots)
+
 # NEW: TemplateStringExpression for string interpolation
 class TemplateStringExpression(Expression):
-    def __init__(self, parts: List, expressions: List[Expression]):
+    __slots__ = ("parts", "expressions", "plan")
+    def __init__(self, parts: List, expressions: List[Expression], plan: Optional[TemplatePlan] = None):
         super().__init__()
         self.parts = parts  # String-Teile zwischen den Variablen
         self.expressions = expressions  # Ausdrücke für ${...}
+        self.plan = plan or TemplatePlan(parts, expressions)
     def __repr__(self):
         return f"TemplateString(parts={self.parts}, expressions={self.expressions})"
 
@@ -231,14 +305,140 @@ class ParseError(Exception):
         super().__init__(message)
         self.token = token
 
+class TokenStream:
+    """Lazy Token-Puffer für den Parser.
+
+    Zieht Tokens erst bei Bedarf aus einem Iterator (z.B. Lexer.stream) und
+    hält nur ein kleines Fenster um die aktuelle Position. Der Parser schaut
+    höchstens zwei Tokens voraus und eines zurück.
+    """
+
+    # Tokens, die hinter dem zuletzt nachgeladenen mindestens gehalten werden
+    KEEP = 4
+    # Ab dieser Fenstergröße wird vorne abgeschnitten (seltenes Kopieren)
+    LIMIT = 64
+
+    def __init__(self, tokens: Iterable[Token]):
+        self._source = iter(tokens)
+        self._window = []
+        self._codes = []  # Typ-Codes parallel zu _window
+        self._first = 0  # Absoluter Index von _window[0]
+        self._eof = None
+        self.types = _StreamTypes(self)
+
+    def __getitem__(self, index: int) -> Token:
+        offset = index - self._first
+        if offset < 0:
+            # tokens[-1] liefert wie bei Listen das EOF-Token, sobald es bekannt ist
+            if index < 0 and self._eof is not None:
+                return self._eof
+            raise IndexError(f"Token {index} wurde bereits verworfen")
+        window = self._window
+        if offset < len(window):
+            return window[offset]
+        offset = self._fill(offset)
+        return window[offset] if offset < len(window) else self._eof
+
+    def type_code(self, index: int) -> int:
+        """Typ-Code des Tokens an index (EOF_CODE hinter dem Ende)"""
+        offset = index - self._first
+        if 0 <= offset < len(self._codes):
+            return self._codes[offset]
+        if offset < 0:
+            raise IndexError(f"Token {index} wurde bereits verworfen")
+        offset = self._fill(offset)
+        return self._codes[offset] if offset < len(self._codes) else EOF_CODE
+
+    def _fill(self, offset: int) -> int:
+        """Lädt bis offset nach (höchstens bis EOF) und gibt den neuen Offset zurück"""
+        window = self._window
+        while offset >= len(window) and self._eof is None:
+            token = next(self._source)
+            window.append(token)
+            self._codes.append(TOKEN_CODES[token.type])
+            if token.type == "EOF":
+                self._eof = token
+        if len(window) > self.LIMIT:
+            # Nur beim Nachladen alte Tokens verwerfen, der Lesepfad bleibt billig
+            drop = len(window) - self.KEEP
+            del window[:drop]
+            del self._codes[:drop]
+            self._first += drop
+            offset -= drop
+        return offset
+
+class _StreamTypes:
+    """Index-Sicht auf die Typ-Codes eines TokenStream (wie TokenStore.types)"""
+
+    __slots__ = ("_stream",)
+
+    def __init__(self, stream: TokenStream):
+        self._stream = stream
+
+    def __getitem__(self, index: int) -> int:
+        return self._stream.type_code(index)
+
+# Bindungsstärke der Binäroperatoren (höher bindet stärker), alle linksassoziativ
+_BINDING_POWERS = {
+    TOKEN_CODES[token_type]: power
+    for power, token_types in enumerate((
+        ("||",),                             # ODER
+        ("&&",),                             # UND
+        ("==", "!="),                        # IST, !=
+        ("GT", ">=", "LT", "<="),
+        ("MINUS", "PLUS"),
+        ("DIVIDE", "MULTIPLY", "MODULO"),
+    ), start=1)
+    for token_type in token_types
+}
+_PREFIX_CODES = frozenset((TOKEN_CODES["NOT"], TOKEN_CODES["MINUS"]))
+
+_IDENTIFIER = TOKEN_CODES["IDENTIFIER"]
+_INT_LITERAL = TOKEN_CODES["INT_LITERAL"]
+_FLOAT_LITERAL = TOKEN_CODES["FLOAT_LITERAL"]
+_STRING_LITERAL = TOKEN_CODES["STRING_LITERAL"]
+_TEMPLATE_STRING_LITERAL = TOKEN_CODES["TEMPLATE_STRING_LITERAL"]
+_BOOL_LITERAL = TOKEN_CODES["BOOL_LITERAL"]
+_LPAREN = TOKEN_CODES["LPAREN"]
+_RPAREN = TOKEN_CODES["RPAREN"]
+_LBRACKET = TOKEN_CODES["LBRACKET"]
+_RBRACKET = TOKEN_CODES["RBRACKET"]
+_COMMA = TOKEN_CODES["COMMA"]
+_DOT = TOKEN_CODES["DOT"]
+
+# Geteilte Literal-Knoten für JA, NEIN und kleine Ganzzahlen. Sie tragen keine
+# eigene Quelltextposition (Zeile/Spalte 0), Laufzeitfehler werden ohnehin an
+# Operatoren und Aufrufen gemeldet. Die Knoten dürfen nicht verändert werden.
+SHARED_LITERALS = (
+    LiteralExpression(False, "BOOL").set_position(0, 0),
+    LiteralExpression(True, "BOOL").set_position(0, 0),
+) + tuple(LiteralExpression(value, "INT").set_position(0, 0) for value in range(256))
+_SHARED_NEIN, _SHARED_JA = SHARED_LITERALS[:2]
+_SHARED_INTS = SHARED_LITERALS[2:]
+
+# Einträge auf dem Stack von Parser.expression()
+_UNARY, _BINARY, _GROUP, _ARRAY, _CALL, _METHOD, _INDEX = range(7)
+
 class Parser:
-    def __init__(self, tokens: List[Token], file_path: str = ""):
-        self.tokens = tokens
+    def __init__(self, tokens: Iterable[Token], file_path: str = ""):
+        # Listen und TokenStores direkt nutzen, alles andere (Generatoren) lazy
+        # puffern. check()/match() vergleichen nur die Typ-Codes in self.types.
+        if isinstance(tokens, TokenStore):
+            self.tokens = tokens
+            self.types = tokens.types
+        elif isinstance(tokens, list):
+            self.tokens = tokens
+            self.types = bytearray(TOKEN_CODES[token.type] for token in tokens)
+        else:
+            self.tokens = TokenStream(tokens)
+            self.types = self.tokens.types
         self.current = 0
         self.file_path = file_path
+        # Nur in parse_all(): gesammelte Fehler statt Abbruch beim ersten
+        self.errors = None
 
     def is_at_end(self) -> bool:
-        return self.peek().type == "EOF"
+        return self.types[self.current] == EOF_CODE
 
     def peek(self) -> Token:
         return self.tokens[self.current]
@@ -247,20 +447,21 @@ class Parser:
         return self.tokens[self.current - 1]
 
     def advance(self) -> Token:
-        if not self.is_at_end():
+        if self.types[self.current] != EOF_CODE:
             self.current += 1
-        return self.previous()
+        return self.tokens[self.current - 1]
 
     def check(self, token_type: str) -> bool:
-        if self.is_at_end():
-            return False
-        return self.peek().type == token_type
+        code = self.types[self.current]
+        return code != EOF_CODE and code == TOKEN_CODES.get(token_type)
 
     def match(self, *token_types: str) -> bool:
-        for token_type in token_types:
-            if self.check(token_type):
-                self.advance()
-                return True
+        code = self.types[self.current]
+        if code != EOF_CODE:
+            for token_type in token_types:
+                if TOKEN_CODES.get(token_type) == code:
+                    self.current += 1
+                    return True
         return False
 
     def consume(self, token_type: str, message: str) -> Token:
@@ -279,38 +480,78 @@ class Parser:
     def parse(self) -> Program:
         statements = []
         while not self.is_at_end():
-            stmt = self.declaration()
+            stmt = self.declaration() if self.errors is None else self.recovering_declaration(False)
             if stmt:
                 statements.append(stmt)
         return Program(statements)
 
+    def parse_all(self) -> Tuple[Program, List[ParseError]]:
+        """Parst das ganze Programm und sammelt alle Syntaxfehler.
+
+        Nach jedem Fehler geht es über synchronize() an der nächsten
+        Anweisung weiter, in Blöcken innerhalb des Blocks. Fehlerhafte
+        Anweisungen fehlen im zurückgegebenen Program.
+        """
+        self.errors = []
+        try:
+            return self.parse(), self.errors
+        finally:
+            self.errors = None
+
+    def recovering_declaration(self, in_block: bool) -> Optional[Statement]:
+        """declaration(), die einen ParseError in self.errors ablegt und resynchronisiert"""
+        try:
+            return self.declaration()
+        except ParseError as error:
+            self.record_error(error)
+            if not (in_block and self.check("RBRACE")):
+                self.synchronize()
+            return None
+
+    def record_error(self, error: ParseError):
+        """Legt einen ParseError in self.errors ab (nur in parse_all())"""
+        if error.token is None:
+            error.token = self.peek()
+        # Geschachtelte offene Blöcke melden dasselbe fehlende '}' sonst mehrfach
+        if not self.errors or (str(self.errors[-1]), self.errors[-1].token) != (str(error), error.token):
+            self.errors.append(error)
+
     def declaration(self) -> Optional[Statement]:
+        # Position des ersten Tokens (u.a. für das Zeilen-Profil, siehe profiler.py)
+        token = self.peek()
+        return self.set_position(self._declaration(), token)
+
+    def _declaration(self) -> Optional[Statement]:
         # try/except entfernt, Fehler werden im Hauptprogramm behandelt
         if self.match("EXPORT", "GIBFREI"):
             return self.export_declaration()
         if self.match("IMPORT", "HOLE"):
             return self.import_declaration()
+        if self.match("PURE"):
+            return self.pure_function_declaration()
         if self.check("VOID") or self.check("INT") or self.check("FLOAT") or self.check("STRING") or self.check("BOOL") or self.check("ARRAY"):
             # Nach Typ kommt Identifier
             type_token = self.peek()
             next_token = self.peek_next()
             if next_token.type == "IDENTIFIER":
-                third_token = self.tokens[self.current + 2] if self.current + 2 < len(self.tokens) else None
-                if third_token and third_token.type == "LPAREN":
+                third_token = self.peek_at(2)
+                if third_token.type == "LPAREN":
                     return self.function_declaration()
                 else:
                     return self.variable_declaration()
-        return self.statement()
+        return self._statement()
 
     def export_declaration(self) -> ExportDeclaration:
         # EXPORT oder GIBFREI wurde bereits konsumiert
+        if self.match("PURE"):
+            return ExportDeclaration(self.pure_function_declaration())
         # Variante 1: Funktions- oder Variablendeklaration
         if self.check("VOID") or self.check("INT") or self.check("FLOAT") or self.check("STRING") or self.check("BOOL") or self.check("ARRAY"):
             type_token = self.peek()
             next_token = self.peek_next()
             if next_token.type == "IDENTIFIER":
-                third_token = self.tokens[self.current + 2] if self.current + 2 < len(self.tokens) else None
-                if third_token and third_token.type == "LPAREN":
+                third_token = self.peek_at(2)
+                if third_token.type == "LPAREN":
                     decl = self.function_declaration()
                 else:
                     decl = self.variable_declaration()
@@ -365,7 +606,7 @@ class Parser:
                 param_name = self.consume("IDENTIFIER", "Expected parameter name").value
                 self.consume("COLON", "Expected ':' after parameter name")
                 param_type = self.advance().value  # GANZ, KOMMA, etc.
-                parameters.append((param_type, param_name))
+                parameters.append((param_type, sys.intern(param_name)))
                 if not self.match("COMMA"):
                     break
         self.consume("RPAREN", "Expected ')' after parameters")
@@ -373,10 +614,24 @@ class Parser:
         body = self.block_statement()
         return FunctionDeclaration(return_type, name, parameters, body)
 
+    def pure_function_declaration(self) -> FunctionDeclaration:
+        # REIN wurde bereits konsumiert, es muss eine Funktion folgen
+        if not (self.check("VOID") or self.check("INT") or self.check("FLOAT") or self.check("STRING") or self.check("BOOL") or self.check("ARRAY")) \
+                or self.peek_next().type != "IDENTIFIER" or self.peek_at(2).type != "LPAREN":
+            raise ParseError("Expected function declaration after 'REIN'", self.peek())
+        decl = self.function_declaration()
+        decl.pure = True
+        return decl
+
     def peek_next(self):
-        if self.current + 1 < len(self.tokens):
-            return self.tokens[self.current + 1]
-        return self.tokens[-1]
+        return self.peek_at(1)
+
+    def peek_at(self, offset: int) -> Token:
+        """Token offset Positionen voraus, EOF falls die Eingabe vorher endet"""
+        try:
+            return self.tokens[self.current + offset]
+        except IndexError:
+            return self.tokens[-1]
 
     def assignment_statement(self):
         name = self.consume("IDENTIFIER", "Erwartete Variablennamen").value
@@ -386,6 +641,10 @@ class Parser:
         return AssignmentStatement(name, value)
 
     def statement(self) -> Statement:
+        token = self.peek()
+        return self.set_position(self._statement(), token)
+
+    def _statement(self) -> Statement:
         if self.match("IF"):
             return self.if_statement()
         if self.match("WHILE"):
@@ -439,6 +698,7 @@ class Parser:
     def for_statement(self) -> ForStatement:
         self.consume("LPAREN", "Expected '(' after 'FÜR'")
         initializer = None
+        start = self.peek()
         if self.match("SEMICOLON"):
             initializer = None
         elif self.check("INT") or self.check("FLOAT") or self.check("STRING") or self.check("BOOL"):
@@ -447,12 +707,15 @@ class Parser:
             initializer = self.assignment_statement()
         else:
             initializer = self.expression_statement()
+        if initializer is not None:
+            self.set_position(initializer, start)
         condition = None
         if not self.check("SEMICOLON"):
             condition = self.expression()
         self.consume("SEMICOLON", "Expected ';' after for loop condition")
         increment = None
         if not self.check("RPAREN"):
+            start = self.peek()
             if self.check("IDENTIFIER") and self.peek_next().type == "ASSIGN":
                 # Assignment als Inkrement
                 name = self.consume("IDENTIFIER", "Expected variable name for assignment").value
@@ -462,6 +725,7 @@ class Parser:
             else:
                 expr = self.expression()
                 increment = ExpressionStatement(expr)
+            self.set_position(increment, start)
         self.consume("RPAREN", "Expected ')' after for clauses")
         body = self.statement()
         return ForStatement(initializer, condition, increment, body)
@@ -485,7 +749,7 @@ class Parser:
     def block_statement(self) -> BlockStatement:
         statements = []
         while not self.check("RBRACE") and not self.is_at_end():
-            stmt = self.declaration()
+            stmt = self.declaration() if self.errors is None else self.recovering_declaration(True)
             if stmt:
                 statements.append(stmt)
         self.consume("RBRACE", "Expected '}' after block")
@@ -497,159 +761,176 @@ class Parser:
         return ExpressionStatement(expr)
 
     def expression(self) -> Expression:
-        return self.oder_expression()
-
-    def oder_expression(self) -> Expression:
-        expr = self.und_expression()
-        while self.match("||", "ODER"):
-            operator_token = self.previous()
-            operator = operator_token.value
-            right = self.und_expression()
-            expr = self.set_position(BinaryExpression(expr, operator, right), operator_token)
-        return expr
-
-    def und_expression(self) -> Expression:
-        expr = self.equality()
-        while self.match("&&", "UND"):
-            operator_token = self.previous()
-            operator = operator_token.value
-            right = self.equality()
-            expr = self.set_position(BinaryExpression(expr, operator, right), operator_token)
-        return expr
-
-    def equality(self) -> Expression:
-        expr = self.comparison()
-        while self.match("==", "!="):
-            operator_token = self.previous()
-            operator = operator_token.value
-            right = self.comparison()
-            expr = self.set_position(BinaryExpression(expr, operator, right), operator_token)
-        return expr
-
-    def comparison(self) -> Expression:
-        expr = self.term()
-        while self.match("GT", ">=", "LT", "<="):
-            operator_token = self.previous()
-            operator = operator_token.value
-            right = self.term()
-            expr = self.set_position(BinaryExpression(expr, operator, right), operator_token)
-        return expr
-
-    def term(self) -> Expression:
-        expr = self.factor()
-        while self.match("MINUS", "PLUS"):
-            operator_token = self.previous()
-            operator = operator_token.value
-            right = self.factor()
-            expr = self.set_position(BinaryExpression(expr, operator, right), operator_token)
-        return expr
-
-    def factor(self) -> Expression:
-        expr = self.unary()
-        while self.match("DIVIDE", "MULTIPLY", "MODULO"):
-            operator_token = self.previous()
-            operator = operator_token.value
-            right = self.unary()
-            expr = self.set_position(BinaryExpression(expr, operator, right), operator_token)
-        return expr
-
-    def unary(self) -> Expression:
-        if self.match("NOT", "MINUS"):
-            operator_token = self.previous()
-            operator = operator_token.value
-            right = self.unary()
-            return self.set_position(UnaryExpression(operator, right), operator_token)
-        return self.call()
-
-    def call(self) -> Expression:
-        expr = self.primary()
+        """Pratt-Parser für Ausdrücke.
+
+        Binäroperatoren werden über _BINDING_POWERS gefaltet. Offene
+        Operatoren, Klammern, Argumentlisten und Indexzugriffe liegen auf
+        einem expliziten Stack, die Schachtelungstiefe ist daher nicht durch
+        Pythons Rekursionslimit begrenzt. AST und Positionen entsprechen der
+        früheren Kette oder → und → Gleichheit → Vergleich → Term → Faktor
+        → unär → Aufruf → primär.
+        """
+        types = self.types
+        tokens = self.tokens
+        stack = []
+        expr = None
         while True:
-            if self.match("DOT"):
-                dot_token = self.previous()
+            if expr is None:
+                # Operand: Präfix-Operatoren, dann Literal, Name oder Klammer
+                code = types[self.current]
+                while code in _PREFIX_CODES:
+                    stack.append((_UNARY, tokens[self.current]))
+                    self.current += 1
+                    code = types[self.current]
+                token = tokens[self.current]
+                if code == _LPAREN:
+                    self.current += 1
+                    stack.append((_GROUP, token))
+                    continue
+                if code == _LBRACKET:  # Array-Literal
+                    self.current += 1
+                    if types[self.current] != _RBRACKET:
+                        stack.append((_ARRAY, token, []))
+                        continue
+                    self.current += 1
+                    expr = self.set_position(ArrayLiteralExpression([]), token)
+                else:
+                    expr = self.primary()
+
+            # Postfix: obj.NAME, obj.METHODE(...), f(...), a[...]
+            code = types[self.current]
+            if code == _DOT:
+                dot_token = tokens[self.current]
+                self.current += 1
                 method_or_property = self.consume("IDENTIFIER", "Expected property or method name after '.'").value
-                if self.match("LPAREN"):
+                if types[self.current] == _LPAREN:
                     # Methodenaufruf: obj.METHODE(...)
-                    arguments = []
-                    if not self.check("RPAREN"):
-                        arguments.append(self.expression())
-                        while self.match("COMMA"):
-                            arguments.append(self.expression())
-                    self.consume("RPAREN", "Expected ')' after arguments")
-                    expr = self.set_position(MethodCallExpression(expr, method_or_property, arguments), dot_token)
+                    self.current += 1
+                    if types[self.current] != _RPAREN:
+                        stack.append((_METHOD, dot_token, [], expr, method_or_property))
+                        expr = None
+                        continue
+                    self.current += 1
+                    expr = self.set_position(MethodCallExpression(expr, method_or_property, []), dot_token)
                 else:
                     # Property-Access: obj.METHODE
                     expr = self.set_position(PropertyAccessExpression(expr, method_or_property), dot_token)
-            elif self.match("LPAREN"):
-                paren_token = self.previous()
-                call_expr = self.finish_call(expr)
-                expr = self.set_position(call_expr, paren_token)
-            elif self.match("LBRACKET"):  # Array-Zugriff
-                bracket_token = self.previous()
-                index = self.expression()
+                continue
+            if code == _LPAREN:
+                paren_token = tokens[self.current]
+                self.current += 1
+                if types[self.current] != _RPAREN:
+                    stack.append((_CALL, paren_token, [], expr))
+                    expr = None
+                    continue
+                self.current += 1
+                expr = self.set_position(CallExpression(expr, []), paren_token)
+                continue
+            if code == _LBRACKET:  # Array-Zugriff
+                stack.append((_INDEX, tokens[self.current], expr))
+                self.current += 1
+                expr = None
+                continue
+
+            # Unäroperatoren binden stärker als jeder Binäroperator
+            while stack and stack[-1][0] == _UNARY:
+                operator_token = stack.pop()[1]
+                expr = self.set_position(UnaryExpression(operator_token.value, expr), operator_token)
+
+            # Infix: alle offenen Operatoren mit mindestens gleicher Bindung falten (linksassoziativ)
+            power = _BINDING_POWERS.get(code, 0)
+            while stack and stack[-1][0] == _BINARY and stack[-1][3] >= power:
+                _, left, operator_token, _ = stack.pop()
+                expr = self.set_position(BinaryExpression(left, operator_token.value, expr), operator_token)
+            if power:
+                stack.append((_BINARY, expr, tokens[self.current], power))
+                self.current += 1
+                expr = None
+                continue
+
+            # Teilausdruck zu Ende: oberste Klammer schließen oder fertig
+            if not stack:
+                return expr
+            frame = stack.pop()
+            kind = frame[0]
+            if kind == _GROUP:
+                self.consume("RPAREN", "Expected ')' after expression")
+            elif kind == _INDEX:
                 self.consume("RBRACKET", "Expected ']' after array index")
-                expr = self.set_position(ArrayAccessExpression(expr, index), bracket_token)
+                expr = self.set_position(ArrayAccessExpression(frame[2], expr), frame[1])
             else:
-                break
-        return expr
-
-    def finish_call(self, callee: Expression) -> CallExpression:
-        arguments = []
-        if not self.check("RPAREN"):
-            arguments.append(self.expression())
-            while self.match("COMMA"):
-                arguments.append(self.expression())
-        self.consume("RPAREN", "Expected ')' after arguments")
-        return CallExpression(callee, arguments)
+                arguments = frame[2]
+                arguments.append(expr)
+                if types[self.current] == _COMMA:
+                    self.current += 1
+                    stack.append(frame)
+                    expr = None
+                    continue
+                if kind == _ARRAY:
+                    self.consume("RBRACKET", "Expected ']' after array literal")
+                    expr = self.set_position(ArrayLiteralExpression(arguments), frame[1])
+                elif kind == _CALL:
+                    self.consume("RPAREN", "Expected ')' after arguments")
+                    expr = self.set_position(CallExpression(frame[3], arguments), frame[1])
+                else:
+                    self.consume("RPAREN", "Expected ')' after arguments")
+                    expr = self.set_position(MethodCallExpression(frame[3], frame[4], arguments), frame[1])
 
     def primary(self) -> Expression:
-        if self.match("LBRACKET"):  # Array-Literal
-            token = self.previous()
-            elements = []
-            if not self.check("RBRACKET"):
-                elements.append(self.expression())
-                while self.match("COMMA"):
-                    elements.append(self.expression())
-            self.consume("RBRACKET", "Expected ']' after array literal")
-            return self.set_position(ArrayLiteralExpression(elements), token)
-        if self.match("TEMPLATE_STRING_LITERAL"):  # Template-String
-            token = self.previous()
-            return self.set_position(self.parse_template_string_literal(token.value), token)
-        if self.match("BOOL_LITERAL"):
-            token = self.previous()
-            value = token.value
-            if value == "JA":
-                return self.set_position(LiteralExpression(True, "BOOL"), token)
-            else:
-                return self.set_position(LiteralExpression(False, "BOOL"), token)
-        if self.match("STRING_LITERAL"):
-            token = self.previous()
+        """Literal oder Name an der aktuellen Position (ohne Klammern)"""
+        token = self.tokens[self.current]
+        code = self.types[self.current]
+        if code == _IDENTIFIER:
+            self.current += 1
+            return self.set_position(IdentifierExpression(token.value), token)
+        if code == _INT_LITERAL:
+            self.current += 1
+            value = int(token.value)
+            if value < len(_SHARED_INTS):
+                return _SHARED_INTS[value]
+            return self.set_position(LiteralExpression(value, "INT"), token)
+        if code == _STRING_LITERAL:
+            self.current += 1
             return self.set_position(LiteralExpression(token.value, "STRING"), token)
-        if self.match("INT_LITERAL"):
-            token = self.previous()
-            return self.set_position(LiteralExpression(int(token.value), "INT"), token)
-        if self.match("FLOAT_LITERAL"):
-            token = self.previous()
+        if code == _TEMPLATE_STRING_LITERAL:  # Template-String
+            self.current += 1
+            return self.set_position(self.parse_template_string_literal(token.value), token)
+        if code == _BOOL_LITERAL:
+            self.current += 1
+            return _SHARED_JA if token.value == "JA" else _SHARED_NEIN
+        if code == _FLOAT_LITERAL:
+            self.current += 1
             return self.set_position(LiteralExpression(float(token.value), "FLOAT"), token)
-        if self.match("IDENTIFIER"):
-            token = self.previous()
-            return self.set_position(IdentifierExpression(token.value), token)
-        if self.match("LPAREN"):
-            expr = self.expression()
-            self.consume("RPAREN", "Expected ')' after expression")
-            return expr
-        
+
         # Unerwartetes Token mit Position information
-        token = self.peek()
         raise ParseError(f"Unexpected token '{token.value}'", token)
 
     def synchronize(self):
-        self.advance()
-        while not self.is_at_end():
+        """Überspringt Tokens bis nach ';' oder vor den Beginn der nächsten Anweisung bzw. ein '}'.
+
+        Ein '{' gehört noch zur fehlerhaften Anweisung (Kopf von WENN, FÜR,
+        Funktion, ...): der Block wird mitsamt SONST-Blöcken als Block geparst
+        und verworfen. So werden Fehler darin gemeldet, seine schließende '}'
+        aber nicht als überzählig.
+        """
+        if not self.check("LBRACE"):
+            self.advance()
             if self.previous().type == "SEMICOLON":
                 return
-            if self.peek().type in ["IF", "FOR", "WHILE", "RETURN", "VOID", "INT", "FLOAT", "STRING", "BOOL", "PRINT"]:
+        while not self.is_at_end():
+            if self.match("LBRACE"):
+                try:
+                    self.block_statement()
+                except ParseError as error:
+                    self.record_error(error)
+                if not self.match("ELSE"):
+                    return
+                continue
+            if self.peek().type in ["IF", "FOR", "WHILE", "RETURN", "VOID", "INT", "FLOAT", "STRING", "BOOL", "PRINT", "PURE", "RBRACE"]:
                 return
             self.advance()
+            if self.previous().type == "SEMICOLON":
+                return
 
     def try_catch_statement(self) -> TryCatchStatement:
         self.consume("LPAREN", "Expected '(' after 'VERSUCHE'")
@@ -667,45 +948,80 @@ class Parser:
         return TryCatchStatement(try_block, catch_var, catch_block)
 
     def parse_template_string_literal(self, template_string: str) -> TemplateStringExpression:
-        """Parst einen Template-String-Literal in parts und expressions"""
-        import re
-        
-        parts = []
-        expressions = []
-        
-        # Finde alle ${...} Teile
-        pattern = r'\$\{([^}]+)\}'
-        last_end = 0
-        
-        for match in re.finditer(pattern, template_string):
-            # String-Teil vor der Expression
-            part_before = template_string[last_end:match.start()]
-            parts.append(part_before)
-            
-            # Expression-Inhalt parsen
-            expr_content = match.group(1)
-            
-            # Mini-Parser für die Expression
-            from lexer import Lexer
-            expr_lexer = Lexer(expr_content)
-            expr_tokens = expr_lexer.tokenize()
-            
-            # Erstelle einen Mini-Parser für die Expression
-            expr_parser = Parser(expr_tokens)
-            expr = expr_parser.expression()
-            expressions.append(expr)
-            
-            last_end = match.end()
-        
-        # Letzten String-Teil hinzufügen
-        final_part = template_string[last_end:]
-        parts.append(final_part)
-        
-        return TemplateStringExpression(parts, expressions)
+        """Parst einen Template-String-Literal in parts und expressions.
+
+        Zerlegung und Tokens der ${...}-Abschnitte kommen aus _TEMPLATE_CACHE,
+        die Ausdrücke werden für jedes Vorkommen neu geparst: Resolver und
+        Optimizer schreiben in die Knoten, gleiche Templates dürfen sie daher
+        nicht teilen.
+        """
+        cached = _TEMPLATE_CACHE.get(template_string)
+        if cached is None:
+            parts = []
+            slot_tokens = []
+            last_end = 0
+            for start, end in _template_slots(template_string):
+                # String-Teil vor der Expression
+                parts.append(template_string[last_end:start])
+                # Expression-Inhalt ohne ${ und }
+                slot_tokens.append(Lexer(template_string[start + 2:end - 1]).tokenize_compact())
+                last_end = end
+            # Letzten String-Teil hinzufügen
+            parts.append(template_string[last_end:])
+            cached = _TEMPLATE_CACHE[template_string] = (tuple(parts), tuple(slot_tokens))
+            if len(_TEMPLATE_CACHE) > TEMPLATE_CACHE_SIZE:
+                _TEMPLATE_CACHE.popitem(last=False)
+        else:
+            _TEMPLATE_CACHE.move_to_end(template_string)
+        parts, slot_tokens = cached
+        expressions = [Parser(tokens).expression() for tokens in slot_tokens]
+        return TemplateStringExpression(list(parts), expressions)
+
+# Zerlegte Template-Strings (LRU): Text -> (Textstücke, TokenStore pro ${...})
+TEMPLATE_CACHE_SIZE = 512
+_TEMPLATE_CACHE = OrderedDict()
+
+def _template_slots(template: str):
+    """Liefert (start, ende) aller ${...}-Abschnitte, ende exklusive der }.
+
+    Klammern werden gezählt und Strings im Ausdruck übersprungen, damit
+    z.B. ${f({})} oder ${"}"} vollständig erkannt werden. Leere oder nicht
+    geschlossene ${ bleiben wie bisher normaler Text.
+    """
+    pos = template.find("${")
+    while pos != -1:
+        end = _template_expression_end(template, pos + 2)
+        if end is None:
+            return
+        if end > pos + 2:
+            yield pos, end + 1
+            pos = template.find("${", end + 1)
+        else:
+            pos = template.find("${", pos + 1)
+
+def _template_expression_end(template: str, index: int) -> Optional[int]:
+    """Index der schließenden } ab index, None falls keine passende folgt"""
+    depth = 1
+    length = len(template)
+    while index < length:
+        char = template[index]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+        elif char in "\"'":
+            # String im Ausdruck überspringen (mit Escapes)
+            index += 1
+            while index < length and template[index] != char:
+                index += 2 if template[index] == "\\" else 1
+            if index >= length:
+                return None
+        index += 1
+    return None
 
 if __name__ == "__main__":
-    import sys
-    from lexer import Lexer
     if len(sys.argv) > 1 and sys.argv[1] == "ast":
         # Beispiel: python parser.py ast examples/imports/main.gerl
         filename = sys.argv[2]
@@ -0,0 +1,282 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Profiler für GerLang-Programme
+
+Profiler (gerlang profile) misst deterministisch Aufrufe sowie Gesamt- und
+Eigenzeit pro GerLang-Funktion und Treffer und Zeit pro Quellzeile. Dazu
+ersetzt attach() an einem Interpreter (Baum-Engine) call_function und den
+Statement-Dispatcher durch messende Wrapper. Ohne Profiler bleibt der
+Interpreter unverändert, ausgeschaltet kostet das Profil also nichts.
+
+SamplingProfiler (gerlang run --sample-profile) greift stattdessen aus
+einem eigenen Thread in festen Abständen den CallStack des Interpreters
+und die gerade ausgeführte Zeile ab und schreibt die Stichproben im
+Collapsed-Stack-Format für Flame-Graph-Werkzeuge (flamegraph.pl,
+speedscope, ...). Die Ausführung selbst wird dabei nicht instrumentiert.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import expression_evaluator
+import statement_executor
+from parser import BlockStatement
+
+# Stichproben pro Sekunde (gerlang run --sample-rate)
+DEFAULT_SAMPLE_RATE = 200
+
+
+class FunctionProfile:
+    """Messwerte einer GerLang-Funktion.
+
+    inclusive zählt bei Rekursion nur den äußersten Aufruf (sonst würde die
+    Zeit mehrfach gezählt), exclusive ist die Zeit ohne aufgerufene
+    Funktionen. Endaufrufe (ZURÜCK f(...) in f) zählen als Aufruf.
+    """
+    __slots__ = ("name", "calls", "inclusive", "exclusive", "active")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.inclusive = 0.0
+        self.exclusive = 0.0
+        self.active = 0  # Laufende Aufrufe (Rekursion)
+
+
+class LineProfile:
+    """Messwerte einer Quellzeile: ausgeführte Statements und deren Eigenzeit
+    (ohne verschachtelte Statements, auch nicht die aufgerufener Funktionen)"""
+    __slots__ = ("line", "hits", "time")
+
+    def __init__(self, line: int):
+        self.line = line
+        self.hits = 0
+        self.time = 0.0
+
+
+class Profiler:
+    """Sammelt ein Profil, solange er an einem Interpreter hängt"""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.functions: Dict[str, FunctionProfile] = {}
+        self.lines: Dict[int, LineProfile] = {}
+        self.total = 0.0
+        # Zeit aufgerufener Funktionen pro laufendem Aufruf (für exclusive)
+        self._calls = [0.0]
+        # Zeit verschachtelter Statements und Aufrufe pro laufendem Statement
+        self._statements = [0.0]
+
+    def attach(self, interpreter):
+        """Messende Wrapper am Interpreter installieren (nur engine="tree")"""
+        if interpreter.engine != "tree":
+            raise ValueError("Profiling ist nur mit der Baum-Engine (tree) möglich")
+        interpreter.call_function = self._wrap_call(interpreter.call_function)
+        executor = interpreter.statement_executor
+        executor.execute = self._wrap_execute(executor.execute)
+
+    def run(self, interpreter, program):
+        """interpret() mit Profil; misst auch die Gesamtzeit"""
+        self.attach(interpreter)
+        start = self.clock()
+        try:
+            return interpreter.interpret(program)
+        finally:
+            self.total += self.clock() - start
+
+    def _wrap_call(self, call_function):
+        clock = self.clock
+        functions = self.functions
+        calls = self._calls
+        statements = self._statements
+
+        def call(func, args, call_site_node=None):
+            profile = functions.get(func.name)
+            if profile is None:
+                profile = functions[func.name] = FunctionProfile(func.name)
+            profile.calls += 1
+            outermost = not profile.active
+            profile.active += 1
+            calls.append(0.0)
+            statements.append(0.0)
+            start = clock()
+            try:
+                return call_function(func, args, call_site_node)
+            finally:
+                elapsed = clock() - start
+                profile.exclusive += elapsed - calls.pop()
+                profile.active -= 1
+                if outermost:
+                    profile.inclusive += elapsed
+                calls[-1] += elapsed
+                # Das aufrufende Statement zählt den ganzen Aufruf nicht als Eigenzeit
+                statements.pop()
+                statements[-1] += elapsed
+        return call
+
+    def _wrap_execute(self, execute):
+        clock = self.clock
+        lines = self.lines
+        nested = self._statements
+
+        def profiled(stmt):
+            if type(stmt) is BlockStatement:
+                # Blöcke zählen nicht als eigene Zeile ("{" steht meist hinter WENN, FÜR, ...)
+                return execute(stmt)
+            line = getattr(stmt, "line", 0)
+            profile = lines.get(line)
+            if profile is None:
+                profile = lines[line] = LineProfile(line)
+            profile.hits += 1
+            nested.append(0.0)
+            start = clock()
+            try:
+                return execute(stmt)
+            finally:
+                elapsed = clock() - start
+                profile.time += elapsed - nested.pop()
+                nested[-1] += elapsed
+        return profiled
+
+    def function_rows(self, sort: str = "eigen") -> List[dict]:
+        """Funktionen als Zeilen der Tabelle bzw. des JSON-Exports"""
+        rows = [{
+            "funktion": profile.name,
+            "aufrufe": profile.calls,
+            "gesamt_ms": profile.inclusive * 1000,
+            "eigen_ms": profile.exclusive * 1000,
+        } for profile in self.functions.values()]
+        key = {"eigen": "eigen_ms", "gesamt": "gesamt_ms", "aufrufe": "aufrufe"}[sort]
+        rows.sort(key=lambda row: (-row[key], row["funktion"]))
+        return rows
+
+    def line_rows(self, source_lines: List[str] = ()) -> List[dict]:
+        """Quellzeilen nach Zeit sortiert, mit Quelltext soweit bekannt"""
+        rows = []
+        for profile in self.lines.values():
+            text = source_lines[profile.line - 1].strip() if 0 < profile.line <= len(source_lines) else ""
+            rows.append({"zeile": profile.line, "treffer": profile.hits, "zeit_ms": profile.time * 1000, "quelltext": text})
+        rows.sort(key=lambda row: (-row["zeit_ms"], row["zeile"]))
+        return rows
+
+    def report(self, file_path: str, source_lines: List[str] = (), sort: str = "eigen") -> dict:
+        """Profil als JSON-taugliches dict (gerlang profile --json)"""
+        return {
+            "datei": file_path,
+            "gesamt_ms": self.total * 1000,
+            "funktionen": self.function_rows(sort),
+            "zeilen": self.line_rows(source_lines),
+        }
+
+    def format(self, source_lines: List[str] = (), sort: str = "eigen", limit: int = 20) -> str:
+        """Tabellen für Funktionen und Zeilen (jeweils höchstens limit Einträge)"""
+        total_ms = self.total * 1000 or 1.0
+        out = [f"\n📊 Profil ({self.total * 1000:.1f} ms gesamt)", "", "Funktionen:"]
+        functions = self.function_rows(sort)
+        if functions:
+            out.append(f"  {'Funktion':<20}{'Aufrufe':>10}{'Gesamt ms':>12}{'Eigen ms':>12}{'Eigen %':>9}")
+            for row in functions[:limit]:
+                out.append(f"  {row['funktion']:<20}{row['aufrufe']:>10}{row['gesamt_ms']:>12.2f}"
+                           f"{row['eigen_ms']:>12.2f}{row['eigen_ms'] / total_ms * 100:>9.1f}")
+        else:
+            out.append("  Keine Funktion aufgerufen")
+        out += ["", "Zeilen:"]
+        out.append(f"  {'Zeile':>6}{'Treffer':>10}{'Zeit ms':>12}{'Zeit %':>8}  Quelltext")
+        for row in self.line_rows(source_lines)[:limit]:
+            out.append(f"  {row['zeile']:>6}{row['treffer']:>10}{row['zeit_ms']:>12.2f}"
+                       f"{row['zeit_ms'] / total_ms * 100:>8.1f}  {row['quelltext']}")
+        return "\n".join(out)
+
+
+class SamplingProfiler:
+    """Stichproben von CallStack und aktueller Zeile aus einem Hintergrund-Thread.
+
+    Jede Stichprobe wird zu einem Stack wie "haupt (spiel.gerl:12);fib
+    (spiel.gerl:3)": die Zeile eines Frames ist die Aufrufstelle des
+    nächsten (aus CallFrame), beim innersten die gerade ausgeführte Zeile.
+    Die kommt aus den Python-Frames des Interpreter-Threads (Baum-Engine:
+    Statement bzw. Ausdruck, VM: Zeilentabelle des Bytecodes); die
+    Closure-Engine liefert nur Funktionen. Globale Statements erscheinen
+    als "<global>".
+    """
+
+    def __init__(self, interpreter, rate: int = DEFAULT_SAMPLE_RATE):
+        if rate <= 0:
+            raise ValueError("Die Sample-Rate muss größer als 0 sein")
+        self.interpreter = interpreter
+        self.interval = 1.0 / rate
+        self.samples = Counter()
+        self._thread = None
+        self._stop = threading.Event()
+        self._target = None  # Thread-ID des Interpreters
+        self._tree_files = {statement_executor.__file__, expression_evaluator.__file__}
+        self._vm_file = sys.modules["vm"].__file__ if interpreter.engine == "vm" else None
+
+    def start(self):
+        """Stichproben des aufrufenden Threads sammeln, bis stop()"""
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="gerlang-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        """Eine Stichprobe nehmen (läuft im Sampler-Thread)"""
+        frames = list(self.interpreter.call_stack.frames)
+        line = self.current_line(sys._current_frames().get(self._target))
+        self.samples[self.fold(frames, line)] += 1
+
+    def current_line(self, frame) -> Optional[int]:
+        """Zeile, die der Interpreter im innersten GerLang-Kontext gerade ausführt"""
+        tree_files = self._tree_files
+        vm_file = self._vm_file
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            if filename in tree_files:
+                local_vars = frame.f_locals
+                node = local_vars.get("expr") or local_vars.get("stmt")
+                line = getattr(node, "line", 0)
+                if line:
+                    return line
+            elif filename == vm_file and frame.f_code.co_name == "run":
+                local_vars = frame.f_locals
+                code, pc = local_vars.get("code"), local_vars.get("pc")
+                if code is not None and pc:
+                    lines = code.lines
+                    return lines[min(pc // 2, len(lines)) - 1] or None
+            frame = frame.f_back
+        return None
+
+    def fold(self, frames, line: Optional[int]) -> str:
+        """Stack einer Stichprobe im Collapsed-Format (ohne Anzahl)"""
+        source = os.path.basename(self.interpreter.current_file or "")
+        names = [frame.function_name for frame in frames] or ["<global>"]
+        lines = [frame.line for frame in frames[1:]] + [line]
+        parts = []
+        for name, frame_line in zip(names, lines):
+            parts.append(f"{name} ({source}:{frame_line})" if frame_line else name)
+        return ";".join(part.replace(";", ",") for part in parts)
+
+    def write(self, path: str) -> int:
+        """Stichproben als "stack anzahl" pro Zeile schreiben, liefert deren Summe"""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+        return sum(self.samples.values())
@@ -0,0 +1,358 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Resolver für GerLang 4.1.0
+Bindet Variablen vor der Ausführung an (depth, slot)-Paare in Slot-Scopes
+"""
+
+from typing import Dict, List, Optional
+
+from parser import (
+    Program, FunctionDeclaration, BlockStatement, ExpressionStatement,
+    VariableDeclaration, AssignmentStatement, IfStatement, WhileStatement,
+    ForStatement, ReturnStatement, PrintStatement, TryCatchStatement, SetExpression,
+    LiteralExpression, IdentifierExpression, BinaryExpression, UnaryExpression, CallExpression,
+    ArrayLiteralExpression, ArrayAccessExpression, PropertyAccessExpression,
+    MethodCallExpression, TemplateStringExpression, iter_children
+)
+from gerlang_builtins import BuiltinFunctions
+
+_BUILTIN_NAMES = BuiltinFunctions.names()
+
+# Vergleich in der Bedingung -> (Vorzeichen der Schrittweite, Korrektur des range-Endes)
+_COUNTED_COMPARISONS = {"<": (1, 0), "<=": (1, 1), ">": (-1, 0), ">=": (-1, -1)}
+
+
+class Resolver:
+    """Statische Auflösung der Variablen für den Baum-Interpreter.
+
+    Scopes entstehen nur noch für Funktionen (Parameter und Rumpf teilen sich
+    einen Frame), Blöcke, FÜR-Schleifen und FANGE-Variablen, die tatsächlich
+    etwas deklarieren. Jede Verwendung bekommt die Kandidaten aller
+    umschließenden Scopes der eigenen Funktion, die den Namen irgendwo
+    deklarieren (siehe environment.lookup). Globale Variablen und Built-ins
+    bleiben dynamisch im globalen Environment, unbekannte Namen fallen daher
+    erst zur Laufzeit mit derselben Meldung (GL003) auf wie bisher.
+
+    Gesetzt werden: IdentifierExpression.binding, AssignmentStatement.binding,
+    VariableDeclaration.slot (None = global), scope_size von Block-, FÜR- und
+    VERSUCHE-Statements, frame_size und parameter_slots von Funktionen sowie
+    ForStatement.counted (siehe counted_loop).
+    """
+
+    def __init__(self):
+        # Name -> Slot für jeden existierenden Scope der aktuellen Funktion
+        self._scopes: List[Dict[str, int]] = []
+
+    def resolve(self, program: Program):
+        """Löst alle globalen Statements und Funktionen eines Programms auf"""
+        self._scopes = []
+        for stmt in program.statements:
+            if isinstance(stmt, FunctionDeclaration):
+                self.resolve_function(stmt)
+            else:
+                self._statement(stmt)
+
+    def resolve_function(self, decl: FunctionDeclaration):
+        """Frame einer Funktion: Parameter zuerst, dann die Deklarationen des Rumpfs"""
+        body = decl.body
+        names = [name for _, name in decl.parameters]
+        if isinstance(body, BlockStatement):
+            statements = body.statements
+            # Der Rumpf teilt sich den Frame mit den Parametern
+            body.scope_size = 0
+        else:
+            statements = [body]
+        for stmt in statements:
+            _collect_declarations(stmt, names)
+
+        outer = self._scopes
+        frame = self._slots_for(names)
+        self._scopes = [frame]
+        for stmt in statements:
+            self._statement(stmt)
+        self._scopes = outer
+        decl.frame_size = len(frame)
+        decl.parameter_slots = tuple(frame[name] for _, name in decl.parameters)
+
+    # ===== Scopes =====
+
+    @staticmethod
+    def _slots_for(names: List[str]) -> Dict[str, int]:
+        """Slots ab 1 (Index 0 des Scopes ist der umgebende Scope)"""
+        slots = {}
+        for name in names:
+            if name not in slots:
+                slots[name] = len(slots) + 1
+        return slots
+
+    def _binding(self, name: str) -> tuple:
+        """(depth, slot)-Kandidaten, innerster Scope zuerst"""
+        candidates = []
+        for depth, scope in enumerate(reversed(self._scopes)):
+            slot = scope.get(name)
+            if slot is not None:
+                candidates.append((depth, slot))
+        return tuple(candidates)
+
+    def _enter(self, stmt, names: List[str]) -> bool:
+        """Legt einen Scope an, falls names nicht leer ist (sonst braucht stmt keinen)"""
+        slots = self._slots_for(names)
+        stmt.scope_size = len(slots)
+        if slots:
+            self._scopes.append(slots)
+        return bool(slots)
+
+    # ===== Statements =====
+
+    def _statement(self, stmt):
+        kind = type(stmt)
+        if kind is ExpressionStatement:
+            self._expression(stmt.expression)
+        elif kind is VariableDeclaration:
+            if stmt.initializer:
+                self._expression(stmt.initializer)
+            stmt.slot = self._scopes[-1][stmt.name] if self._scopes else None
+        elif kind is AssignmentStatement:
+            self._expression(stmt.value)
+            stmt.binding = self._binding(stmt.name)
+        elif kind is SetExpression:
+            self._expression(stmt.value)
+            self._expression(stmt.target)
+        elif kind is BlockStatement:
+            names = []
+            for child in stmt.statements:
+                _collect_declarations(child, names)
+            entered = self._enter(stmt, names)
+            for child in stmt.statements:
+                self._statement(child)
+            if entered:
+                self._scopes.pop()
+        elif kind is IfStatement:
+            self._expression(stmt.condition)
+            self._statement(stmt.then_branch)
+            if stmt.else_branch:
+                self._statement(stmt.else_branch)
+        elif kind is WhileStatement:
+            self._expression(stmt.condition)
+            self._statement(stmt.body)
+        elif kind is ForStatement:
+            names = []
+            for child in (stmt.initializer, stmt.increment, stmt.body):
+                if child is not None:
+                    _collect_declarations(child, names)
+            entered = self._enter(stmt, names)
+            if stmt.initializer:
+                self._statement(stmt.initializer)
+            if stmt.condition:
+                self._expression(stmt.condition)
+            if stmt.increment:
+                if isinstance(stmt.increment, (AssignmentStatement, ExpressionStatement)):
+                    self._statement(stmt.increment)
+                else:
+                    self._expression(stmt.increment)
+            self._statement(stmt.body)
+            if entered:
+                self._scopes.pop()
+            stmt.counted = counted_loop(stmt)
+        elif kind is ReturnStatement:
+            if stmt.value:
+                self._expression(stmt.value)
+        elif kind is PrintStatement:
+            self._expression(stmt.expression)
+        elif kind is TryCatchStatement:
+            self._statement(stmt.try_block)
+            if stmt.catch_var:
+                names = [stmt.catch_var]
+                _collect_declarations(stmt.catch_block, names)
+                self._enter(stmt, names)
+                self._statement(stmt.catch_block)
+                self._scopes.pop()
+            else:
+                stmt.scope_size = 0
+                self._statement(stmt.catch_block)
+        # Verschachtelte Funktionen, Import und Export werden nicht ausgeführt
+
+    # ===== Expressions =====
+
+    def _expression(self, expr):
+        """Iterativ, damit auch tief verschachtelte Ausdrücke auflösbar bleiben"""
+        work = [expr]
+        while work:
+            node = work.pop()
+            kind = type(node)
+            if kind is IdentifierExpression:
+                node.binding = self._binding(node.name)
+            elif kind is BinaryExpression:
+                work.append(node.right)
+                work.append(node.left)
+            elif kind is UnaryExpression:
+                work.append(node.operand)
+            elif kind is CallExpression:
+                work.extend(node.arguments)
+                work.append(node.function)
+            elif kind is ArrayLiteralExpression:
+                work.extend(node.elements)
+            elif kind is ArrayAccessExpression:
+                work.append(node.index)
+                work.append(node.array)
+            elif kind is PropertyAccessExpression:
+                work.append(node.object_expr)
+            elif kind is MethodCallExpression:
+                work.extend(node.arguments)
+                work.append(node.object_expr)
+            elif kind is TemplateStringExpression:
+                work.extend(node.expressions)
+
+
+def _collect_declarations(stmt, names: List[str]):
+    """Namen, die stmt direkt im aktuellen Scope deklariert (ohne eigene Scopes
+    wie Blöcke, FÜR-Schleifen oder FANGE mit Variable)"""
+    kind = type(stmt)
+    if kind is VariableDeclaration:
+        names.append(stmt.name)
+    elif kind is IfStatement:
+        _collect_declarations(stmt.then_branch, names)
+        if stmt.else_branch:
+            _collect_declarations(stmt.else_branch, names)
+    elif kind is WhileStatement:
+        _collect_declarations(stmt.body, names)
+    elif kind is TryCatchStatement:
+        _collect_declarations(stmt.try_block, names)
+        if not stmt.catch_var:
+            _collect_declarations(stmt.catch_block, names)
+
+
+def mark_tail_calls(decl: FunctionDeclaration):
+    """Markiert ZURÜCK name(...) im Rumpf der Funktion name als Endaufruf
+    (CallExpression.tail_call), siehe Interpreter.execute_function.
+
+    Ausgenommen sind Aufrufe innerhalb von VERSUCHE-Blöcken: dort fängt FANGE
+    auch Fehler des rekursiven Aufrufs, der Frame muss also bestehen bleiben.
+    """
+    work = [decl.body]
+    while work:
+        stmt = work.pop()
+        kind = type(stmt)
+        if kind is ReturnStatement:
+            value = stmt.value
+            if type(value) is CallExpression and getattr(value.function, "name", None) == decl.name:
+                value.tail_call = True
+        elif kind is BlockStatement:
+            work.extend(stmt.statements)
+        elif kind is IfStatement:
+            work.append(stmt.then_branch)
+            if stmt.else_branch:
+                work.append(stmt.else_branch)
+        elif kind is WhileStatement or kind is ForStatement:
+            work.append(stmt.body)
+        elif kind is TryCatchStatement:
+            work.append(stmt.catch_block)
+
+
+class CountedLoop:
+    """FÜR (GANZ i = start; i < grenze; i = i + schritt), das als range laufen darf.
+
+    bound ist der Ausdruck der Grenze, er wird einmal vor der ersten Runde
+    ausgewertet; das range-Ende ist bound + end_offset. local_names sind
+    Variablen (IdentifierExpression) aus bound, die zur Laufzeit lokal
+    gebunden sein müssen; nur falls der Rumpf Funktionen aufruft, die
+    globale Variablen ändern könnten.
+    """
+    __slots__ = ("name", "bound", "step", "end_offset", "local_names")
+
+    def __init__(self, name: str, bound, step: int, end_offset: int, local_names: tuple):
+        self.name = name
+        self.bound = bound
+        self.step = step
+        self.end_offset = end_offset
+        self.local_names = local_names
+
+
+def counted_loop(stmt: ForStatement) -> Optional[CountedLoop]:
+    """Erkennt Zählschleifen mit unveränderlicher Grenze.
+
+    Verlangt werden GANZ-Zähler, Bedingung zaehler < / <= / > / >= grenze
+    und zaehler = zaehler +/- Ganzzahl-Literal mit passender Richtung. Der
+    Rumpf darf den Zähler und die Namen der Grenze weder zuweisen noch neu
+    deklarieren. Die Grenze besteht aus Literalen, Variablen, +, -, * und
+    .LÄNGE; .LÄNGE nur, wenn der Rumpf weder KISTE-Methoden noch
+    benutzerdefinierte Funktionen aufruft. Ob Start und Grenze wirklich
+    Ganzzahlen sind, prüft erst die Ausführung.
+    """
+    initializer = stmt.initializer
+    if type(initializer) is not VariableDeclaration or initializer.type_name != "GANZ" \
+            or initializer.initializer is None:
+        return None
+    name = initializer.name
+    condition = stmt.condition
+    if type(condition) is not BinaryExpression or condition.operator not in _COUNTED_COMPARISONS \
+            or type(condition.left) is not IdentifierExpression or condition.left.name != name:
+        return None
+    increment = stmt.increment
+    if type(increment) is not AssignmentStatement or increment.name != name:
+        return None
+    value = increment.value
+    if type(value) is not BinaryExpression or value.operator not in ("+", "-") \
+            or type(value.left) is not IdentifierExpression or value.left.name != name \
+            or type(value.right) is not LiteralExpression or type(value.right.value) is not int:
+        return None
+    step = value.right.value if value.operator == "+" else -value.right.value
+    direction, end_offset = _COUNTED_COMPARISONS[condition.operator]
+    if step * direction <= 0:
+        return None
+
+    assigned, calls, mutates = _loop_effects(stmt.body)
+    bound_names = []
+    if not _invariant(condition.right, bound_names, not (calls or mutates)):
+        return None
+    if name in assigned or any(n.name == name or n.name in assigned for n in bound_names):
+        return None
+    return CountedLoop(name, condition.right, step, end_offset, tuple(bound_names) if calls else ())
+
+
+def _loop_effects(body) -> tuple:
+    """(zugewiesene/deklarierte Namen, ruft Funktionen auf, ruft KISTE-Methoden auf)"""
+    assigned = set()
+    calls = mutates = False
+    work = [body]
+    while work:
+        node = work.pop()
+        kind = type(node)
+        if kind is AssignmentStatement or kind is VariableDeclaration:
+            assigned.add(node.name)
+        elif kind is SetExpression and type(node.target) is IdentifierExpression:
+            assigned.add(node.target.name)
+        elif kind is TryCatchStatement and node.catch_var:
+            assigned.add(node.catch_var)
+        elif kind is MethodCallExpression:
+            mutates = True
+        elif kind is CallExpression and getattr(node.function, "name", None) not in _BUILTIN_NAMES:
+            calls = True
+        elif kind is FunctionDeclaration:
+            continue
+        work.extend(iter_children(node))
+    return assigned, calls, mutates
+
+
+def _invariant(expr, names: List[IdentifierExpression], length_allowed: bool) -> bool:
+    """Ob expr ohne Seiteneffekte aus Literalen und Variablen (names) besteht"""
+    kind = type(expr)
+    if kind is LiteralExpression:
+        return True
+    if kind is IdentifierExpression:
+        names.append(expr)
+        return True
+    if kind is PropertyAccessExpression:
+        return (length_allowed and expr.property_name == "LÄNGE"
+                and _invariant(expr.object_expr, names, length_allowed))
+    if kind is BinaryExpression:
+        return (expr.operator in ("+", "-", "*")
+                and _invariant(expr.left, names, length_allowed)
+                and _invariant(expr.right, names, length_allowed))
+    if kind is UnaryExpression:
+        return expr.operator == "-" and _invariant(expr.operand, names, length_allowed)
+    return False
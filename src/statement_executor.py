@@ -8,8 +8,9 @@ Statement-Executor für GerLang 4.1.0
 Führt verschiedene Statement-Typen aus
 """
 
-from environment import Environment
+from environment import UNSET, assign, lookup
 from call_stack import RuntimeError as GerLangRuntimeError
+from kiste import printable
 
 
 class ReturnSignal(Exception):
@@ -18,6 +19,12 @@ class ReturnSignal(Exception):
         self.value = value
 
 
+class TailCallSignal(Exception):
+    """Signal für Endaufrufe (ZURÜCK f(...) innerhalb von f), siehe Interpreter.execute_function"""
+    def __init__(self, arguments):
+        self.arguments = arguments
+
+
 class StatementExecutor:
     """Führt verschiedene Statement-Typen aus"""
     
@@ -29,7 +36,8 @@ class StatementExecutor:
         from parser import (
             BlockStatement, ExpressionStatement, VariableDeclaration, AssignmentStatement,
             IfStatement, WhileStatement, ForStatement, ReturnStatement, PrintStatement,
-            TryCatchStatement, ExportDeclaration, ImportDeclaration, ExportListDeclaration
+            TryCatchStatement, ExportDeclaration, ImportDeclaration, ExportListDeclaration,
+            SetExpression
         )
         
         if isinstance(stmt, BlockStatement):
@@ -40,6 +48,8 @@ class StatementExecutor:
             return self._execute_variable_declaration(stmt)
         elif isinstance(stmt, AssignmentStatement):
             return self._execute_assignment(stmt)
+        elif isinstance(stmt, SetExpression):
+            return self._execute_set(stmt)
         elif isinstance(stmt, IfStatement):
             return self._execute_if(stmt)
         elif isinstance(stmt, WhileStatement):
@@ -63,16 +73,19 @@ class StatementExecutor:
 
     def _execute_block(self, stmt):
         """Führt einen Block von Statements aus"""
-        # Neue Scope für Block erstellen
-        block_env = Environment(self.interpreter.env)
-        previous_env = self.interpreter.env
-        self.interpreter.env = block_env
+        # Blöcke ohne Deklarationen brauchen keinen eigenen Scope
+        if not stmt.scope_size:
+            for s in stmt.statements:
+                self.execute(s)
+            return
 
+        previous_scope = self.interpreter.scope
+        self.interpreter.scope = self.interpreter.new_scope(previous_scope, stmt.scope_size)
         try:
             for s in stmt.statements:
                 self.execute(s)
         finally:
-            self.interpreter.env = previous_env
+            self.interpreter.scope = previous_scope
 
     def _execute_expression(self, stmt):
         """Führt ein Expression Statement aus"""
@@ -81,12 +94,28 @@ class StatementExecutor:
     def _execute_variable_declaration(self, stmt):
         """Führt eine Variablen-Deklaration aus"""
         value = self.interpreter.evaluate(stmt.initializer) if stmt.initializer else None
-        self.interpreter.env.define(stmt.name, value)
+        if stmt.slot is None:
+            self.interpreter.globals.define(stmt.name, value)
+        else:
+            self.interpreter.scope[stmt.slot] = value
 
     def _execute_assignment(self, stmt):
         """Führt eine Zuweisung aus"""
         value = self.interpreter.evaluate(stmt.value)
-        self.interpreter.env.assign(stmt.name, value)
+        if not assign(self.interpreter.scope, stmt.binding, value):
+            self.interpreter.globals.assign(stmt.name, value)
+
+    def _execute_set(self, stmt):
+        """Führt eine Zuweisung an Variable oder KISTE-Element aus (x = ...; / a[i] = ...;)"""
+        from parser import IdentifierExpression, ArrayAccessExpression
+        if isinstance(stmt.target, IdentifierExpression):
+            value = self.interpreter.evaluate(stmt.value)
+            if not assign(self.interpreter.scope, stmt.target.binding, value):
+                self.interpreter.globals.assign(stmt.target.name, value)
+        elif isinstance(stmt.target, ArrayAccessExpression):
+            self.interpreter.expression_evaluator._evaluate_set(stmt)
+        else:
+            raise GerLangRuntimeError("Zuweisung nur an Variablen oder KISTE-Elemente möglich")
 
     def _execute_if(self, stmt):
         """Führt eine If-Anweisung aus"""
@@ -98,22 +127,31 @@ class StatementExecutor:
 
     def _execute_while(self, stmt):
         """Führt eine While-Schleife aus"""
+        governor = self.interpreter.governor
         while self.interpreter.is_truthy(self.interpreter.evaluate(stmt.condition)):
             self.execute(stmt.body)
+            if governor is not None:
+                governor.tick(stmt)
 
     def _execute_for(self, stmt):
         """Führt eine For-Schleife aus"""
-        # For-Loop Scope
-        for_env = Environment(self.interpreter.env)
-        previous_env = self.interpreter.env
-        self.interpreter.env = for_env
+        # For-Loop Scope (nur falls die Schleife etwas deklariert)
+        previous_scope = self.interpreter.scope
+        if stmt.scope_size:
+            self.interpreter.scope = self.interpreter.new_scope(previous_scope, stmt.scope_size)
 
         try:
             # Initializer
             if stmt.initializer:
                 self.execute(stmt.initializer)
 
+            # Zählschleifen laufen als range, solange Start und Grenze Ganzzahlen sind
+            counted = getattr(stmt, "counted", None)
+            if counted is not None and self._execute_counted(stmt, counted):
+                return
+
             # Loop
+            governor = self.interpreter.governor
             while True:
                 # Condition check
                 if stmt.condition and not self.interpreter.is_truthy(self.interpreter.evaluate(stmt.condition)):
@@ -129,8 +167,42 @@ class StatementExecutor:
                         self.execute(stmt.increment)
                     else:
                         self.interpreter.evaluate(stmt.increment)
+                if governor is not None:
+                    governor.tick(stmt)
         finally:
-            self.interpreter.env = previous_env
+            self.interpreter.scope = previous_scope
+
+    def _execute_counted(self, stmt, counted) -> bool:
+        """Führt eine Zählschleife (resolver.counted_loop) als range aus.
+
+        Gibt False zurück, ohne etwas ausgeführt zu haben, wenn Start oder
+        Grenze keine Ganzzahl ist oder eine Variable der Grenze global ist,
+        obwohl der Rumpf Funktionen aufruft; dann läuft die normale Schleife.
+        """
+        interpreter = self.interpreter
+        scope = interpreter.scope
+        slot = stmt.initializer.slot
+        if slot is None:
+            return False
+        start = scope[slot]
+        if type(start) is not int:
+            return False
+        for identifier in counted.local_names:
+            if not identifier.binding or lookup(scope, identifier.binding) is UNSET:
+                return False
+        bound = interpreter.evaluate(counted.bound)
+        if type(bound) is not int:
+            return False
+
+        execute = self.execute
+        body = stmt.body
+        governor = interpreter.governor
+        for value in range(start, bound + counted.end_offset, counted.step):
+            scope[slot] = value
+            execute(body)
+            if governor is not None:
+                governor.tick(stmt)
+        return True
 
     def _execute_return(self, stmt):
         """Führt ein Return-Statement aus"""
@@ -140,23 +212,28 @@ class StatementExecutor:
     def _execute_print(self, stmt):
         """Führt ein Print-Statement aus"""
         value = self.interpreter.evaluate(stmt.expression)
-        print(value)
+        governor = self.interpreter.governor
+        if governor is not None:
+            governor.check_shown(value, stmt)
+        print(printable(value))
 
     def _execute_try_catch(self, stmt):
         """Führt ein Try-Catch-Statement aus"""
         try:
             self.execute(stmt.try_block)
         except Exception as e:
+            for listener in self.interpreter.hooks.listeners["catch"]:
+                listener(e)
             if stmt.catch_var:
-                # Fehler-Variable im neuen Scope setzen
-                catch_env = Environment(self.interpreter.env)
-                catch_env.define(stmt.catch_var, str(e))
-                previous_env = self.interpreter.env
-                self.interpreter.env = catch_env
+                # Fehler-Variable im neuen Scope setzen (immer Slot 1)
+                previous_scope = self.interpreter.scope
+                catch_scope = self.interpreter.new_scope(previous_scope, stmt.scope_size)
+                catch_scope[1] = str(e)
+                self.interpreter.scope = catch_scope
                 try:
                     self.execute(stmt.catch_block)
                 finally:
-                    self.interpreter.env = previous_env
+                    self.interpreter.scope = previous_scope
             else:
                 self.execute(stmt.catch_block)
 
@@ -25,6 +25,7 @@ KEYWORDS = {
     "GIBFREI": "EXPORT",
     "HOLE": "IMPORT",
     "VON": "FROM",
+    "REIN": "PURE",
 }
 
 LITERALS = {
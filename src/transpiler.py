@@ -0,0 +1,683 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Ahead-of-time Übersetzer von GerLang nach Python (gerlang compile)
+
+Erzeugt aus einem Program den Quelltext eines Python-Moduls: GerLang-
+Funktionen werden Python-Funktionen, lokale Variablen Python-Locals,
+globale Variablen Modul-Globals. Arithmetik, Vergleiche und Bedingungen
+stehen direkt im Code, nur KISTE-Zugriffe, Division, Built-ins und
+Template-Strings gehen über gerlang_runtime (Fehlermeldungen wie im
+Interpreter). Das Modul läuft mit `python datei.py` und meldet Fehler wie
+`gerlang run`.
+
+Namen werden statisch aufgelöst. Eine Deklaration als einzelner Rumpf von
+WENN, SOLANGE, FÜR oder VERSUCHE (ohne Block) ist bedingt: der Name startet
+im umgebenden Scope als UNSET und wird bei jedem Zugriff geprüft. Das ist
+nur gleichwertig, wenn der Name außen nicht gebunden ist; sonst und auf
+oberster Ebene bricht die Übersetzung mit TranspileError ab.
+"""
+
+import builtins
+import keyword
+from typing import Dict, List, Optional
+
+from parser import (
+    Program, FunctionDeclaration, BlockStatement, ExpressionStatement,
+    VariableDeclaration, AssignmentStatement, IfStatement, WhileStatement,
+    ForStatement, ReturnStatement, PrintStatement, TryCatchStatement, SetExpression,
+    ExportDeclaration, ImportDeclaration, ExportListDeclaration,
+    LiteralExpression, IdentifierExpression, BinaryExpression, UnaryExpression,
+    CallExpression, ArrayLiteralExpression, ArrayAccessExpression,
+    PropertyAccessExpression, MethodCallExpression, TemplateStringExpression
+)
+from gerlang_builtins import BuiltinFunctions
+from resolver import mark_tail_calls, counted_loop
+from memo import check_purity
+
+_BUILTIN_NAMES = BuiltinFunctions.names()
+
+# Namen, die GerLang-Variablen und -Funktionen im erzeugten Modul nicht
+# bekommen dürfen (Schlüsselwörter, von übersetztem Code genutzte Built-ins)
+_RESERVED = frozenset(keyword.kwlist) | frozenset(dir(builtins))
+
+# Präzedenz im erzeugten Python-Code (größer = bindet stärker)
+_OR, _AND, _NOT, _COMPARE, _SUM, _PRODUCT, _UNARY, _ATOM = 1, 2, 3, 4, 6, 7, 8, 10
+
+# GerLang-Operator -> (Python-Operator, Präzedenz)
+_BINARY_OPERATORS = {
+    "+": ("+", _SUM), "-": ("-", _SUM),
+    "*": ("*", _PRODUCT), "%": ("%", _PRODUCT),
+    "==": ("==", _COMPARE), "IST": ("==", _COMPARE), "!=": ("!=", _COMPARE),
+    "<": ("<", _COMPARE), "<=": ("<=", _COMPARE), ">": (">", _COMPARE), ">=": (">=", _COMPARE),
+}
+_COMPARISONS = frozenset(op for op, (_, precedence) in _BINARY_OPERATORS.items() if precedence == _COMPARE)
+
+# Markiert Aufrufe im erzeugten Text, bis ihre Python-Position feststeht
+_MARK = "\x00"
+
+_INDENT = "    "
+
+
+class TranspileError(Exception):
+    """Konstrukt, das sich nicht gleichwertig nach Python übersetzen lässt"""
+    def __init__(self, message: str, node=None):
+        super().__init__(message)
+        self.message = message
+        self.line = getattr(node, "line", 0) or 0
+        self.column = getattr(node, "column", 0) or 0
+
+
+class _Function:
+    """Zustand während der Übersetzung einer Funktion (oder der globalen Statements)"""
+    __slots__ = ("decl", "scopes", "starts", "conditional", "globals_assigned", "try_depth", "loop_depth", "tail_loop")
+
+    def __init__(self, decl: Optional[FunctionDeclaration]):
+        self.decl = decl
+        self.scopes: List[Dict[str, str]] = [{}]  # GerLang-Name -> Python-Name
+        self.starts: List[tuple] = [None]  # (Zeile, Einrückung) des Scope-Anfangs im erzeugten Code
+        self.conditional = set()  # Python-Namen bedingter Deklarationen
+        self.globals_assigned = set()
+        self.try_depth = 0  # ZURÜCK in VERSUCHE wird von FANGE gefangen
+        self.loop_depth = 0
+        self.tail_loop = False  # Rumpf steht in while True (Endaufrufe)
+
+
+class Transpiler:
+    """Übersetzt ein Program in ein Python-Modul (Quelltext als str).
+
+    source_path ist der absolute Pfad der .gerl-Datei (für Fehlermeldungen
+    mit Kontext), display_path der Pfad, wie er beim Übersetzen angegeben
+    wurde, src_dir das Verzeichnis mit gerlang_runtime.py.
+    """
+
+    def __init__(self, source_path: str = "", display_path: str = "", src_dir: str = ""):
+        self.source_path = source_path
+        self.display_path = display_path or source_path
+        self.src_dir = src_dir
+
+    def transpile(self, program: Program) -> str:
+        self._lines: List[str] = []
+        self._indent = 0
+        self._call_sites: List[tuple] = []
+        self._helpers = set()
+        self._builtins_used = set()
+
+        functions = {}
+        for stmt in program.statements:
+            if isinstance(stmt, FunctionDeclaration):
+                functions[stmt.name] = stmt
+                mark_tail_calls(stmt)
+        for func in functions.values():
+            if func.pure:
+                check_purity(func, functions, self.source_path)
+        self._functions = functions
+
+        # Modul-Namen: erst Funktionen, dann globale Variablen
+        self._module_names = set()
+        self._function_names = {name: self._allocate(name, self._module_names) for name in functions}
+        self._global_names = {}
+        for stmt in program.statements:
+            if isinstance(stmt, VariableDeclaration) and stmt.name not in self._global_names:
+                if stmt.name in _BUILTIN_NAMES:
+                    raise TranspileError(f"Globale Variable mit dem Namen des Built-ins '{stmt.name}' wird nicht unterstützt", stmt)
+                self._global_names[stmt.name] = self._allocate(stmt.name, self._module_names)
+
+        for stmt in program.statements:
+            if isinstance(stmt, FunctionDeclaration):
+                self._function(stmt)
+                self._emit("")
+        self._main(program.statements)
+
+        return self._assemble()
+
+    # ===== Modul =====
+
+    def _assemble(self) -> str:
+        """Kopf, Rumpf und Programm-Objekt; Aufrufmarken in Positionen umrechnen"""
+        header = [
+            f"# Übersetzt von gerlang compile aus {self.display_path}",
+            "# Nicht von Hand bearbeiten, Laufzeit-Unterstützung: gerlang_runtime.py",
+            "",
+            "import sys",
+            f"sys.path.insert(0, {self.src_dir!r})",
+            "",
+            "import gerlang_runtime as _rt",
+        ]
+        if self._helpers:
+            imports = ", ".join(f"{name} as _{name}" for name in sorted(self._helpers))
+            header.append(f"from gerlang_runtime import {imports}")
+        if self._builtins_used:
+            header.append("")
+            header.extend(f"_{name} = _rt.builtin({name!r})" for name in sorted(self._builtins_used))
+        header += ["", ""]
+
+        lines = header + self._lines
+        calls = {}
+        for number, line in enumerate(lines, 1):
+            while _MARK in line:
+                start = line.index(_MARK)
+                end = line.index(_MARK, start + 1)
+                site = self._call_sites[int(line[start + 1:end])]
+                line = line[:start] + line[end + 1:]
+                # co_positions zählt Spalten in UTF-8-Bytes
+                calls[(number, len(line[:start].encode("utf-8")))] = site
+            lines[number - 1] = line
+
+        functions = {python: name for name, python in self._function_names.items()}
+        variables = {python: name for name, python in self._global_names.items()}
+        lines += [
+            "",
+            "_PROGRAMM = _rt.Program(",
+            "    __file__,",
+            f"    source={self.source_path!r},",
+            f"    display_path={self.display_path!r},",
+            f"    functions={functions!r},",
+            f"    variables={variables!r},",
+            f"    calls={calls!r},",
+            ")",
+            "",
+            'if __name__ == "__main__":',
+            "    _PROGRAMM.run(_programm)",
+            "",
+        ]
+        return "\n".join(lines)
+
+    def _main(self, statements):
+        """Globale Statements und haupt() als _programm()"""
+        haupt = self._functions.get("haupt")
+        self._state = _Function(None)
+        self._emit("def _programm():")
+        self._indent += 1
+        start = len(self._lines)
+        for stmt in statements:
+            if not isinstance(stmt, FunctionDeclaration):
+                self._statement(stmt)
+        if haupt is not None:
+            if getattr(haupt, "return_type", None) not in ("GANZ", "int", "INT"):
+                message = "Die Funktion 'haupt' muss den Rückgabetyp GANZ (int) haben und einen Exit-Code zurückgeben!"
+                self._emit(f"raise Exception({message!r})")
+            else:
+                self._emit(f"{self._function_names['haupt']}()")
+        if len(self._lines) == start:
+            self._emit("pass")
+        if self._global_names:
+            self._lines.insert(start, self._line(f"global {', '.join(self._global_names.values())}"))
+        self._indent -= 1
+
+    def _function(self, decl: FunctionDeclaration):
+        state = self._state = _Function(decl)
+        parameters = []
+        for _, name in decl.parameters:
+            if name in state.scopes[0]:
+                raise TranspileError(f"Parameter '{name}' kommt in '{decl.name}' doppelt vor", decl)
+            parameters.append(self._declare(name))
+
+        if decl.pure:
+            self._emit(f"@_rt.pure({decl.name!r})")
+        self._emit(f"def {self._function_names[decl.name]}({', '.join(parameters)}):")
+        self._indent += 1
+        start = len(self._lines)
+        # Endaufrufe wiederholen den Rumpf in while True, der Rumpf steht vorsorglich eine Ebene tiefer
+        self._indent += 1
+        state.starts[0] = (start, self._indent)
+        body = decl.body.statements if isinstance(decl.body, BlockStatement) else [decl.body]
+        for stmt in body:
+            self._statement(stmt)
+        self._unset(state.scopes[0], state.starts[0])
+        self._indent -= 1
+        if state.tail_loop:
+            self._lines.insert(start, self._line("while True:"))
+            self._emit(_INDENT + "return None")
+        else:
+            self._lines[start:] = [line[len(_INDENT):] for line in self._lines[start:]]
+            if len(self._lines) == start:
+                self._emit("pass")
+        if state.globals_assigned:
+            self._lines.insert(start, self._line(f"global {', '.join(sorted(state.globals_assigned))}"))
+        self._indent -= 1
+
+    # ===== Namen =====
+
+    @staticmethod
+    def _allocate(name: str, taken) -> str:
+        """Freier Python-Name für einen GerLang-Namen"""
+        if not name.isidentifier() or name.startswith("_"):
+            base = "v_" + "".join(char if ("a" + char).isidentifier() else "_" for char in name.lstrip("_"))
+        elif keyword.iskeyword(name) or name in _RESERVED:
+            base = name + "_"
+        else:
+            base = name
+        candidate = base
+        number = 2
+        while candidate in taken or candidate in _RESERVED:
+            candidate = f"{base}_{number}"
+            number += 1
+        taken.add(candidate)
+        return candidate
+
+    def _declare(self, name: str) -> str:
+        """Python-Name einer Deklaration im innersten Scope"""
+        state = self._state
+        scope = state.scopes[-1]
+        if name in scope:
+            return scope[name]
+        if state.decl is None and len(state.scopes) == 1:
+            return self._global_names[name]
+        taken = set(self._module_names)
+        for outer in state.scopes:
+            taken.update(outer.values())
+        scope[name] = self._allocate(name, taken)
+        return scope[name]
+
+    def _lookup(self, name: str) -> Optional[str]:
+        """Python-Name einer lokalen Variable oder None"""
+        state = self._state
+        for scope in reversed(state.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    def _declare_conditional(self, stmt: VariableDeclaration) -> str:
+        """Python-Name einer Deklaration, die nicht immer ausgeführt wird"""
+        state = self._state
+        if stmt.name in state.scopes[-1]:
+            return state.scopes[-1][stmt.name]
+        if state.decl is None and len(state.scopes) == 1:
+            raise TranspileError(f"Bedingte globale Deklaration von '{stmt.name}' wird nicht unterstützt", stmt)
+        if self._lookup(stmt.name) is not None or stmt.name in self._global_names or stmt.name in _BUILTIN_NAMES:
+            raise TranspileError(f"Bedingte Deklaration von '{stmt.name}' verdeckt einen äußeren Namen", stmt)
+        name = self._declare(stmt.name)
+        state.conditional.add(name)
+        return name
+
+    def _enter(self):
+        self._state.scopes.append({})
+        self._state.starts.append((len(self._lines), self._indent))
+
+    def _leave(self):
+        self._unset(self._state.scopes.pop(), self._state.starts.pop())
+
+    def _unset(self, scope: Dict[str, str], start: tuple):
+        """Bedingte Deklarationen eines Scopes am Scope-Anfang auf UNSET setzen"""
+        names = sorted(name for name in scope.values() if name in self._state.conditional)
+        if names:
+            line, indent = start
+            self._lines.insert(line, _INDENT * indent + f"{' = '.join(names)} = _rt.UNSET")
+
+    # ===== Ausgabe =====
+
+    def _line(self, text: str) -> str:
+        return _INDENT * self._indent + text if text else ""
+
+    def _emit(self, text: str):
+        self._lines.append(self._line(text))
+
+    def _block(self, stmt, scoped: bool = True):
+        """Eingerückter Rumpf (eigener Scope bei BlockStatement)"""
+        self._indent += 1
+        start = len(self._lines)
+        if isinstance(stmt, BlockStatement):
+            if scoped:
+                self._enter()
+            for child in stmt.statements:
+                self._statement(child)
+            if scoped:
+                self._leave()
+        elif isinstance(stmt, VariableDeclaration):
+            self._conditional_declaration(stmt)
+        elif stmt is not None:
+            self._statement(stmt)
+        if len(self._lines) == start:
+            self._emit("pass")
+        self._indent -= 1
+
+    def _helper(self, name: str) -> str:
+        self._helpers.add(name)
+        return "_" + name
+
+    # ===== Statements =====
+
+    def _statement(self, stmt):
+        kind = type(stmt)
+        if kind is ExpressionStatement:
+            self._emit(self._value(stmt.expression))
+        elif kind is VariableDeclaration:
+            value = self._value(stmt.initializer) if stmt.initializer is not None else "None"
+            self._emit(f"{self._declare(stmt.name)} = {value}")
+        elif kind is AssignmentStatement:
+            self._assign(stmt.name, stmt.value)
+        elif kind is SetExpression:
+            self._set(stmt)
+        elif kind is PrintStatement:
+            self._emit(f"print(_rt.printable({self._value(stmt.expression)}))")
+        elif kind is BlockStatement:
+            self._emit("if True:")
+            self._block(stmt)
+        elif kind is IfStatement:
+            self._if(stmt)
+        elif kind is WhileStatement:
+            self._emit(f"while {self._condition(stmt.condition)}:")
+            self._state.loop_depth += 1
+            self._block(stmt.body)
+            self._state.loop_depth -= 1
+        elif kind is ForStatement:
+            self._for(stmt)
+        elif kind is ReturnStatement:
+            self._return(stmt)
+        elif kind is TryCatchStatement:
+            self._try(stmt)
+        elif kind is ImportDeclaration:
+            self._emit(f"pass  # HOLE {', '.join(stmt.names)} VON {stmt.module!r} (ohne Wirkung wie im Interpreter)")
+        elif kind is ExportDeclaration or kind is ExportListDeclaration:
+            self._emit("pass  # GIBFREI (ohne Wirkung wie im Interpreter)")
+        else:
+            message = f"Unbekannter Statement-Typ: {kind.__name__}"
+            self._emit(f"{self._helper('fail')}({message!r})")
+
+    def _conditional_declaration(self, stmt: VariableDeclaration):
+        value = self._value(stmt.initializer) if stmt.initializer is not None else "None"
+        self._emit(f"{self._declare_conditional(stmt)} = {value}")
+
+    def _assign(self, name: str, value_expr):
+        value = self._value(value_expr)
+        target = self._lookup(name)
+        if target in self._state.conditional:
+            self._emit(f"{target} = _rt.rebind({target}, {name!r}, {value})")
+            return
+        if target is None and name in self._global_names:
+            target = self._global_names[name]
+            if self._state.decl is not None:
+                self._state.globals_assigned.add(target)
+        if target is None:
+            self._emit(f"_rt.undefined({name!r}, {value})")
+        else:
+            self._emit(f"{target} = {value}")
+
+    def _set(self, stmt: SetExpression):
+        target = stmt.target
+        if isinstance(target, IdentifierExpression):
+            self._assign(target.name, stmt.value)
+        elif isinstance(target, ArrayAccessExpression):
+            array = self._value(target.array)
+            index = self._value(target.index)
+            self._emit(f"{self._helper('set_index')}({array}, {index}, {self._value(stmt.value)})")
+        else:
+            message = "Zuweisung nur an Variablen oder KISTE-Elemente möglich"
+            self._emit(f"{self._helper('fail')}({message!r})")
+
+    def _if(self, stmt: IfStatement):
+        self._emit(f"if {self._condition(stmt.condition)}:")
+        self._block(stmt.then_branch)
+        else_branch = stmt.else_branch
+        while isinstance(else_branch, IfStatement):
+            self._emit(f"elif {self._condition(else_branch.condition)}:")
+            self._block(else_branch.then_branch)
+            else_branch = else_branch.else_branch
+        if else_branch is not None:
+            self._emit("else:")
+            self._block(else_branch)
+
+    def _for(self, stmt: ForStatement):
+        """FÜR als range (Zählschleife, siehe resolver.counted_loop) oder while"""
+        state = self._state
+        self._enter()
+        if stmt.initializer is not None:
+            self._statement(stmt.initializer)
+
+        counted = counted_loop(stmt)
+        if counted is not None and all(self._lookup(identifier.name) for identifier in counted.local_names):
+            counter = self._lookup(counted.name)
+            bound = self._value(counted.bound)
+            comparison = stmt.condition.operator
+            self._emit(f"for {counter} in {self._helper('counter')}({counter}, {bound}, {counted.step}, {comparison!r}):")
+            state.loop_depth += 1
+            self._block(stmt.body)
+            state.loop_depth -= 1
+        else:
+            condition = self._condition(stmt.condition) if stmt.condition is not None else "True"
+            self._emit(f"while {condition}:")
+            state.loop_depth += 1
+            self._indent += 1
+            start = len(self._lines)
+            self._block_statements(stmt.body)
+            if stmt.increment is not None:
+                self._statement(stmt.increment)
+            if len(self._lines) == start:
+                self._emit("pass")
+            self._indent -= 1
+            state.loop_depth -= 1
+
+        self._leave()
+
+    def _block_statements(self, stmt):
+        """Rumpf ohne zusätzliche Einrückung (Schleifenrumpf vor dem Inkrement)"""
+        if isinstance(stmt, BlockStatement):
+            self._enter()
+            for child in stmt.statements:
+                self._statement(child)
+            self._leave()
+        elif isinstance(stmt, VariableDeclaration):
+            self._conditional_declaration(stmt)
+        else:
+            self._statement(stmt)
+
+    def _return(self, stmt: ReturnStatement):
+        state = self._state
+        value = stmt.value
+        if state.decl is not None and state.try_depth == 0 and state.loop_depth == 0 and self._is_tail_call(value):
+            # ZURÜCK f(...) in f: Parameter neu binden und den Rumpf wiederholen
+            parameters = [state.scopes[0][name] for _, name in state.decl.parameters]
+            if parameters:
+                arguments = ", ".join(self._value(arg) for arg in value.arguments)
+                self._emit(f"{', '.join(parameters)} = {arguments}")
+            self._emit("continue")
+            state.tail_loop = True
+            return
+        code = self._value(value) if value is not None else "None"
+        if state.try_depth or state.decl is None:
+            # Wie im Interpreter: FANGE fängt das ZURÜCK (bzw. Fehler außerhalb von Funktionen)
+            self._emit(f"raise _rt.ReturnSignal({code})")
+        else:
+            self._emit(f"return {code}")
+
+    def _is_tail_call(self, value) -> bool:
+        if not (type(value) is CallExpression and getattr(value, "tail_call", False)):
+            return False
+        name = value.function.name
+        return (name not in _BUILTIN_NAMES and self._variable_callee(name) is None
+                and len(value.arguments) == len(self._functions[name].parameters))
+
+    def _try(self, stmt: TryCatchStatement):
+        state = self._state
+        self._emit("try:")
+        state.try_depth += 1
+        self._block(stmt.try_block)
+        state.try_depth -= 1
+        self._emit("except Exception as _fehler:")
+        self._indent += 1
+        self._enter()
+        if stmt.catch_var:
+            self._emit(f"{self._declare(stmt.catch_var)} = _PROGRAMM.message(_fehler)")
+        self._indent -= 1
+        self._block(stmt.catch_block)
+        self._leave()
+
+    # ===== Ausdrücke =====
+
+    def _value(self, expr) -> str:
+        return self._expression(expr)[0]
+
+    def _condition(self, expr) -> str:
+        """Ausdruck in if/while: Pythons Wahrheitswert entspricht is_truthy"""
+        return self._truth(expr)[0]
+
+    def _truth(self, expr) -> tuple:
+        kind = type(expr)
+        if kind is BinaryExpression and expr.operator in ("UND", "ODER"):
+            python, precedence = ("and", _AND) if expr.operator == "UND" else ("or", _OR)
+            left = self._wrap(self._truth(expr.left), precedence)
+            right = self._wrap(self._truth(expr.right), precedence + 1)
+            return f"{left} {python} {right}", precedence
+        if kind is UnaryExpression and expr.operator == "NICHT":
+            return f"not {self._wrap(self._truth(expr.operand), _NOT)}", _NOT
+        return self._expression(expr)
+
+    @staticmethod
+    def _wrap(code_precedence: tuple, minimum: int) -> str:
+        code, precedence = code_precedence
+        return code if precedence >= minimum else f"({code})"
+
+    @staticmethod
+    def _is_bool(expr) -> bool:
+        """Ob expr immer JA oder NEIN liefert"""
+        kind = type(expr)
+        if kind is LiteralExpression:
+            return type(expr.value) is bool
+        if kind is BinaryExpression:
+            return expr.operator in _COMPARISONS or expr.operator in ("UND", "ODER")
+        return kind is UnaryExpression and expr.operator == "NICHT"
+
+    def _expression(self, expr) -> tuple:
+        """(Python-Code, Präzedenz)"""
+        kind = type(expr)
+        if kind is LiteralExpression:
+            value = expr.value
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and value < 0:
+                return repr(value), _UNARY
+            return repr(value), _ATOM
+        if kind is IdentifierExpression:
+            return self._identifier(expr.name), _ATOM
+        if kind is BinaryExpression:
+            return self._binary(expr)
+        if kind is UnaryExpression:
+            operand = self._expression(expr.operand)
+            if expr.operator == "-":
+                return f"-{self._wrap(operand, _UNARY)}", _UNARY
+            if expr.operator == "NICHT":
+                return f"not {self._wrap(self._truth(expr.operand), _NOT)}", _NOT
+            message = f"Unbekannter unärer Operator: {expr.operator}"
+            return f"{self._helper('fail')}({message!r}, {operand[0]})", _ATOM
+        if kind is CallExpression:
+            return self._call(expr), _ATOM
+        if kind is ArrayLiteralExpression:
+            return f"[{', '.join(self._value(element) for element in expr.elements)}]", _ATOM
+        if kind is ArrayAccessExpression:
+            return f"{self._helper('index')}({self._value(expr.array)}, {self._value(expr.index)})", _ATOM
+        if kind is PropertyAccessExpression:
+            target = self._value(expr.object_expr)
+            if expr.property_name == "LÄNGE":
+                return f"{self._helper('length')}({target})", _ATOM
+            message = f"Unbekannte Property: {expr.property_name}"
+            return f"{self._helper('fail')}({message!r}, {target})", _ATOM
+        if kind is MethodCallExpression:
+            arguments = "".join(f", {self._value(arg)}" for arg in expr.arguments)
+            return f"{self._helper('method')}({self._value(expr.object_expr)}, {expr.method_name!r}{arguments})", _ATOM
+        if kind is TemplateStringExpression:
+            return self._template(expr)
+        if kind is SetExpression and isinstance(expr.target, ArrayAccessExpression):
+            target = expr.target
+            return (f"{self._helper('set_index')}({self._value(target.array)}, {self._value(target.index)}, "
+                    f"{self._value(expr.value)})"), _ATOM
+        message = f"Unbekannter Expression-Typ: {kind.__name__}"
+        return f"{self._helper('fail')}({message!r})", _ATOM
+
+    def _identifier(self, name: str) -> str:
+        local = self._lookup(name)
+        if local in self._state.conditional:
+            return f"_rt.defined({local}, {name!r})"
+        if local is not None:
+            return local
+        if name in self._global_names:
+            return self._global_names[name]
+        if name in _BUILTIN_NAMES:
+            return f"_rt.BUILTINS[{name!r}]"
+        return f"_rt.undefined({name!r})"
+
+    def _binary(self, expr: BinaryExpression) -> tuple:
+        operator = expr.operator
+        if operator in ("UND", "ODER"):
+            if self._is_bool(expr.left) and self._is_bool(expr.right):
+                return self._truth(expr)
+            left, right = self._truth(expr.left), self._truth(expr.right)
+            python = "and" if operator == "UND" else "or"
+            return f"bool({left[0]}) {python} bool({right[0]})", (_AND if operator == "UND" else _OR)
+
+        left = self._expression(expr.left)
+        right = self._expression(expr.right)
+        if operator == "/":
+            divisor = expr.right
+            if type(divisor) is LiteralExpression and type(divisor.value) in (int, float) and divisor.value != 0:
+                return f"{self._wrap(left, _PRODUCT)} / {self._wrap(right, _PRODUCT + 1)}", _PRODUCT
+            return f"{self._helper('divide')}({left[0]}, {right[0]})", _ATOM
+        if operator not in _BINARY_OPERATORS:
+            message = f"Unbekannter binärer Operator: {operator}"
+            return f"{self._helper('fail')}({message!r}, {left[0]}, {right[0]})", _ATOM
+        python, precedence = _BINARY_OPERATORS[operator]
+        if precedence == _COMPARE:
+            # Keine Vergleichsketten: a < b < c ist in GerLang (a < b) < c
+            return f"{self._wrap(left, _COMPARE + 1)} {python} {self._wrap(right, _COMPARE + 1)}", _COMPARE
+        return f"{self._wrap(left, precedence)} {python} {self._wrap(right, precedence + 1)}", precedence
+
+    def _call(self, expr: CallExpression) -> str:
+        arguments = [self._value(arg) for arg in expr.arguments]
+        function = expr.function
+        if not isinstance(function, IdentifierExpression):
+            message = "Komplexe Funktionsausdrücke noch nicht unterstützt"
+            return f"{self._helper('fail')}({message!r}{''.join(', ' + arg for arg in arguments)})"
+        name = function.name
+        if name in _BUILTIN_NAMES:
+            # Built-ins haben Vorrang vor gleichnamigen Funktionen
+            self._builtins_used.add(name)
+            return f"_{name}({', '.join(arguments)})"
+
+        variable = self._variable_callee(name)
+        if variable is not None:
+            # Wie im Interpreter: erst die Argumente, dann hat eine aufrufbare
+            # Variable gleichen Namens (z.B. GANZ f = ABS;) Vorrang vor der Funktion
+            packed = f"(_a := ({''.join(arg + ', ' for arg in arguments)}), {variable})[1]"
+            return (f"({self._helper('call_value')}({name!r}, _v, *_a) if callable(_v := {packed}) "
+                    f"else {self._function_call(expr, name, ['*_a'] * bool(arguments), len(arguments))})")
+        return self._function_call(expr, name, arguments, len(arguments))
+
+    def _function_call(self, expr: CallExpression, name: str, arguments: List[str], count: int) -> str:
+        """Aufruf der Funktion name, bzw. Fehler wenn es sie mit count Parametern nicht gibt"""
+        func = self._functions.get(name)
+        line, column = getattr(expr, "line", 1), getattr(expr, "column", 1)
+        if func is None:
+            message = f"Funktion '{name}' nicht gefunden"
+        elif len(func.parameters) != count:
+            message = f"Funktion '{name}' erwartet {len(func.parameters)} Argumente, {count} gegeben"
+        else:
+            self._call_sites.append((line, column))
+            marker = f"{_MARK}{len(self._call_sites) - 1}{_MARK}"
+            return f"{marker}{self._function_names[name]}({', '.join(arguments)})"
+        return f"_PROGRAMM.call_error({message!r}, {line}, {column}{''.join(', ' + arg for arg in arguments)})"
+
+    def _variable_callee(self, name: str) -> Optional[str]:
+        """Python-Ausdruck der Variable name, falls eine sichtbar ist, sonst None"""
+        local = self._lookup(name)
+        if local is not None:
+            return local  # bedingt deklariert: UNSET ist nicht aufrufbar
+        if name in self._global_names:
+            # Vor der Deklaration gibt es den Modul-Namen noch nicht
+            return f"globals().get({self._global_names[name]!r})"
+        return None
+
+    def _template(self, expr: TemplateStringExpression) -> tuple:
+        plan = expr.plan
+        slots = dict(plan.slots)
+        parts = []
+        for index, piece in enumerate(plan.pieces):
+            if piece is None:
+                parts.append(f"{self._helper('text')}({self._value(slots[index])})")
+            else:
+                parts.append(repr(piece))
+        if not parts:
+            return "''", _ATOM
+        if len(parts) == 1:
+            return parts[0], _ATOM
+        return " + ".join(parts), _SUM
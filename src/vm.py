@@ -0,0 +1,381 @@
+# Copyright (c) 2025 KibaOfficial
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""
+Stack-VM für GerLang 4.1.0
+Führt die CodeObjects aus bytecode.py aus (--engine=vm)
+"""
+
+from bytecode import (
+    BytecodeCompiler, BINARY_OPERATORS, BINARY_FUNCTIONS, BINARY_CONST_BITS, BINARY_CONST_MASK,
+    CONST, LOAD_NAME, STORE_NAME, DEFINE_NAME, POP, BINARY, BINARY_CONST, DIVIDE, TRUTHY, NOT,
+    NEGATE, JUMP, JUMP_IF_FALSE, JUMP_IF_TRUE, CALL, TAIL_CALL, BUILD_LIST, INDEX,
+    STORE_INDEX, LENGTH, METHOD, TEMPLATE, PRINT, PUSH_SCOPE, POP_SCOPE,
+    SETUP_TRY, POP_TRY, RETURN, RAISE, LOOP
+)
+from statement_executor import ReturnSignal
+from memo import MISSING
+from expression_evaluator import _TEMPLATE_FORMATTERS
+from call_stack import RuntimeError as GerLangRuntimeError
+from kiste import KISTE_TYPES, SIZED_TYPES, check_element, check_elements, printable
+from governor import ResourceLimitError, locate
+
+
+class VirtualMachine:
+    """Ersetzt StatementExecutor und ExpressionEvaluator (--engine=vm).
+
+    Statements und Funktionen werden beim ersten Ausführen übersetzt und
+    gecacht. Variablen liegen wie im Baum-Interpreter in Environments, der
+    Aufruf benutzerdefinierter Funktionen (Argumentprüfung, Call-Stack,
+    Fehlermeldungen, Endaufrufe) entspricht Interpreter.execute_function,
+    braucht aber keinen Python-Aufruf (siehe run). ZURÜCK ist nur innerhalb
+    von VERSUCHE ein ReturnSignal, sonst ein direkter Rücksprung.
+    """
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.compiler = BytecodeCompiler()
+        self._statements = {}
+        self._expressions = {}
+        self._functions = {}
+
+    def execute(self, stmt):
+        """Führt ein Statement im aktuellen Environment aus"""
+        code = self._statements.get(stmt)
+        if code is None:
+            code = self._statements[stmt] = self.compiler.compile_statement(stmt)
+        self.run(code, self.interpreter.env)
+
+    def evaluate(self, expr):
+        """Evaluiert eine Expression im aktuellen Environment"""
+        code = self._expressions.get(expr)
+        if code is None:
+            code = self._expressions[expr] = self.compiler.compile_expression(expr)
+        return self.run(code, self.interpreter.env)
+
+    def _function_code(self, name, args, line, column):
+        """(Übersetzte Funktion, MemoCache oder None) für einen Aufruf; Fehler
+        wie Interpreter.execute_function"""
+        interpreter = self.interpreter
+        func = interpreter.functions.get(name)
+        if not func:
+            raise GerLangRuntimeError(
+                f"Funktion '{name}' nicht gefunden",
+                interpreter.current_file or "", line, column,
+                interpreter.call_stack.get_stack_trace()
+            )
+        if len(args) != len(func.parameters):
+            raise GerLangRuntimeError(
+                f"Funktion '{name}' erwartet {len(func.parameters)} Argumente, {len(args)} gegeben",
+                interpreter.current_file or "", line, column,
+                interpreter.call_stack.get_stack_trace()
+            )
+        entry = self._functions.get(func)
+        if entry is None:
+            entry = self._functions[func] = (self.compiler.compile_function(func), interpreter.memo_cache(func))
+        return entry
+
+    def run(self, code, env):
+        """Führt ein CodeObject aus.
+
+        Liefert den Rückgabewert (Funktionen) bzw. den Wert einer Expression.
+        Aufrufe benutzerdefinierter Funktionen laufen in derselben Schleife:
+        der Zustand des Aufrufers (Code, pc, Stack, Environment, Handler)
+        wandert auf einen eigenen Frame-Stack, die Rekursionstiefe hängt also
+        nicht von Pythons Stack ab (Grenze: --max-depth). Aufrufe von
+        REIN-Funktionen merken sich dort zusätzlich (MemoCache, Schlüssel),
+        unter dem ihr Ergebnis gespeichert wird. Fehler werden an den
+        innersten FANGE-Handler weitergereicht, ggf. über Aufrufer-Frames
+        hinweg; der Handler stellt Stack und Environment vom Zeitpunkt von
+        VERSUCHE wieder her.
+        """
+        interpreter = self.interpreter
+        is_truthy = interpreter.is_truthy
+        call_stack = interpreter.call_stack
+        max_depth = interpreter.max_depth
+        new_environment = interpreter.new_environment
+        binary_functions = BINARY_FUNCTIONS
+        governor = interpreter.governor
+        if governor is not None:
+            # + und * prüfen die Größe von KISTEN/WORTEN (nur mit max_elements)
+            binary_functions = governor.binary_functions(BINARY_FUNCTIONS, BINARY_OPERATORS)
+        frames = []  # Zustand der Aufrufer: (code, pc, stack, env, handlers, pending)
+        stack = []
+        handlers = []
+        pc = 0
+
+        while True:
+            # (Neu) geladener Frame
+            ops = code.code
+            constants = code.constants
+            names = code.names
+            end = len(ops)
+            push = stack.append
+            pop = stack.pop
+            try:
+                while pc < end:
+                    op = ops[pc]
+                    arg = ops[pc + 1]
+                    pc += 2
+
+                    if op == LOAD_NAME:
+                        push(env.get(names[arg]))
+                    elif op == CONST:
+                        push(constants[arg])
+                    elif op == BINARY_CONST:
+                        stack[-1] = binary_functions[arg & BINARY_CONST_MASK](stack[-1], constants[arg >> BINARY_CONST_BITS])
+                    elif op == JUMP_IF_FALSE:
+                        value = pop()
+                        # Vergleiche liefern bool, is_truthy nur für andere Werte
+                        if value is False or (value is not True and not is_truthy(value)):
+                            pc = arg
+                    elif op == BINARY:
+                        right = pop()
+                        stack[-1] = binary_functions[arg](stack[-1], right)
+                    elif op == LOOP:
+                        if governor is not None:
+                            # Countdown wie Governor.tick, hier ohne Python-Aufruf
+                            governor.countdown -= 1
+                            if governor.countdown <= 0:
+                                governor.checkpoint(code.lines[pc // 2 - 1] or 1, 1)
+                        pc = arg
+                    elif op == JUMP:
+                        pc = arg
+                    elif op == STORE_NAME:
+                        env.assign(names[arg], pop())
+                    elif op == DEFINE_NAME:
+                        env.vars[names[arg]] = pop()
+                    elif op == CALL:
+                        name, argc, line, column = constants[arg]
+                        if argc:
+                            args = stack[-argc:]
+                            del stack[-argc:]
+                        else:
+                            args = []
+                        # Built-in Funktionen (oder aufrufbare Variablen) haben Vorrang
+                        if env.has(name):
+                            func = env.get(name)
+                            if callable(func):
+                                try:
+                                    push(func(*args))
+                                except ResourceLimitError as e:
+                                    # Limits (z.B. NEUE_KISTE) bleiben GL010, an der Aufrufstelle
+                                    raise locate(e, line, column)
+                                except Exception as e:
+                                    raise GerLangRuntimeError(f"Fehler in Built-in Funktion '{name}': {e}")
+                                continue
+                        callee, memo = self._function_code(name, args, line, column)
+                        pending = None
+                        if memo is not None:
+                            # REIN: gleiche Argumente liefern das gespeicherte Ergebnis
+                            key = memo.key(args)
+                            if key is not None:
+                                value = memo.get(key)
+                                if value is not MISSING:
+                                    push(value)
+                                    continue
+                                pending = (memo, key)
+                        if governor is not None:
+                            governor.countdown -= 1
+                            if governor.countdown <= 0:
+                                governor.checkpoint(line, column)
+                        if max_depth is not None and len(call_stack.frames) >= max_depth:
+                            raise interpreter.depth_error(line, column)
+                        call_stack.push(name, interpreter.current_file or "", line, column)
+                        frames.append((code, pc, stack, env, handlers, pending))
+                        code = callee
+                        env = new_environment(interpreter.globals)
+                        env.vars.update(zip(callee.parameters, args))
+                        stack = []
+                        handlers = []
+                        pc = 0
+                        break
+                    elif op == TAIL_CALL:
+                        name, argc, line, column = constants[arg]
+                        if argc:
+                            args = stack[-argc:]
+                            del stack[-argc:]
+                        else:
+                            args = []
+                        # Wie CALL + RETURN, Built-ins haben weiterhin Vorrang
+                        if env.has(name):
+                            func = env.get(name)
+                            if callable(func):
+                                try:
+                                    value = func(*args)
+                                except ResourceLimitError as e:
+                                    # Limits (z.B. NEUE_KISTE) bleiben GL010, an der Aufrufstelle
+                                    raise locate(e, line, column)
+                                except Exception as e:
+                                    raise GerLangRuntimeError(f"Fehler in Built-in Funktion '{name}': {e}")
+                                if not frames:
+                                    return value
+                                call_stack.pop()
+                                code, pc, stack, env, handlers, pending = frames.pop()
+                                if pending is not None:
+                                    pending[0].store(pending[1], value)
+                                stack.append(value)
+                                break
+                        self._function_code(name, args, line, column)
+                        if governor is not None:
+                            governor.countdown -= 1
+                            if governor.countdown <= 0:
+                                governor.checkpoint(line, column)
+                        # Frame wiederverwenden: neue Parameter, Code von vorne
+                        call_stack.reuse()
+                        env = new_environment(interpreter.globals)
+                        env.vars.update(zip(code.parameters, args))
+                        del stack[:]
+                        pc = 0
+                    elif op == RETURN:
+                        value = pop()
+                        if handlers or not code.is_function:
+                            # Wie im Baum-Interpreter: VERSUCHE fängt auch ZURÜCK
+                            raise ReturnSignal(value)
+                        if not frames:
+                            return value
+                        call_stack.pop()
+                        code, pc, stack, env, handlers, pending = frames.pop()
+                        if pending is not None:
+                            pending[0].store(pending[1], value)
+                        stack.append(value)
+                        break
+                    elif op == PUSH_SCOPE:
+                        env = new_environment(env)
+                    elif op == POP_SCOPE:
+                        env = env.parent
+                    elif op == POP:
+                        pop()
+                    elif op == INDEX:
+                        index = pop()
+                        array = stack[-1]
+                        if not isinstance(array, KISTE_TYPES):
+                            raise GerLangRuntimeError("Array-Zugriff nur auf KISTE möglich")
+                        try:
+                            index_int = int(index)
+                            if index_int < 0 or index_int >= len(array):
+                                raise GerLangRuntimeError(f"Array-Index {index_int} außerhalb der Grenzen")
+                            stack[-1] = array[index_int]
+                        except (TypeError, ValueError):
+                            raise GerLangRuntimeError("Array-Index muss eine Zahl sein")
+                    elif op == STORE_INDEX:
+                        value = pop()
+                        index = pop()
+                        array = pop()
+                        if type(array) is not list:
+                            if not isinstance(array, KISTE_TYPES):
+                                raise GerLangRuntimeError("Set-Operation nur auf KISTE möglich")
+                            value = check_element(array, value)
+                        try:
+                            index_int = int(index)
+                            if index_int < 0 or index_int >= len(array):
+                                raise GerLangRuntimeError(f"Array-Index {index_int} außerhalb der Grenzen")
+                            array[index_int] = value
+                        except (TypeError, ValueError):
+                            raise GerLangRuntimeError("Array-Index muss eine Zahl sein")
+                    elif op == DIVIDE:
+                        right = pop()
+                        if right == 0:
+                            raise GerLangRuntimeError("Division durch Null")
+                        stack[-1] = stack[-1] / right
+                    elif op == TRUTHY:
+                        stack[-1] = is_truthy(stack[-1])
+                    elif op == JUMP_IF_TRUE:
+                        if is_truthy(pop()):
+                            pc = arg
+                    elif op == NOT:
+                        stack[-1] = not is_truthy(stack[-1])
+                    elif op == NEGATE:
+                        stack[-1] = -stack[-1]
+                    elif op == LENGTH:
+                        obj = stack[-1]
+                        if not isinstance(obj, SIZED_TYPES):
+                            raise GerLangRuntimeError("LÄNGE nur für KISTE oder WORT verfügbar")
+                        stack[-1] = len(obj)
+                    elif op == TEMPLATE:
+                        pieces, indices = constants[arg]
+                        result = list(pieces)
+                        if indices:
+                            values = stack[-len(indices):]
+                            del stack[-len(indices):]
+                            for index, value in zip(indices, values):
+                                if governor is not None:
+                                    governor.check_shown(value)
+                                formatter = _TEMPLATE_FORMATTERS.get(type(value))
+                                result[index] = formatter(value) if formatter else str(value)
+                        text = "".join(result)
+                        if governor is not None:
+                            governor.check_size(text)
+                        push(text)
+                    elif op == BUILD_LIST:
+                        if arg:
+                            items = stack[-arg:]
+                            del stack[-arg:]
+                            push(items)
+                        else:
+                            push([])
+                    elif op == METHOD:
+                        method_name, argc = constants[arg]
+                        if argc:
+                            args = stack[-argc:]
+                            del stack[-argc:]
+                        else:
+                            args = []
+                        obj = pop()
+                        if not isinstance(obj, KISTE_TYPES):
+                            raise GerLangRuntimeError(f"Methoden-Aufruf nur für KISTE möglich")
+                        if method_name in ("HINZUFÜGEN", "ERWEITERN"):
+                            check_elements(obj, args)
+                        if method_name == "HINZUFÜGEN":
+                            for item in args:
+                                obj.insert(0, item)  # Am Anfang einfügen
+                        elif method_name == "ERWEITERN":
+                            obj.extend(args)  # Am Ende anhängen
+                        else:
+                            raise GerLangRuntimeError(f"Unbekannte Methode für KISTE: {method_name}")
+                        if governor is not None:
+                            governor.check_size(obj)
+                        push(None)
+                    elif op == PRINT:
+                        value = pop()
+                        if governor is not None:
+                            governor.check_shown(value)
+                        print(printable(value))
+                    elif op == SETUP_TRY:
+                        handlers.append((arg, len(stack), env))
+                    elif op == POP_TRY:
+                        handlers.pop()
+                    elif op == RAISE:
+                        raise GerLangRuntimeError(constants[arg])
+                    else:
+                        raise GerLangRuntimeError(f"Unbekannter Opcode: {op}")
+
+                else:
+                    # Ende des Codes: Funktionen ohne ZURÜCK liefern NIX
+                    if code.is_function and frames:
+                        call_stack.pop()
+                        code, pc, stack, env, handlers, pending = frames.pop()
+                        if pending is not None:
+                            pending[0].store(pending[1], None)
+                        stack.append(None)
+                        continue
+                    return stack[-1] if stack else None
+            except Exception as e:
+                if type(e) is ResourceLimitError:
+                    # + und * (binary_functions), Templates, DRUCKE und Methoden
+                    # melden ohne Knoten: Zeile der laufenden Instruktion
+                    locate(e, code.lines[pc // 2 - 1], 1)
+                # Frames ohne FANGE-Handler verlassen (wie ein Python-Aufruf)
+                while not handlers and frames:
+                    call_stack.pop()
+                    code, pc, stack, env, handlers, _ = frames.pop()
+                if not handlers:
+                    raise
+                for listener in interpreter.hooks.listeners["catch"]:
+                    listener(e)
+                # Zum FANGE-Block springen, die Meldung liegt oben auf dem Stack
+                pc, depth, env = handlers.pop()
+                del stack[depth:]
+                stack.append(str(e))